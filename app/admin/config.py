@@ -25,9 +25,11 @@ class AdminConfig:
         from sqladmin.authentication import AuthenticationBackend
         from fastapi import Request, Depends
         from fastapi.responses import RedirectResponse
-        from app.core.utils.security import verify_password
         from app.users.services import user_service
-        from app.core.database.session import get_db
+        from app.core.cache import Principal, principal_cache
+        from app.core.database.session import SessionLocal
+        from app.core.database.transaction import needs_commit
+        from fastapi.concurrency import run_in_threadpool
         
         class AdminAuth(AuthenticationBackend):
             async def login(self, request: Request) -> bool:
@@ -35,11 +37,12 @@ class AdminConfig:
                 username = form.get("username")
                 password = form.get("password")
                 
-                # 세션 생성
-                db = next(get_db())
-                
-                # 사용자 인증
-                user = user_service.authenticate(db, email=username, password=password)
+                # 사용자 인증 (비밀번호 검증은 비밀번호 해싱 풀에서 실행해 이벤트 루프를 막지 않음)
+                with SessionLocal() as db:
+                    user = await user_service.aauthenticate(db, email=username, password=password)
+                    # 로그인 시 다시 해싱한 비밀번호 저장
+                    if needs_commit(db):
+                        await run_in_threadpool(db.commit)
                 
                 # 관리자 권한 확인
                 if user and user_service.is_superuser(user):
@@ -57,17 +60,18 @@ class AdminConfig:
                 if not user_id:
                     return False
                 
-                # 세션 생성
-                db = next(get_db())
-                
-                # 사용자 조회
-                user = user_service.get(db, id=user_id)
+                # 인증 주체 캐시에 없을 때만 사용자 조회
+                principal = principal_cache.get(user_id)
+                if principal is None:
+                    with SessionLocal() as db:
+                        user = await run_in_threadpool(user_service.get, db, user_id)
+                    if not user:
+                        return False
+                    principal = Principal.from_user(user)
+                    principal_cache.set(principal)
                 
                 # 관리자 권한 확인
-                if user and user_service.is_superuser(user):
-                    return True
-                
-                return False
+                return user_service.is_superuser(principal)
         
         return AdminAuth(secret_key=settings.SECRET_KEY)
     
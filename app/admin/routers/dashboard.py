@@ -1,20 +1,39 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.core.cache import Principal, token_revocations
 from app.core.database.deps import get_db
+from app.core.database.instrumentation import get_query_stats, track_iteration
+from app.core.database.pool import get_pool_stats
+from app.core.database.session import SessionLocal
+from app.core.utils.export import ExportFormat, encode_rows, export_headers
+from app.core.utils.passwords import get_password_hash_pool_stats
 from app.core.utils.security import get_current_active_superuser
 from app.users.models.user import User
 from app.users.services import user_service
 
 router = APIRouter()
 
+# 관리자용 사용자 정보 컬럼
+ADMIN_USER_COLUMNS = [
+    "id",
+    "email",
+    "username",
+    "full_name",
+    "is_active",
+    "is_superuser",
+    "created_at",
+    "last_login",
+]
+
 
 @router.get("/dashboard", response_model=Dict[str, Any])
 def get_dashboard_data(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ) -> Any:
     """
     관리자 대시보드 데이터 조회
@@ -37,54 +56,121 @@ def get_dashboard_data(
     }
 
 
+@router.get("/monitoring/pool", response_model=Dict[str, Any])
+def get_pool_monitoring(
+    current_user: Principal = Depends(get_current_active_superuser),
+) -> Any:
+    """
+    데이터베이스 커넥션 풀 상태 조회
+    
+    풀별 사용 중/오버플로/유휴 커넥션 수와 커넥션 획득 시간 히스토그램,
+    체크아웃 시간 초과 횟수를 반환합니다. 값은 현재 워커 프로세스 기준입니다.
+    """
+    return {"pools": get_pool_stats()}
+
+
+@router.get("/monitoring/password-hashing", response_model=Dict[str, Any])
+def get_password_hashing_monitoring(
+    current_user: Principal = Depends(get_current_active_superuser),
+) -> Any:
+    """
+    비밀번호 해싱 풀 상태 조회
+    
+    작업 프로세스 수, 현재/최대 대기 작업 수(pending/peak_pending), 완료 횟수,
+    가득 차서 503으로 거절한 횟수와 평균 처리 시간을 반환합니다. 값은 현재 워커 프로세스 기준입니다.
+    """
+    return get_password_hash_pool_stats()
+
+
+@router.get("/monitoring/token-revocations", response_model=Dict[str, Any])
+def get_token_revocation_monitoring(
+    current_user: Principal = Depends(get_current_active_superuser),
+) -> Any:
+    """
+    토큰 폐기 목록 상태 조회
+    
+    현재 워커 프로세스가 가진 폐기된 토큰/사용자 수와 Redis 구독 동기화 여부(synced)를 반환합니다.
+    """
+    return token_revocations.stats()
+
+
 @router.get("/users", response_model=List[Dict[str, Any]])
 def get_admin_users(
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ) -> Any:
     """
     관리자용 사용자 목록 조회 (상세 정보 포함)
     """
     users = user_service.get_multi(db, skip=skip, limit=limit)
+    return [_admin_user_row(user) for user in users]
+
+
+@router.get("/users/export", response_class=StreamingResponse)
+def export_admin_users(
+    format: ExportFormat = Query(ExportFormat.CSV, description="내보내기 형식"),
+    current_user: Principal = Depends(get_current_active_superuser),
+) -> Any:
+    """
+    관리자용 전체 사용자 내보내기 (NDJSON 또는 CSV)
     
-    result = []
-    for user in users:
-        result.append({
-            "id": user.id,
-            "email": user.email,
-            "username": user.username,
-            "full_name": user.full_name,
-            "is_active": user.is_active,
-            "is_superuser": user.is_superuser,
-            "created_at": user.created_at,
-            "last_login": None,  # 추후 로그인 기록 기능 구현 시 추가
-        })
+    사용자를 묶음 단위로 읽어 바로 전송하므로 사용자 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    # 본문은 엔드포인트가 반환된 뒤 반복되므로 내보내기 쿼리를 요청의 SQL 통계에 직접 연결
+    rows = track_iteration(_stream_admin_users(), get_query_stats())
+    return StreamingResponse(
+        encode_rows(rows, format, ADMIN_USER_COLUMNS),
+        media_type=format.media_type,
+        headers=export_headers("users", format),
+    )
+
+
+def _admin_user_row(user: User) -> Dict[str, Any]:
+    """관리자용 사용자 정보 (상세 정보 포함)"""
+    return {
+        "id": user.id,
+        "email": user.email,
+        "username": user.username,
+        "full_name": user.full_name,
+        "is_active": user.is_active,
+        "is_superuser": user.is_superuser,
+        "created_at": user.created_at,
+        "last_login": None,  # 추후 로그인 기록 기능 구현 시 추가
+    }
+
+
+def _stream_admin_users() -> Iterator[Dict[str, Any]]:
+    """
+    전체 사용자 스트리밍
     
-    return result
+    의존성으로 주입된 세션은 응답 전송 전에 닫히므로 반복이 끝날 때까지 쓸 세션을 직접 엽니다.
+    """
+    db = SessionLocal()
+    try:
+        for user in user_service.stream_multi(db):
+            yield _admin_user_row(user)
+    finally:
+        db.close()
 
 
 @router.post("/users/{user_id}/activate", response_model=Dict[str, Any])
 def activate_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ) -> Any:
     """
     사용자 활성화
     """
-    user = user_service.get(db, id=user_id)
+    user = user_service.update(
+        db, id=user_id, obj_in={"is_active": True}, where={"is_active": False}
+    )
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다.",
-        )
-    
-    if user.is_active:
+        _ensure_user_exists(db, user_id)
         return {"message": "이미 활성화된 사용자입니다.", "user_id": user_id}
     
-    user_service.update(db, id=user_id, obj_in={"is_active": True})
     return {"message": "사용자가 활성화되었습니다.", "user_id": user_id}
 
 
@@ -92,28 +178,24 @@ def activate_user(
 def deactivate_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ) -> Any:
     """
     사용자 비활성화
     """
-    user = user_service.get(db, id=user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다.",
-        )
-    
-    if user.id == current_user.id:
+    if user_id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="자신의 계정은 비활성화할 수 없습니다.",
         )
     
-    if not user.is_active:
+    user = user_service.update(
+        db, id=user_id, obj_in={"is_active": False}, where={"is_active": True}
+    )
+    if not user:
+        _ensure_user_exists(db, user_id)
         return {"message": "이미 비활성화된 사용자입니다.", "user_id": user_id}
     
-    user_service.update(db, id=user_id, obj_in={"is_active": False})
     return {"message": "사용자가 비활성화되었습니다.", "user_id": user_id}
 
 
@@ -121,22 +203,18 @@ def deactivate_user(
 def make_user_admin(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ) -> Any:
     """
     사용자를 관리자로 승격
     """
-    user = user_service.get(db, id=user_id)
+    user = user_service.update(
+        db, id=user_id, obj_in={"is_superuser": True}, where={"is_superuser": False}
+    )
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다.",
-        )
-    
-    if user.is_superuser:
+        _ensure_user_exists(db, user_id)
         return {"message": "이미 관리자 권한을 가진 사용자입니다.", "user_id": user_id}
     
-    user_service.update(db, id=user_id, obj_in={"is_superuser": True})
     return {"message": "사용자가 관리자로 승격되었습니다.", "user_id": user_id}
 
 
@@ -144,26 +222,35 @@ def make_user_admin(
 def remove_user_admin(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ) -> Any:
     """
     사용자의 관리자 권한 제거
     """
-    user = user_service.get(db, id=user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다.",
-        )
-    
-    if user.id == current_user.id:
+    if user_id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="자신의 관리자 권한은 제거할 수 없습니다.",
         )
     
-    if not user.is_superuser:
+    user = user_service.update(
+        db, id=user_id, obj_in={"is_superuser": False}, where={"is_superuser": True}
+    )
+    if not user:
+        _ensure_user_exists(db, user_id)
         return {"message": "관리자 권한이 없는 사용자입니다.", "user_id": user_id}
     
-    user_service.update(db, id=user_id, obj_in={"is_superuser": False})
-    return {"message": "사용자의 관리자 권한이 제거되었습니다.", "user_id": user_id} 
\ No newline at end of file
+    return {"message": "사용자의 관리자 권한이 제거되었습니다.", "user_id": user_id}
+
+
+def _ensure_user_exists(db: Session, user_id: int) -> None:
+    """
+    조건부 갱신이 적용되지 않았을 때 사용자 존재 여부 확인
+    
+    상태가 이미 목표 값인 경우에만 추가 조회가 발생합니다.
+    """
+    if not user_service.get(db, id=user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다.",
+        )
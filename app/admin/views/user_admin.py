@@ -1,9 +1,20 @@
+from typing import Optional as OptionalType
+
+from fastapi.concurrency import run_in_threadpool
 from sqladmin import ModelView
+from sqlalchemy.sql import Select
+from starlette.requests import Request
 from wtforms import PasswordField, BooleanField, StringField
 from wtforms.validators import DataRequired, Email, Optional
 
+from app.core.database.session import engine
 from app.users.models.user import User
-from app.core.utils.security import get_password_hash
+from app.users.repositories import user_repository
+from app.core.utils.counting import CountStrategy
+from app.core.utils.security import ahash_password
+
+# 개수 계산 방식을 바꾸지 않는 목록 쿼리 파라미터 (페이지/정렬)
+_UNFILTERED_LIST_PARAMS = {"page", "pageSize", "sortBy", "sort"}
 
 class UserAdmin(ModelView, model=User):
     """사용자 어드민 뷰"""
@@ -31,6 +42,9 @@ class UserAdmin(ModelView, model=User):
         User.updated_at: "수정일",
     }
     
+    # 검색/필터가 없는 전체 목록의 개수 계산 방식 (페이지 링크에 숫자가 필요하므로 NONE은 사용할 수 없음)
+    count_strategy = CountStrategy.ESTIMATED
+    
     form_columns = [User.email, User.username, User.full_name, User.is_active, User.is_superuser]
     form_overrides = {
         "email": StringField,
@@ -60,8 +74,46 @@ class UserAdmin(ModelView, model=User):
         },
     }
     
-    def on_model_change(self, form, model, is_created):
+    def search_query(self, stmt: Select, term: str) -> Select:
+        """
+        목록 검색
+        
+        기본 ILIKE '%검색어%' 대신 저장소의 검색 조건을 사용해 검색 인덱스
+        (PostgreSQL tsvector/pg_trgm, SQLite FTS5)를 타도록 합니다.
+        방언은 엔진에서 읽으므로 세션을 열지 않습니다.
+        """
+        return stmt.where(user_repository.search_condition(engine, term.strip()))
+    
+    async def on_model_change(self, data, model, is_created, request):
         """모델 변경 시 처리"""
-        # 비밀번호 해싱
+        # 비밀번호 해싱 (비밀번호 해싱 풀에서 실행)
         if is_created:
-            model.hashed_password = get_password_hash("password")  # 기본 비밀번호 설정 
\ No newline at end of file
+            model.hashed_password = await ahash_password("password")  # 기본 비밀번호 설정
+    
+    async def after_model_change(self, data, model, is_created, request):
+        """모델 변경 후 처리 (어드민 폼 변경은 저장소를 거치지 않으므로 캐시 직접 무효화)"""
+        if not is_created:
+            user_repository.invalidate_cached(model.id)
+            if not model.is_active:
+                user_repository.revoke_tokens(None, model.id)
+    
+    async def after_model_delete(self, model, request):
+        """모델 삭제 후 처리"""
+        user_repository.invalidate_cached(model.id)
+        user_repository.revoke_tokens(None, model.id)
+    
+    async def count(self, request: Request, stmt: OptionalType[Select] = None) -> int:
+        """
+        목록 전체 개수 조회
+        
+        검색어나 필터가 없으면 페이지마다 COUNT(*)를 실행하지 않고
+        count_strategy(추정치/캐시)로 계산합니다.
+        """
+        if self.is_async or set(request.query_params) - _UNFILTERED_LIST_PARAMS:
+            return await super().count(request, stmt)
+        return await run_in_threadpool(self._count_all)
+    
+    def _count_all(self) -> int:
+        """설정된 방식으로 전체 사용자 수 계산"""
+        with self.session_maker() as session:
+            return user_repository.get_count(session, strategy=self.count_strategy)
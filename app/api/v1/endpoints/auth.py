@@ -1,11 +1,12 @@
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database.deps import get_db
+from app.core.utils.security import oauth2_scheme, revoke_access_token
 from app.users.schemas.user import User, UserCreate, Token
 from app.users.services import user_service
 
@@ -13,13 +14,13 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=Token)
-def login_access_token(
+async def login_access_token(
     db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 호환 토큰 로그인, 액세스 토큰 발급
     """
-    user = user_service.authenticate(
+    user = await user_service.aauthenticate(
         db, email=form_data.username, password=form_data.password
     )
     if not user:
@@ -36,8 +37,16 @@ def login_access_token(
     return user_service.create_access_token(user.id)
 
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(request: Request, token: str = Depends(oauth2_scheme)) -> None:
+    """
+    로그아웃, 현재 액세스 토큰 폐기 (모든 워커에서 거부)
+    """
+    revoke_access_token(token, request)
+
+
 @router.post("/register", response_model=User)
-def register(
+async def register(
     *,
     db: Session = Depends(get_db),
     user_in: UserCreate,
@@ -52,7 +61,7 @@ def register(
         )
     
     try:
-        user = user_service.create(db, obj_in=user_in)
+        user = await user_service.acreate(db, obj_in=user_in)
         return user
     except HTTPException as e:
         raise e
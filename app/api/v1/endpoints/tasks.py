@@ -1,15 +1,29 @@
+import time
 from typing import Any, Dict
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from pydantic import BaseModel
 
+from app.core.cache import Principal
+from app.core.observability import celery_enqueue_errors_total, celery_enqueue_seconds
 from app.core.tasks import example_task, process_data, cleanup
 from app.core.utils.security import get_current_active_user
-from app.users.models.user import User
 
 router = APIRouter()
 
 
+def _enqueue(task: Any, *args: Any) -> Any:
+    """태스크를 브로커에 보내고 걸린 시간과 실패 수를 메트릭에 기록"""
+    start_time = time.perf_counter()
+    try:
+        return task.delay(*args)
+    except Exception:
+        celery_enqueue_errors_total.inc(task.name)
+        raise
+    finally:
+        celery_enqueue_seconds.observe(time.perf_counter() - start_time, task.name)
+
+
 class TaskRequest(BaseModel):
     """태스크 요청 모델"""
     word: str
@@ -29,13 +43,13 @@ class TaskResponse(BaseModel):
 @router.post("/example", response_model=TaskResponse)
 def run_example_task(
     request: TaskRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> Any:
     """
     예제 태스크 실행
     """
     try:
-        task = example_task.delay(request.word)
+        task = _enqueue(example_task, request.word)
         return {
             "task_id": task.id,
             "message": f"태스크가 성공적으로 시작되었습니다. 태스크 ID: {task.id}"
@@ -50,13 +64,13 @@ def run_example_task(
 @router.post("/process-data", response_model=TaskResponse)
 def run_process_data_task(
     request: DataProcessRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> Any:
     """
     데이터 처리 태스크 실행
     """
     try:
-        task = process_data.delay(request.data)
+        task = _enqueue(process_data, request.data)
         return {
             "task_id": task.id,
             "message": f"데이터 처리 태스크가 성공적으로 시작되었습니다. 태스크 ID: {task.id}"
@@ -70,13 +84,13 @@ def run_process_data_task(
 
 @router.post("/cleanup", response_model=TaskResponse)
 def run_cleanup_task(
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> Any:
     """
     정리 작업 태스크 실행
     """
     try:
-        task = cleanup.delay()
+        task = _enqueue(cleanup)
         return {
             "task_id": task.id,
             "message": f"정리 작업 태스크가 성공적으로 시작되었습니다. 태스크 ID: {task.id}"
@@ -91,7 +105,7 @@ def run_cleanup_task(
 @router.get("/status/{task_id}", response_model=Dict[str, Any])
 def get_task_status(
     task_id: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> Any:
     """
     태스크 상태 확인
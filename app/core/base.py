@@ -32,6 +32,7 @@ class PaginatedResponse(BaseResponse):
     page: int = 1
     size: int = 10
     items: List[Any] = []
+    next_cursor: Optional[str] = None
 
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
@@ -0,0 +1,23 @@
+from app.core.cache.backends import LocalTTLCache, RedisCache
+from app.core.cache.entity import EntityCache, build_entity_cache, get_cache_stats
+from app.core.cache.principal import (
+    Principal,
+    PrincipalCache,
+    principal_cache,
+    supabase_principal_cache,
+)
+from app.core.cache.revocation import TokenRevocationStore, token_revocations
+
+__all__ = [
+    "LocalTTLCache",
+    "RedisCache",
+    "EntityCache",
+    "build_entity_cache",
+    "get_cache_stats",
+    "Principal",
+    "PrincipalCache",
+    "principal_cache",
+    "supabase_principal_cache",
+    "TokenRevocationStore",
+    "token_revocations",
+]
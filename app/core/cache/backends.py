@@ -0,0 +1,191 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+logger = logging.getLogger(__name__)
+
+# 값이 없음을 나타내는 표식 (None도 캐시할 수 있도록 구분)
+MISSING = object()
+
+
+class LocalTTLCache:
+    """
+    프로세스 내 TTL + LRU 캐시
+
+    스레드풀에서 실행되는 동기 저장소에서도 안전하도록 잠금을 사용합니다.
+    """
+    def __init__(self, *, maxsize: int, ttl: float):
+        """
+        캐시 초기화
+
+        Args:
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+            ttl: 항목 유효 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """
+        항목 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 값 또는 MISSING
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        항목 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 항목 유효 시간 (기본값: 캐시 TTL)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        """
+        항목 삭제
+
+        Args:
+            keys: 삭제할 캐시 키 목록
+        """
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache:
+    """
+    Redis 기반 공유 캐시
+
+    값은 JSON으로 저장하며, Redis 장애 시 예외 대신 캐시 미스로 처리해
+    요청이 데이터베이스로 넘어가도록 합니다. 장애가 발생하면 retry_after 동안
+    Redis 호출을 건너뛰어 요청마다 연결 시간 초과를 기다리지 않도록 합니다.
+    """
+    def __init__(
+        self, url: str, *, ttl: int, socket_timeout: float = 0.2, retry_after: float = 5.0
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            url: Redis 연결 URL
+            ttl: 항목 유효 시간 (초)
+            socket_timeout: Redis 응답 대기 시간 (초)
+            retry_after: 장애 발생 후 Redis 호출을 다시 시도하기까지의 시간 (초)
+        """
+        self.url = url
+        self.ttl = ttl
+        self.socket_timeout = socket_timeout
+        self.retry_after = retry_after
+        self._client = None
+        self._disabled_until = 0.0
+
+    @property
+    def client(self) -> Any:
+        """지연 생성되는 Redis 클라이언트"""
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(
+                self.url,
+                socket_timeout=self.socket_timeout,
+                socket_connect_timeout=self.socket_timeout,
+            )
+        return self._client
+
+    @property
+    def available(self) -> bool:
+        """최근 장애로 호출을 건너뛰는 중인지 여부"""
+        return time.monotonic() >= self._disabled_until
+
+    def _on_error(self, action: str, error: Exception) -> None:
+        self._disabled_until = time.monotonic() + self.retry_after
+        logger.warning(f"Redis 캐시 {action} 실패 ({self.retry_after}초간 건너뜀): {error}")
+
+    def get(self, key: str) -> Any:
+        """
+        항목 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 값 또는 MISSING
+        """
+        if not self.available:
+            return MISSING
+        try:
+            raw = self.client.get(key)
+        except Exception as e:
+            self._on_error("조회", e)
+            return MISSING
+        if raw is None:
+            return MISSING
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        항목 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값 (JSON 직렬화 가능한 값)
+            ttl: 항목 유효 시간 (기본값: 캐시 TTL)
+        """
+        if not self.available:
+            return
+        raw = json.dumps(jsonable_encoder(value), separators=(",", ":"))
+        try:
+            self.client.set(key, raw, ex=self.ttl if ttl is None else ttl)
+        except Exception as e:
+            self._on_error("저장", e)
+
+    def delete(self, *keys: str) -> None:
+        """
+        항목 삭제
+
+        Args:
+            keys: 삭제할 캐시 키 목록
+        """
+        if not keys:
+            return
+        try:
+            self.client.delete(*keys)
+        except Exception as e:
+            self._on_error("삭제", e)
@@ -0,0 +1,193 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+from app.core.cache.backends import MISSING, LocalTTLCache, RedisCache
+from app.core.config import settings
+
+# 생성된 엔티티 캐시 목록 (통계 조회용)
+_registry: Dict[str, "EntityCache"] = {}
+
+
+class EntityCache:
+    """
+    엔티티 읽기 캐시
+
+    모델 + ID를 키로 행 데이터를 저장하는 2단계 캐시입니다.
+    프로세스 내 L1(TTL + LRU)을 먼저 조회하고, 없으면 Redis L2를 조회합니다.
+    필드 값 조회(get_by_field)는 필드 값 -> ID 색인을 거쳐 엔티티를 찾으며,
+    색인은 조회 시 실제 값과 비교해 검증하므로 갱신 시 엔티티 키만 무효화하면 됩니다.
+    """
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        local: Optional[LocalTTLCache] = None,
+        remote: Optional[RedisCache] = None,
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            namespace: 캐시 키 접두사 (보통 테이블 이름)
+            local: 프로세스 내 L1 캐시
+            remote: Redis L2 캐시
+        """
+        self.namespace = namespace
+        self.local = local
+        self.remote = remote
+        self.local_hits = 0
+        self.remote_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _entity_key(self, id: Any) -> str:
+        return f"entity:{self.namespace}:id:{id}"
+
+    def _field_key(self, field_name: str, value: Any) -> str:
+        return f"entity:{self.namespace}:{field_name}:{value}"
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _lookup(self, key: str) -> Any:
+        """L1 -> L2 순서로 조회하고, L2에서 찾은 값은 L1에 채워 넣음"""
+        if self.local is not None:
+            value = self.local.get(key)
+            if value is not MISSING:
+                return value, "local_hits"
+        if self.remote is not None:
+            value = self.remote.get(key)
+            if value is not MISSING:
+                if self.local is not None:
+                    self.local.set(key, value)
+                return value, "remote_hits"
+        return MISSING, "misses"
+
+    def _store(self, key: str, value: Any) -> None:
+        if self.local is not None:
+            self.local.set(key, value)
+        if self.remote is not None:
+            self.remote.set(key, value)
+
+    def get(self, id: Any) -> Optional[Dict[str, Any]]:
+        """
+        ID로 캐시된 엔티티 조회
+
+        Args:
+            id: 항목 ID
+
+        Returns:
+            컬럼 이름과 값의 딕셔너리 또는 None (캐시 미스)
+        """
+        data, counter = self._lookup(self._entity_key(id))
+        self._count(counter)
+        return None if data is MISSING else data
+
+    def get_by_field(self, field_name: str, value: Any) -> Optional[Dict[str, Any]]:
+        """
+        필드 값으로 캐시된 엔티티 조회
+
+        Args:
+            field_name: 필드 이름
+            value: 필드 값
+
+        Returns:
+            컬럼 이름과 값의 딕셔너리 또는 None (캐시 미스)
+        """
+        field_key = self._field_key(field_name, value)
+        id, _ = self._lookup(field_key)
+        if id is MISSING:
+            self._count("misses")
+            return None
+        data, counter = self._lookup(self._entity_key(id))
+        if data is MISSING or data.get(field_name) != value:
+            # 엔티티가 무효화되었거나 필드 값이 바뀐 경우 색인도 버림
+            self._delete(field_key)
+            self._count("misses")
+            return None
+        self._count(counter)
+        return data
+
+    def set(self, id: Any, data: Dict[str, Any], *, fields: Optional[List[str]] = None) -> None:
+        """
+        엔티티 저장
+
+        Args:
+            id: 항목 ID
+            data: 컬럼 이름과 값의 딕셔너리
+            fields: 함께 색인할 필드 이름 목록
+        """
+        self._store(self._entity_key(id), data)
+        for field_name in fields or []:
+            if data.get(field_name) is not None:
+                self._store(self._field_key(field_name, data[field_name]), id)
+
+    def _delete(self, *keys: str) -> None:
+        if self.local is not None:
+            self.local.delete(*keys)
+        if self.remote is not None:
+            self.remote.delete(*keys)
+
+    def invalidate(self, *ids: Any) -> None:
+        """
+        엔티티 무효화
+
+        Args:
+            ids: 무효화할 항목 ID 목록
+        """
+        self._delete(*(self._entity_key(id) for id in ids))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중 통계 조회
+
+        Returns:
+            L1/L2 적중 수, 미스 수와 적중률
+        """
+        hits = self.local_hits + self.remote_hits
+        total = hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "local_hits": self.local_hits,
+            "remote_hits": self.remote_hits,
+            "misses": self.misses,
+            "hit_ratio": hits / total if total else 0.0,
+            "local_size": len(self.local) if self.local is not None else 0,
+        }
+
+
+def build_entity_cache(namespace: str) -> Optional[EntityCache]:
+    """
+    설정에 맞는 엔티티 캐시 생성
+
+    CACHE_ENABLED가 꺼져 있으면 None을 반환하며, CACHE_REDIS_URL이 없으면
+    프로세스 내 L1 캐시만 사용합니다.
+
+    Args:
+        namespace: 캐시 키 접두사 (보통 테이블 이름)
+
+    Returns:
+        엔티티 캐시 또는 None
+    """
+    if not settings.CACHE_ENABLED:
+        return None
+    local = LocalTTLCache(
+        maxsize=settings.CACHE_LOCAL_MAXSIZE, ttl=settings.CACHE_LOCAL_TTL_SECONDS
+    )
+    remote = None
+    if settings.CACHE_REDIS_URL:
+        remote = RedisCache(settings.CACHE_REDIS_URL, ttl=settings.CACHE_TTL_SECONDS)
+    cache = EntityCache(namespace, local=local, remote=remote)
+    _registry[namespace] = cache
+    return cache
+
+
+def get_cache_stats() -> List[Dict[str, Any]]:
+    """
+    생성된 모든 엔티티 캐시의 통계 조회
+
+    Returns:
+        캐시별 통계 목록
+    """
+    return [cache.stats() for cache in _registry.values()]
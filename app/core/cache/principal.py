@@ -0,0 +1,146 @@
+import threading
+from typing import Any, Dict, Optional
+
+from app.core.cache.backends import MISSING, LocalTTLCache
+from app.core.config import settings
+
+# 인증 주체 캐시
+#
+# 인증 의존성은 요청마다 토큰의 sub로 사용자 행 전체를 조회하지만, 권한 확인에는
+# ID와 활성/관리자 여부만 필요합니다. 이 값만 담은 Principal을 짧은 TTL로 프로세스 내에
+# 캐시해 대부분의 요청은 데이터베이스/PostgREST 왕복 없이 인증합니다.
+# 사용자 저장소가 사용자를 변경/삭제하면 즉시 무효화되며, 다른 워커 프로세스에서의 변경은
+# 최대 PRINCIPAL_CACHE_TTL_SECONDS 뒤에 반영됩니다.
+
+
+class Principal:
+    """인증된 사용자의 권한 확인용 요약 정보"""
+    __slots__ = ("id", "is_active", "is_superuser")
+
+    def __init__(self, id: Any, is_active: bool, is_superuser: bool):
+        """
+        요약 정보 초기화
+
+        Args:
+            id: 사용자 ID
+            is_active: 활성화 여부
+            is_superuser: 관리자 여부
+        """
+        self.id = id
+        self.is_active = is_active
+        self.is_superuser = is_superuser
+
+    @classmethod
+    def from_user(cls, user: Any) -> "Principal":
+        """
+        사용자 모델 객체 또는 딕셔너리(Supabase)에서 생성
+
+        Args:
+            user: 사용자
+
+        Returns:
+            요약 정보
+        """
+        if isinstance(user, dict):
+            return cls(user["id"], bool(user.get("is_active")), bool(user.get("is_superuser")))
+        return cls(user.id, bool(user.is_active), bool(user.is_superuser))
+
+    def __repr__(self) -> str:
+        return (
+            f"Principal(id={self.id!r}, is_active={self.is_active!r}, "
+            f"is_superuser={self.is_superuser!r})"
+        )
+
+
+class PrincipalCache:
+    """
+    토큰 sub(사용자 ID)를 키로 Principal을 저장하는 프로세스 내 캐시
+
+    ttl이 0이면 캐시하지 않습니다.
+    """
+    def __init__(self, namespace: str, *, maxsize: int, ttl: float):
+        """
+        캐시 초기화
+
+        Args:
+            namespace: 통계에 표시할 이름
+            maxsize: 최대 항목 수
+            ttl: 항목 유효 시간 (초)
+        """
+        self.namespace = namespace
+        self.local = LocalTTLCache(maxsize=maxsize, ttl=ttl) if ttl > 0 else None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, id: Any) -> Optional[Principal]:
+        """
+        캐시된 Principal 조회
+
+        Args:
+            id: 사용자 ID (토큰의 sub)
+
+        Returns:
+            Principal 또는 None (캐시 미스)
+        """
+        if self.local is None:
+            return None
+        principal = self.local.get(str(id))
+        if principal is MISSING:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return principal
+
+    def set(self, principal: Principal) -> None:
+        """
+        Principal 저장
+
+        Args:
+            principal: 저장할 요약 정보
+        """
+        if self.local is not None:
+            self.local.set(str(principal.id), principal)
+
+    def invalidate(self, *ids: Any) -> None:
+        """
+        Principal 무효화
+
+        Args:
+            ids: 변경/삭제된 사용자 ID 목록
+        """
+        if self.local is not None and ids:
+            self.local.delete(*(str(id) for id in ids))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중 통계 조회
+
+        Returns:
+            적중/미스 수와 적중률
+        """
+        total = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "local_size": len(self.local) if self.local is not None else 0,
+        }
+
+
+def _build_principal_cache(namespace: str) -> PrincipalCache:
+    return PrincipalCache(
+        namespace,
+        maxsize=settings.PRINCIPAL_CACHE_MAXSIZE,
+        ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    )
+
+
+# SQLAlchemy 사용자와 Supabase 사용자는 ID 공간이 다르므로 캐시를 나눔
+principal_cache = _build_principal_cache("principals")
+supabase_principal_cache = _build_principal_cache("supabase_principals")
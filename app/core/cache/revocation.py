@@ -0,0 +1,214 @@
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 토큰 폐기 목록
+#
+# 로그아웃한 토큰(jti)과 비활성화/삭제된 사용자(해당 시각 이전에 발급된 토큰 전체)를
+# Redis에 기록하고 pub/sub으로 모든 워커에 알립니다. 각 워커는 프로세스 내 사본을 유지하므로
+# 요청마다 하는 폐기 확인은 네트워크 왕복 없는 딕셔너리 조회입니다.
+# 구독 연결이 끊기면 1초 간격으로 다시 연결하고, 연결되면 Redis 전체 목록을 다시 읽어
+# 끊긴 동안의 변경을 반영합니다. Redis URL이 없으면 현재 프로세스에만 적용됩니다.
+
+# Redis 키 접두사와 알림 채널
+JTI_KEY_PREFIX = "revoked:jti:"
+USER_KEY_PREFIX = "revoked:user:"
+CHANNEL = "token-revocations"
+
+# 만료된 항목을 정리하는 간격 (초)
+PRUNE_INTERVAL_SECONDS = 60
+# 구독이 끊겼을 때 다시 연결하기까지의 대기 시간 (초)
+RECONNECT_SECONDS = 1.0
+
+
+class TokenRevocationStore:
+    """
+    jti/사용자 단위 토큰 폐기 목록
+
+    - jti: 토큰의 exp까지 보관
+    - 사용자: 폐기 시각 이전에 발급된(iat) 모든 토큰을 토큰 최대 수명 동안 거부
+    """
+    def __init__(self, redis_url: Optional[str], *, token_lifetime: int):
+        """
+        폐기 목록 초기화
+
+        Args:
+            redis_url: Redis 연결 URL (None이면 프로세스 내에서만 적용)
+            token_lifetime: 액세스 토큰 최대 수명 (초, 사용자 단위 폐기 보관 기간)
+        """
+        self.redis_url = redis_url
+        self.token_lifetime = token_lifetime
+        # jti -> 만료 시각(epoch 초)
+        self._jtis: Dict[str, float] = {}
+        # 사용자 ID(문자열) -> 이 시각 이전에 발급된 토큰 거부
+        self._users: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._next_prune = time.time() + PRUNE_INTERVAL_SECONDS
+        self._client = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self.synced = redis_url is None
+
+    @property
+    def client(self) -> Any:
+        """지연 생성되는 Redis 클라이언트"""
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(
+                self.redis_url, socket_timeout=1.0, socket_connect_timeout=1.0
+            )
+        return self._client
+
+    def is_revoked(self, claims: Mapping[str, Any]) -> bool:
+        """
+        토큰 폐기 여부 확인 (프로세스 내 조회만 수행)
+
+        Args:
+            claims: 검증된 토큰 클레임
+
+        Returns:
+            폐기 여부
+        """
+        jti = claims.get("jti")
+        if jti is not None and jti in self._jtis:
+            return True
+        revoked_before = self._users.get(str(claims.get("sub")))
+        return revoked_before is not None and claims.get("iat", 0) <= revoked_before
+
+    def revoke_token(self, jti: str, exp: float) -> None:
+        """
+        토큰 하나 폐기 (로그아웃)
+
+        Args:
+            jti: 토큰 ID
+            exp: 토큰 만료 시각 (epoch 초)
+        """
+        ttl = int(exp - time.time()) + 1
+        if ttl <= 0:
+            return
+        self._apply({"jti": jti, "exp": exp})
+        self._publish(JTI_KEY_PREFIX + jti, exp, ttl, {"jti": jti, "exp": exp})
+
+    def revoke_user(self, user_id: Any) -> None:
+        """
+        사용자에게 지금까지 발급된 모든 토큰 폐기 (비활성화/삭제)
+
+        Args:
+            user_id: 사용자 ID
+        """
+        before = int(time.time())
+        message = {"user_id": str(user_id), "before": before}
+        self._apply(message)
+        self._publish(USER_KEY_PREFIX + str(user_id), before, self.token_lifetime, message)
+
+    def _apply(self, message: Mapping[str, Any]) -> None:
+        """폐기 항목을 프로세스 내 사본에 반영"""
+        with self._lock:
+            if "jti" in message:
+                self._jtis[message["jti"]] = float(message["exp"])
+            else:
+                user_id = message["user_id"]
+                self._users[user_id] = max(self._users.get(user_id, 0), float(message["before"]))
+            if time.time() >= self._next_prune:
+                self._prune()
+
+    def _prune(self) -> None:
+        """만료된 항목 정리 (잠금을 잡은 상태에서 호출)"""
+        now = time.time()
+        self._jtis = {jti: exp for jti, exp in self._jtis.items() if exp > now}
+        oldest = now - self.token_lifetime
+        self._users = {user_id: ts for user_id, ts in self._users.items() if ts > oldest}
+        self._next_prune = now + PRUNE_INTERVAL_SECONDS
+
+    def _publish(self, key: str, value: float, ttl: int, message: Dict[str, Any]) -> None:
+        """Redis에 폐기 항목을 저장하고 다른 워커에 알림"""
+        if self.redis_url is None:
+            return
+        try:
+            pipe = self.client.pipeline()
+            pipe.set(key, value, ex=ttl)
+            pipe.publish(CHANNEL, json.dumps(message))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"토큰 폐기 Redis 기록 실패 (현재 프로세스에만 적용): {e}")
+
+    def _load_snapshot(self) -> None:
+        """Redis의 전체 폐기 목록을 읽어 프로세스 내 사본에 반영"""
+        for prefix, field, value_field in (
+            (JTI_KEY_PREFIX, "jti", "exp"),
+            (USER_KEY_PREFIX, "user_id", "before"),
+        ):
+            keys = list(self.client.scan_iter(match=prefix + "*", count=1000))
+            if not keys:
+                continue
+            for key, value in zip(keys, self.client.mget(keys)):
+                if value is not None:
+                    name = key.decode()[len(prefix):]
+                    self._apply({field: name, value_field: float(value)})
+
+    def _listen(self) -> None:
+        """pub/sub 구독 (끊기면 다시 연결하고 전체 목록을 다시 읽음)"""
+        while not self._stopping.is_set():
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(CHANNEL)
+                # 구독한 뒤에 전체 목록을 읽어 그 사이의 변경을 놓치지 않음
+                self._load_snapshot()
+                self.synced = True
+                while not self._stopping.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None and message["type"] == "message":
+                        self._apply(json.loads(message["data"]))
+            except Exception as e:
+                self.synced = False
+                logger.warning(f"토큰 폐기 목록 구독 실패 ({RECONNECT_SECONDS}초 후 재시도): {e}")
+                self._stopping.wait(RECONNECT_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def start(self) -> None:
+        """다른 워커의 폐기 알림 구독 시작 (Redis URL이 없으면 아무것도 하지 않음)"""
+        if self.redis_url is None or self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._listen, name="token-revocations", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """구독 중지"""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        폐기 목록 상태 조회
+
+        Returns:
+            프로세스 내 jti/사용자 항목 수와 Redis 동기화 여부
+        """
+        return {
+            "revoked_tokens": len(self._jtis),
+            "revoked_users": len(self._users),
+            "redis": self.redis_url is not None,
+            "synced": self.synced,
+        }
+
+
+token_revocations = TokenRevocationStore(
+    settings.TOKEN_REVOCATION_REDIS_URL,
+    token_lifetime=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
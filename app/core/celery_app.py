@@ -1,5 +1,7 @@
 from celery import Celery
+from celery.signals import setup_logging as celery_setup_logging
 from app.core.config import settings
+from app.core.observability import setup_logging
 import os
 
 # 환경 변수에서 직접 가져오기
@@ -27,6 +29,11 @@ celery_app.conf.update(
     task_track_started=True,
 )
 
+# 워커 로깅 설정 (Celery 기본 로깅 대신 큐 기반 비차단 로깅 사용)
+@celery_setup_logging.connect
+def configure_worker_logging(**kwargs):
+    setup_logging()
+
 # 태스크 라우팅 설정
 celery_app.conf.task_routes = {
     "app.core.tasks.*": {"queue": "default"},
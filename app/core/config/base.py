@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+from typing import List, Literal, Optional
 import os
 import secrets
 
@@ -27,6 +27,88 @@ class BaseAppSettings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY", secrets.token_urlsafe(32))
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "11520"))  # 8일
+    TOKEN_CACHE_MAXSIZE: int = int(os.getenv("TOKEN_CACHE_MAXSIZE", "10000"))  # 검증한 토큰 클레임 LRU 크기 (0이면 매번 검증)
+    TOKEN_CACHE_MAX_TTL_SECONDS: int = int(os.getenv("TOKEN_CACHE_MAX_TTL_SECONDS", "300"))
+    
+    # 비동기 데이터베이스 설정 (미지정 시 DATABASE_URL에서 드라이버만 바꿔 사용)
+    ASYNC_DATABASE_URL: Optional[str] = os.getenv("ASYNC_DATABASE_URL", None)
+    
+    # 읽기 복제본 설정 (쉼표로 구분, 지정 시 조회는 복제본으로 보냄)
+    DATABASE_REPLICA_URLS: str = os.getenv("DATABASE_REPLICA_URLS", "")
+    DB_REPLICA_STICKY_SECONDS: int = int(os.getenv("DB_REPLICA_STICKY_SECONDS", "5"))  # 쓰기 후 다음 요청들도 주 데이터베이스에서 읽는 시간
+    
+    # 커넥션 풀 설정 (DB_POOL_SIZE개를 유지하고 최대 DB_MAX_OVERFLOW개까지 추가로 연결)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # 커넥션을 기다리는 최대 시간 (초)
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 이 시간(초)보다 오래된 커넥션은 다시 연결
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
+    DB_POOL_WARMUP: bool = os.getenv("DB_POOL_WARMUP", "False").lower() == "true"  # 시작 시 풀 미리 채우기
+    
+    # SQL 추적 설정 (요청별 쿼리 수, 느린 쿼리 로그, N+1 의심 경고)
+    DB_SLOW_QUERY_MS: float = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+    DB_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "5"))  # 같은 문장이 이 횟수 이상 실행되면 경고
+    
+    # 대량 작업 설정 (한 번의 INSERT/DELETE 문에 묶을 최대 행 수)
+    DB_BULK_BATCH_SIZE: int = int(os.getenv("DB_BULK_BATCH_SIZE", "1000"))
+    
+    # 스트리밍 조회 설정 (내보내기 시 한 번에 가져올 행 수)
+    DB_STREAM_BATCH_SIZE: int = int(os.getenv("DB_STREAM_BATCH_SIZE", "1000"))
+    
+    # 엔티티 캐시 설정 (CACHE_REDIS_URL 미지정 시 프로세스 내 캐시만 사용)
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "True").lower() == "true"
+    CACHE_TTL_SECONDS: int = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+    CACHE_LOCAL_TTL_SECONDS: int = int(os.getenv("CACHE_LOCAL_TTL_SECONDS", "5"))  # 다른 프로세스의 변경이 늦게 보이는 최대 시간
+    CACHE_LOCAL_MAXSIZE: int = int(os.getenv("CACHE_LOCAL_MAXSIZE", "10000"))
+    CACHE_REDIS_URL: Optional[str] = os.getenv("CACHE_REDIS_URL", None)
+    
+    # 인증 주체 캐시 설정 (토큰 sub별 ID/활성/관리자 여부, 0이면 캐시하지 않음)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "10"))  # 다른 프로세스의 권한 변경이 늦게 보이는 최대 시간
+    PRINCIPAL_CACHE_MAXSIZE: int = int(os.getenv("PRINCIPAL_CACHE_MAXSIZE", "10000"))
+
+    # 토큰 폐기 설정 (로그아웃/비활성화를 pub/sub으로 모든 워커에 전파, 미지정 시 CACHE_REDIS_URL 사용, 둘 다 없으면 현재 프로세스에만 적용)
+    TOKEN_REVOCATION_REDIS_URL: Optional[str] = os.getenv("TOKEN_REVOCATION_REDIS_URL", os.getenv("CACHE_REDIS_URL", None))
+    
+    # 목록 전체 개수 계산 설정 (app.core.utils.counting.CountStrategy 값만 허용, 잘못된 값이면 시작 시 실패)
+    DEFAULT_COUNT_STRATEGY: Literal["exact", "cached", "estimated", "none"] = os.getenv("DEFAULT_COUNT_STRATEGY", "exact")
+    COUNT_CACHE_TTL_SECONDS: int = int(os.getenv("COUNT_CACHE_TTL_SECONDS", "30"))
+    
+    # 비밀번호 해싱 설정 (scripts/calibrate_password_hash.py로 서버에서 측정해 지정, 바꾸면 로그인 시 다시 해싱)
+    PASSWORD_HASH_SCHEME: str = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt")  # bcrypt 또는 argon2 (argon2-cffi 필요)
+    PASSWORD_HASH_BUDGET_MS: float = float(os.getenv("PASSWORD_HASH_BUDGET_MS", "250"))  # 해싱 1회 목표 시간 (보정 기준)
+    PASSWORD_BCRYPT_ROUNDS: int = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+    PASSWORD_ARGON2_TIME_COST: int = int(os.getenv("PASSWORD_ARGON2_TIME_COST", "3"))
+    PASSWORD_ARGON2_MEMORY_COST: int = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", "65536"))  # KiB
+    PASSWORD_ARGON2_PARALLELISM: int = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", "1"))  # 해싱 풀이 코어마다 프로세스를 두므로 1
+    
+    # 비밀번호 해싱 풀 설정 (작업 프로세스 수 0이면 CPU 코어 수, 최대 대기 작업 수 0이면 프로세스 수의 8배)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "0"))  # 초과하면 즉시 503으로 거절
+    PASSWORD_HASH_USE_PROCESSES: bool = os.getenv("PASSWORD_HASH_USE_PROCESSES", "True").lower() == "true"  # False면 스레드풀에서 실행
+    
+    # 로깅 설정 (기록은 큐에 넣고 백그라운드 스레드가 출력, 큐가 가득 차면 버림)
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "")  # 미지정 시 DEBUG 모드면 DEBUG, 아니면 INFO
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")  # json 또는 text
+    LOG_QUEUE_MAXSIZE: int = int(os.getenv("LOG_QUEUE_MAXSIZE", "10000"))
+    
+    # 접근 로그 샘플링 설정 (라우트별 비율은 "라우트 템플릿=비율"을 쉼표로 구분, 예: /api/v1/health=0,/api/v1/users/me=0.1)
+    LOG_ACCESS_SAMPLE_RATE: float = float(os.getenv("LOG_ACCESS_SAMPLE_RATE", "1.0"))
+    LOG_ACCESS_SAMPLE_RATES: str = os.getenv("LOG_ACCESS_SAMPLE_RATES", "")
+    LOG_SLOW_REQUEST_MS: float = float(os.getenv("LOG_SLOW_REQUEST_MS", "1000"))  # 이보다 느린 요청은 항상 기록
+    LOG_ERROR_STATUS: int = int(os.getenv("LOG_ERROR_STATUS", "500"))  # 이 상태 코드 이상은 항상 기록
+    
+    # 메트릭 설정 (여러 워커로 실행할 때는 워커별 스냅샷을 모을 디렉터리를 지정, 이전 실행의 파일은 시작 시 삭제)
+    METRICS_MULTIPROC_DIR: Optional[str] = os.getenv("METRICS_MULTIPROC_DIR", None)
+    METRICS_FLUSH_SECONDS: float = float(os.getenv("METRICS_FLUSH_SECONDS", "5"))  # 다른 워커의 값이 늦게 보이는 최대 시간
+    
+    # /metrics 접근 설정 (Bearer 토큰이 METRICS_TOKEN과 같거나 클라이언트 IP가 허용 목록에 있어야 함)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"  # False면 404
+    METRICS_TOKEN: Optional[str] = os.getenv("METRICS_TOKEN", None)
+    METRICS_ALLOWED_IPS: str = os.getenv("METRICS_ALLOWED_IPS", "127.0.0.1,::1")  # 쉼표로 구분한 주소/CIDR (프록시 뒤에서는 토큰 사용)
+    
+    # Server-Timing 헤더 설정 (꺼져 있어도 X-Server-Timing 요청 헤더가 SERVER_TIMING_TOKEN과 같으면 해당 요청에만 추가)
+    SERVER_TIMING_ENABLED: bool = os.getenv("SERVER_TIMING_ENABLED", "False").lower() == "true"  # 모든 응답에 추가 (내부 구조가 드러나므로 운영에서는 끔)
+    SERVER_TIMING_TOKEN: Optional[str] = os.getenv("SERVER_TIMING_TOKEN", None)
     
     # 사용자 설정
     FIRST_SUPERUSER: str = os.getenv("FIRST_SUPERUSER", "admin@example.com")
@@ -27,6 +27,12 @@ class DevelopmentSettings(BaseAppSettings):
     REDIS_PASSWORD: Optional[str] = os.getenv("REDIS_PASSWORD", None)
     REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
     
+    # 개발 중에는 읽기 쉬운 텍스트 로그 사용
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")
+    
+    # 개발 중에는 모든 응답에 Server-Timing 헤더 추가
+    SERVER_TIMING_ENABLED: bool = os.getenv("SERVER_TIMING_ENABLED", "True").lower() == "true"
+    
     # Celery 설정
     CELERY_BROKER_URL: str = os.getenv(
         "CELERY_BROKER_URL", 
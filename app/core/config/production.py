@@ -17,6 +17,14 @@ class ProductionSettings(BaseAppSettings):
     # 배포용 데이터베이스 설정
     DATABASE_URL: str = os.getenv("DATABASE_URL", "postgresql://postgres:postgres@db:5432/app")
     
+    # 배포용 커넥션 풀 설정 (워커 수 x (DB_POOL_SIZE + DB_MAX_OVERFLOW)가 DB max_connections를 넘지 않도록 조정)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
+    DB_POOL_WARMUP: bool = os.getenv("DB_POOL_WARMUP", "True").lower() == "true"
+    
     # Supabase 설정
     SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
     SUPABASE_KEY: str = os.getenv("SUPABASE_KEY", "")
@@ -28,6 +28,21 @@ class TestSettings(BaseAppSettings):
     REDIS_PASSWORD: Optional[str] = None
     REDIS_DB: int = 1
     
+    # 테스트 간 상태 공유를 막기 위해 엔티티 캐시 비활성화
+    CACHE_ENABLED: bool = False
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 0
+    
+    # 테스트에서는 프로세스를 띄우지 않고 스레드풀에서 비밀번호 해싱
+    PASSWORD_HASH_USE_PROCESSES: bool = False
+    # 테스트 속도를 위해 bcrypt 최소 비용 사용
+    PASSWORD_BCRYPT_ROUNDS: int = 4
+    
+    # 테스트 출력은 텍스트 로그 사용
+    LOG_FORMAT: str = "text"
+    
+    # 테스트 응답에는 항상 Server-Timing 헤더 추가
+    SERVER_TIMING_ENABLED: bool = True
+    
     # Celery 설정
     CELERY_BROKER_URL: str = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
     CELERY_RESULT_BACKEND: str = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
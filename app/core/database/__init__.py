@@ -1,4 +1,22 @@
-from app.core.database.session import Base, engine, get_db, SessionLocal
+from app.core.database.session import (
+    AsyncSessionLocal,
+    Base,
+    SessionLocal,
+    engine,
+    get_async_db,
+    get_async_engine,
+    get_db,
+)
 from app.core.database.supabase import supabase, get_supabase
 
-__all__ = ["Base", "engine", "get_db", "SessionLocal", "supabase", "get_supabase"] 
\ No newline at end of file
+__all__ = [
+    "Base",
+    "engine",
+    "get_async_engine",
+    "get_db",
+    "get_async_db",
+    "SessionLocal",
+    "AsyncSessionLocal",
+    "supabase",
+    "get_supabase",
+]
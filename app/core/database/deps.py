@@ -1,14 +1,6 @@
-from typing import Generator
+from app.core.database.session import get_async_db, get_db
 
-from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
-
-from app.core.database.session import SessionLocal
-
-
-def get_db() -> Generator:
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close() 
\ No newline at end of file
+# 세션 의존성은 session 모듈의 함수를 그대로 사용합니다.
+# 같은 함수 객체여야 FastAPI가 요청 안에서 의존성을 한 번만 실행하므로
+# 인증 의존성과 핸들러가 같은 세션(과 요청 범위 로더)을 공유합니다.
+__all__ = ["get_db", "get_async_db"]
@@ -0,0 +1,325 @@
+import logging
+import os
+import re
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 호출 위치를 찾을 때 건너뛸 경로 (SQLAlchemy 내부와 저장소 기본 클래스)
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_SKIPPED_PATHS = (
+    os.path.join(_APP_ROOT, "core", "database"),
+    os.path.join(_APP_ROOT, "core", "repositories"),
+    os.path.join(_APP_ROOT, "core", "services"),
+)
+
+# SQL 문자열 안의 리터럴 (파라미터 바인딩 없이 text()로 작성된 값)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def redact_sql(statement: str) -> str:
+    """
+    로그용 SQL 정리
+
+    바인딩 파라미터 값은 기록하지 않으며, 문장에 직접 쓰인 문자열/숫자 리터럴도 ?로 바꿉니다.
+
+    Args:
+        statement: SQL 문
+
+    Returns:
+        한 줄로 정리된 SQL 문
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def find_call_site() -> Optional[str]:
+    """
+    쿼리를 실행한 애플리케이션 코드 위치 찾기
+
+    Returns:
+        "파일:줄 함수" 형식의 위치 또는 None
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_APP_ROOT) and not filename.startswith(_SKIPPED_PATHS):
+            relative = os.path.relpath(filename, os.path.dirname(_APP_ROOT))
+            return f"{relative}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class QueryStats:
+    """
+    요청 하나에서 실행된 SQL 통계
+
+    실행 횟수, 전체 DB 시간, 느린 쿼리와 같은 문장의 반복 실행(N+1 의심)을 기록합니다.
+    """
+    def __init__(self, parent: Optional["QueryStats"] = None):
+        """
+        통계 초기화
+
+        Args:
+            parent: 바깥쪽 추적 블록의 통계 (기록을 함께 전달)
+        """
+        self.parent = parent
+        self.count = 0
+        self.total_ms = 0.0
+        self.slow: List[Dict[str, Any]] = []
+        self.statements: List[str] = []
+        self.repeats: Counter = Counter()
+        self.n_plus_one: Dict[str, Dict[str, Any]] = {}
+
+    def record(
+        self, statement: str, elapsed_ms: float, slow: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        실행된 SQL 기록
+
+        Args:
+            statement: 파라미터 자리표시자가 포함된 SQL 문
+            elapsed_ms: 실행 시간 (밀리초)
+            slow: 느린 쿼리 정보 (DB_SLOW_QUERY_MS 이상 걸린 경우)
+        """
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.statements.append(statement)
+        self.repeats[statement] += 1
+        repeats = self.repeats[statement]
+        if slow is not None:
+            self.slow.append(slow)
+
+        if repeats == settings.DB_N_PLUS_ONE_THRESHOLD:
+            self.n_plus_one[statement] = {
+                "sql": redact_sql(statement),
+                "count": repeats,
+                "call_site": find_call_site(),
+            }
+        elif repeats > settings.DB_N_PLUS_ONE_THRESHOLD:
+            self.n_plus_one[statement]["count"] = repeats
+
+    @property
+    def n_plus_one_suspects(self) -> List[Dict[str, Any]]:
+        """같은 문장이 DB_N_PLUS_ONE_THRESHOLD번 이상 실행된 목록"""
+        return list(self.n_plus_one.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        로그용 요약
+
+        Returns:
+            실행 횟수, 전체 DB 시간, 느린 쿼리 수와 N+1 의심 목록
+        """
+        return {
+            "db_queries": self.count,
+            "db_time_ms": round(self.total_ms, 3),
+            "db_slow_queries": len(self.slow),
+            "db_n_plus_one": self.n_plus_one_suspects,
+        }
+
+
+# 현재 요청의 SQL 통계 (스레드풀과 비동기 엔진의 greenlet에도 전달됨)
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+# 컨텍스트와 관계없이 모든 SQL을 기록하는 통계 (테스트 클라이언트처럼 다른 스레드에서 요청을 처리하는 경우)
+_global_stats: List[QueryStats] = []
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    """
+    현재 추적 중인 SQL 통계 조회
+
+    Returns:
+        SQL 통계 또는 None (추적 중이 아닌 경우)
+    """
+    return _query_stats.get()
+
+
+@contextmanager
+def track_queries(*, process_wide: bool = False) -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행되는 SQL 추적
+
+    추적 블록이 중첩되면 안쪽 블록의 기록이 바깥쪽 블록에도 더해집니다.
+
+    Args:
+        process_wide: 현재 컨텍스트뿐 아니라 프로세스의 모든 SQL을 기록할지 여부
+
+    Returns:
+        SQL 통계 (블록 안에서 계속 갱신됨)
+    """
+    if process_wide:
+        stats = QueryStats()
+        _global_stats.append(stats)
+        try:
+            yield stats
+        finally:
+            _global_stats.remove(stats)
+        return
+    stats = QueryStats(parent=_query_stats.get())
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def track_iteration(rows: Iterator[T], stats: Optional[QueryStats]) -> Iterator[T]:
+    """
+    반복할 때마다 stats에 SQL을 기록하는 이터레이터
+
+    스트리밍 응답 본문은 엔드포인트가 반환된 뒤 스레드풀에서 한 조각씩 반복되므로,
+    요청의 SQL 통계를 조각마다 다시 연결해 내보내기 쿼리도 접근 로그에 포함합니다.
+
+    Args:
+        rows: 반복할 이터레이터
+        stats: 기록할 SQL 통계 (보통 엔드포인트에서 get_query_stats()로 얻은 요청 통계)
+
+    Returns:
+        같은 항목을 내보내는 이터레이터
+    """
+    done = object()
+    try:
+        while True:
+            token = _query_stats.set(stats)
+            try:
+                item = next(rows, done)
+            finally:
+                _query_stats.reset(token)
+            if item is done:
+                return
+            yield item
+    finally:
+        # 클라이언트가 연결을 끊어 반복이 중단되어도 원본 이터레이터의 세션을 바로 닫음
+        close = getattr(rows, "close", None)
+        if close is not None:
+            close()
+
+
+async def atrack_iteration(rows: AsyncIterator[T], stats: Optional[QueryStats]) -> AsyncIterator[T]:
+    """
+    반복할 때마다 stats에 SQL을 기록하는 비동기 이터레이터
+
+    Args:
+        rows: 반복할 비동기 이터레이터
+        stats: 기록할 SQL 통계
+
+    Returns:
+        같은 항목을 내보내는 비동기 이터레이터
+    """
+    try:
+        while True:
+            token = _query_stats.set(stats)
+            try:
+                item = await rows.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _query_stats.reset(token)
+            yield item
+    finally:
+        aclose = getattr(rows, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행되는 SQL 수가 limit 이하인지 확인 (테스트용)
+
+    TestClient는 다른 스레드에서 요청을 처리하므로 프로세스의 모든 SQL을 셉니다.
+
+    예시:
+        with assert_max_queries(2):
+            client.get("/api/v1/users/me", headers=headers)
+
+    Args:
+        limit: 허용하는 최대 SQL 수
+
+    Returns:
+        SQL 통계
+
+    Raises:
+        AssertionError: SQL 수가 limit를 넘은 경우 (실행된 문장 목록 포함)
+    """
+    with track_queries(process_wide=True) as stats:
+        yield stats
+    if stats.count > limit:
+        statements = "\n".join(
+            f"  {index}. {redact_sql(statement)}"
+            for index, statement in enumerate(stats.statements, start=1)
+        )
+        raise AssertionError(f"SQL {stats.count}개 실행 (허용: {limit}개)\n{statements}")
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    if _query_stats.get() is not None or _global_stats:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+
+    slow = None
+    if elapsed_ms >= settings.DB_SLOW_QUERY_MS:
+        slow = {
+            "sql": redact_sql(statement),
+            "elapsed_ms": round(elapsed_ms, 3),
+            "call_site": find_call_site(),
+        }
+        logger.warning(
+            f"느린 쿼리 ({slow['elapsed_ms']}ms) {slow['call_site']}: {slow['sql']}",
+            extra={"db_slow_query": slow},
+        )
+
+    stats = _query_stats.get()
+    while stats is not None:
+        stats.record(statement, elapsed_ms, slow)
+        stats = stats.parent
+    for stats in list(_global_stats):
+        stats.record(statement, elapsed_ms, slow)
+
+
+def _handle_error(exception_context: Any) -> None:
+    connection = exception_context.connection
+    starts = connection.info.get("query_start") if connection is not None else None
+    if starts:
+        starts.pop()
+
+
+def instrument_queries(engine: Any) -> None:
+    """
+    엔진에 SQL 추적 이벤트 등록
+
+    track_queries() 블록 밖에서 실행되는 SQL은 기록하지 않습니다.
+
+    Args:
+        engine: 동기 또는 비동기 엔진
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -0,0 +1,242 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 커넥션 대기 시간 히스토그램 구간 상한 (밀리초)
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 통계
+
+    커넥션을 얻기까지 걸린 시간(풀 대기 + 새 연결 + pre-ping)의 히스토그램과
+    체크아웃 시간 초과, 새 연결, 무효화 횟수를 기록합니다.
+    """
+    def __init__(self, name: str):
+        """
+        통계 초기화
+
+        Args:
+            name: 풀 이름 (create_engine의 pool_logging_name)
+        """
+        self.name = name
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_ms_sum = 0.0
+        self.wait_ms_max = 0.0
+        self.wait_ms_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._lock = threading.Lock()
+
+    def observe_wait(self, wait_ms: float) -> None:
+        """
+        커넥션 획득 시간 기록
+
+        Args:
+            wait_ms: 커넥션을 얻기까지 걸린 시간 (밀리초)
+        """
+        with self._lock:
+            self.checkouts += 1
+            self.wait_ms_sum += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+            self.wait_ms_counts[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def increment(self, counter: str) -> None:
+        """
+        횟수 통계 증가
+
+        Args:
+            counter: 통계 이름 (checkout_timeouts, connects, invalidations)
+        """
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        누적 통계 조회
+
+        Returns:
+            횟수 통계와 대기 시간 히스토그램 (구간별 누적 개수)
+        """
+        with self._lock:
+            buckets: Dict[str, int] = {}
+            cumulative = 0
+            for upper, count in zip([*map(str, WAIT_BUCKETS_MS), "+Inf"], self.wait_ms_counts):
+                cumulative += count
+                buckets[upper] = cumulative
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "wait_ms": {
+                    "count": self.checkouts,
+                    "sum": round(self.wait_ms_sum, 3),
+                    "max": round(self.wait_ms_max, 3),
+                    "buckets": buckets,
+                },
+            }
+
+
+# 풀 이름별 통계 (engine.dispose()로 풀이 다시 만들어져도 유지)
+_metrics: Dict[str, PoolMetrics] = {}
+# 계측 중인 엔진 목록
+_engines: Dict[str, Engine] = {}
+
+
+def get_pool_metrics(name: str) -> PoolMetrics:
+    """
+    풀 이름에 해당하는 통계 조회 (없으면 생성)
+
+    Args:
+        name: 풀 이름
+
+    Returns:
+        풀 통계
+    """
+    metrics = _metrics.get(name)
+    if metrics is None:
+        metrics = _metrics.setdefault(name, PoolMetrics(name))
+    return metrics
+
+
+class _InstrumentedPoolMixin:
+    """커넥션 획득 시간과 시간 초과를 기록하는 풀"""
+    def connect(self) -> Any:
+        metrics = get_pool_metrics(self._orig_logging_name or "default")
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            metrics.increment("checkout_timeouts")
+            logger.warning(f"커넥션 풀 '{metrics.name}' 체크아웃 시간 초과: {self.status()}")
+            raise
+        metrics.observe_wait((time.perf_counter() - start) * 1000)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """계측되는 QueuePool"""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """계측되는 AsyncAdaptedQueuePool"""
+
+
+def engine_options(url: str, name: str, *, is_async: bool = False) -> Dict[str, Any]:
+    """
+    설정에 맞는 create_engine 풀 옵션 생성
+
+    메모리 SQLite는 연결마다 다른 데이터베이스가 되므로 기본 풀을 그대로 사용합니다.
+
+    Args:
+        url: 데이터베이스 URL
+        name: 풀 이름 (통계와 로그에 사용)
+        is_async: 비동기 엔진 여부
+
+    Returns:
+        create_engine / create_async_engine 키워드 인자
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_use_lifo": True,
+        "pool_logging_name": name,
+    }
+
+
+def instrument_engine(engine: Any, name: str) -> None:
+    """
+    엔진의 풀 이벤트를 통계에 연결
+
+    Args:
+        engine: 동기 또는 비동기 엔진
+        name: 풀 이름
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    metrics = get_pool_metrics(name)
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        metrics.increment("connects")
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        metrics.increment("invalidations")
+
+    _engines[name] = sync_engine
+
+
+def get_pool_stats() -> List[Dict[str, Any]]:
+    """
+    계측 중인 모든 풀의 현재 상태와 누적 통계 조회
+
+    Returns:
+        풀별 상태 목록 (크기, 사용 중, 오버플로, 유휴 커넥션 수와 누적 통계)
+    """
+    stats = []
+    for name, engine in _engines.items():
+        pool = engine.pool
+        status: Dict[str, Any] = {"name": name, "pool_class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            status.update(
+                {
+                    "size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": pool.overflow(),
+                    "checked_in": pool.checkedin(),
+                    "max_overflow": pool._max_overflow,
+                    "timeout": pool.timeout(),
+                }
+            )
+        status.update(get_pool_metrics(name).snapshot())
+        stats.append(status)
+    return stats
+
+
+def warm_up_pool(engine: Engine, size: Optional[int] = None) -> int:
+    """
+    커넥션 풀 미리 채우기
+
+    size개의 커넥션을 동시에 열었다가 반납해, 첫 요청들이 연결 수립 비용을 치르지 않도록 합니다.
+
+    Args:
+        engine: 동기 엔진
+        size: 열어 둘 커넥션 수 (기본값: DB_POOL_SIZE)
+
+    Returns:
+        연 커넥션 수
+    """
+    size = settings.DB_POOL_SIZE if size is None else size
+    if isinstance(engine.pool, QueuePool):
+        size = min(size, engine.pool.size())
+    else:
+        size = min(size, 1)
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
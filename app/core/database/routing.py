@@ -0,0 +1,170 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Sequence
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+
+class RequestRouting:
+    """
+    요청 하나의 읽기 라우팅 상태
+
+    요청 안에서 쓰기가 발생했는지와, 이전 요청의 쓰기 때문에 읽기를 주 데이터베이스로
+    고정해야 하는지를 같은 요청의 모든 세션이 공유합니다.
+    """
+    def __init__(self, pinned: bool = False):
+        """
+        상태 초기화
+
+        Args:
+            pinned: 요청 시작부터 읽기를 주 데이터베이스로 고정할지 여부
+        """
+        self.pinned = pinned
+        self.wrote = False
+
+
+# 현재 요청의 읽기 라우팅 상태 (스레드풀에서 실행되는 동기 세션에도 같은 객체가 전달됨)
+_request_routing: ContextVar[Optional[RequestRouting]] = ContextVar("request_routing", default=None)
+
+
+def get_request_routing() -> Optional[RequestRouting]:
+    """
+    현재 요청의 읽기 라우팅 상태 조회
+
+    Returns:
+        라우팅 상태 또는 None (요청 밖인 경우)
+    """
+    return _request_routing.get()
+
+
+@contextmanager
+def request_routing(pinned: bool = False) -> Iterator[RequestRouting]:
+    """
+    블록 안의 세션들이 공유할 읽기 라우팅 상태 설정
+
+    Args:
+        pinned: 블록 시작부터 읽기를 주 데이터베이스로 고정할지 여부
+
+    Returns:
+        라우팅 상태
+    """
+    routing = RequestRouting(pinned=pinned)
+    token = _request_routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _request_routing.reset(token)
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """
+    블록 안의 읽기를 주 데이터베이스로 보냄
+
+    복제 지연을 허용할 수 없는 조회(예: 결제 직후 상태 확인)에 사용합니다.
+    """
+    current = _request_routing.get()
+    routing = RequestRouting(pinned=True)
+    if current is not None:
+        routing.wrote = current.wrote
+    token = _request_routing.set(routing)
+    try:
+        yield
+    finally:
+        if current is not None and routing.wrote:
+            current.wrote = True
+        _request_routing.reset(token)
+
+
+class RoutingSession(Session):
+    """
+    읽기 복제본으로 SELECT를 보내는 세션
+
+    - INSERT/UPDATE/DELETE, flush, SELECT ... FOR UPDATE, text() 문은 주 데이터베이스로 보냅니다.
+    - 세션이나 같은 요청에서 쓰기(INSERT/UPDATE/DELETE, flush, FOR UPDATE)가 한 번이라도
+      발생하면 이후 읽기도 주 데이터베이스로 보내 방금 쓴 데이터를 읽을 수 있도록 합니다
+      (read-your-writes).
+    - 세션 하나는 처음 고른 복제본만 사용해 요청 안에서 일관된 시점을 읽습니다.
+    - 복제본이 없으면 일반 Session과 같습니다.
+    """
+    def __init__(
+        self,
+        *args: Any,
+        primary: Optional[Engine] = None,
+        replicas: Sequence[Engine] = (),
+        **kwargs: Any,
+    ):
+        """
+        세션 초기화
+
+        Args:
+            primary: 주 데이터베이스 엔진 (기본값: bind)
+            replicas: 읽기 복제본 엔진 목록
+        """
+        super().__init__(*args, **kwargs)
+        self.primary = primary or self.bind
+        self.replicas: List[Engine] = list(replicas)
+        self.pinned = False
+        self._replica: Optional[Engine] = None
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kwargs: Any) -> Any:
+        if not self.replicas:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        if self._flushing or _is_write(clause):
+            self._mark_write()
+            return self.primary
+        if not isinstance(clause, Select):
+            return self.primary
+        routing = _request_routing.get()
+        if self.pinned or (routing is not None and (routing.pinned or routing.wrote)):
+            return self.primary
+        if self._replica is None:
+            self._replica = random.choice(self.replicas)
+        return self._replica
+
+    def _mark_write(self) -> None:
+        """이후 읽기를 주 데이터베이스로 고정"""
+        self.pinned = True
+        routing = _request_routing.get()
+        if routing is not None:
+            routing.wrote = True
+
+
+def _is_write(clause: Any) -> bool:
+    """INSERT/UPDATE/DELETE 또는 SELECT ... FOR UPDATE 문인지 여부"""
+    if getattr(clause, "is_dml", False):
+        return True
+    return isinstance(clause, Select) and clause._for_update_arg is not None
+
+
+def parse_database_urls(value: str) -> List[str]:
+    """
+    쉼표로 구분된 데이터베이스 URL 목록 파싱
+
+    Args:
+        value: 쉼표로 구분된 URL 문자열
+
+    Returns:
+        URL 목록
+    """
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+def primary_pin_active(cookie: Optional[str]) -> bool:
+    """
+    읽기 고정 쿠키가 아직 유효한지 확인
+
+    Args:
+        cookie: 고정 만료 시각(UNIX 시간) 쿠키 값
+
+    Returns:
+        유효 여부
+    """
+    try:
+        return cookie is not None and float(cookie) > time.time()
+    except ValueError:
+        return False
@@ -0,0 +1,257 @@
+import weakref
+from typing import Any, List, Sequence, Tuple, Union
+
+from sqlalchemy import Table, column, event, func, literal_column, or_, select, table, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+# 전문 검색
+#
+# - PostgreSQL: 검색 문서(검색 컬럼을 이어 붙인 문자열)의 tsvector GIN 인덱스와
+#   컬럼별 pg_trgm GIN 인덱스를 사용합니다. 인덱스는 Alembic 마이그레이션으로 만듭니다.
+#   조건은 단어 일치(tsvector @@ tsquery) 또는 부분 문자열 일치(ILIKE, trigram 인덱스 사용)이며
+#   ts_rank와 trigram 유사도의 합으로 정렬합니다.
+# - SQLite(개발/테스트): trigram 토크나이저를 쓰는 FTS5 외부 콘텐츠 테이블({테이블}_fts)과
+#   동기화 트리거를 create_all 시점에 만들고 bm25 순으로 정렬합니다.
+#   trigram 토크나이저는 SQLite 3.34부터 있으므로 그보다 낮은 버전에서는 만들지 않습니다.
+# - 그 외(또는 FTS 테이블이 없는 기존 SQLite 파일): 컬럼별 LIKE로 대체합니다.
+
+# trigram 인덱스/토크나이저가 부분 문자열 검색에 사용할 수 있는 최소 검색어 길이
+MIN_TRIGRAM_LENGTH = 3
+# tsvector에 사용하는 텍스트 검색 설정 (인덱스 식과 같아야 함)
+TEXT_SEARCH_CONFIG = "simple"
+# FTS5 trigram 토크나이저가 추가된 SQLite 버전
+SQLITE_TRIGRAM_MIN_VERSION = (3, 34, 0)
+
+# 엔진별 FTS 테이블 존재 여부 캐시
+_fts_tables: "weakref.WeakKeyDictionary[Engine, set]" = weakref.WeakKeyDictionary()
+
+
+def fts_table_name(table_name: str) -> str:
+    """SQLite FTS5 테이블 이름"""
+    return f"{table_name}_fts"
+
+
+def search_document(columns: Sequence[str]) -> str:
+    """
+    검색 컬럼을 공백으로 이어 붙인 SQL 식
+
+    PostgreSQL 식 인덱스와 조회 조건이 같은 식을 쓰도록 한곳에서 만듭니다.
+
+    Args:
+        columns: 검색 컬럼 이름 목록
+
+    Returns:
+        SQL 식 문자열
+    """
+    return " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+
+
+def sqlite_supports_trigram(connection: Connection) -> bool:
+    """
+    연결된 SQLite 라이브러리가 FTS5 trigram 토크나이저를 지원하는지 확인
+
+    Args:
+        connection: SQLite 연결
+
+    Returns:
+        지원 여부
+    """
+    version = connection.exec_driver_sql("SELECT sqlite_version()").scalar()
+    return tuple(int(part) for part in version.split(".")[:3]) >= SQLITE_TRIGRAM_MIN_VERSION
+
+
+def sqlite_fts_ddl(table_name: str, columns: Sequence[str]) -> List[str]:
+    """
+    SQLite FTS5 검색 테이블과 동기화 트리거 생성 DDL
+
+    Args:
+        table_name: 원본 테이블 이름
+        columns: 검색 컬럼 이름 목록
+
+    Returns:
+        DDL 문 목록 (마지막 문은 기존 행 색인)
+    """
+    fts = fts_table_name(table_name)
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{names}, content='{table_name}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table_name} BEGIN "
+        f"{delete_old} {insert_new} END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def sqlite_fts_drop_ddl(table_name: str) -> List[str]:
+    """
+    SQLite FTS5 검색 테이블과 트리거 삭제 DDL
+
+    Args:
+        table_name: 원본 테이블 이름
+
+    Returns:
+        DDL 문 목록
+    """
+    fts = fts_table_name(table_name)
+    return [
+        f"DROP TRIGGER IF EXISTS {fts}_ai",
+        f"DROP TRIGGER IF EXISTS {fts}_ad",
+        f"DROP TRIGGER IF EXISTS {fts}_au",
+        f"DROP TABLE IF EXISTS {fts}",
+    ]
+
+
+def register_search_index(table: Table, columns: Sequence[str]) -> None:
+    """
+    create_all/drop_all 시 SQLite FTS5 검색 테이블도 함께 생성/삭제
+
+    PostgreSQL 인덱스는 마이그레이션으로 관리하므로 여기서는 만들지 않습니다.
+    trigram 토크나이저가 없는 SQLite에서는 FTS 테이블을 만들지 않으며 검색은 LIKE로 대체됩니다.
+
+    Args:
+        table: 원본 테이블
+        columns: 검색 컬럼 이름 목록
+    """
+    @event.listens_for(table, "after_create")
+    def _create_fts(target: Table, connection: Connection, **kw: Any) -> None:
+        if connection.dialect.name == "sqlite" and sqlite_supports_trigram(connection):
+            for statement in sqlite_fts_ddl(target.name, columns):
+                connection.exec_driver_sql(statement)
+
+    @event.listens_for(table, "before_drop")
+    def _drop_fts(target: Table, connection: Connection, **kw: Any) -> None:
+        if connection.dialect.name == "sqlite":
+            for statement in sqlite_fts_drop_ddl(target.name):
+                connection.exec_driver_sql(statement)
+
+
+def has_fts_table(db: Union[Session, Engine], table_name: str) -> bool:
+    """
+    SQLite 데이터베이스에 FTS5 검색 테이블이 있는지 확인
+
+    있으면 엔진별로 기억해 다음부터는 조회하지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션 (비동기 세션은 run_sync로 전달) 또는 엔진
+        table_name: 원본 테이블 이름
+
+    Returns:
+        존재 여부
+    """
+    engine = db if isinstance(db, Engine) else db.get_bind()
+    found = _fts_tables.setdefault(engine, set())
+    if table_name not in found:
+        statement = text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name")
+        params = {"name": fts_table_name(table_name)}
+        if isinstance(db, Engine):
+            with engine.connect() as connection:
+                exists = connection.execute(statement, params).first()
+        else:
+            exists = db.execute(statement, params).first()
+        if not exists:
+            return False
+        found.add(table_name)
+    return True
+
+
+def _escape_like(term: str) -> str:
+    """LIKE 패턴 특수 문자 이스케이프"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _like_condition(model: Any, columns: Sequence[str], term: str) -> ColumnElement:
+    """컬럼 중 하나라도 검색어를 포함하는지 (대소문자 무시)"""
+    pattern = f"%{_escape_like(term)}%"
+    return or_(*(getattr(model, column).ilike(pattern, escape="\\") for column in columns))
+
+
+def _postgres_parts(
+    model: Any, columns: Sequence[str], term: str
+) -> Tuple[ColumnElement, ColumnElement]:
+    """PostgreSQL 검색 조건과 순위 식"""
+    config = literal_column(f"'{TEXT_SEARCH_CONFIG}'")
+    document = func.to_tsvector(config, literal_column(search_document(columns)))
+    query = func.websearch_to_tsquery(config, term)
+    condition = or_(document.op("@@")(query), _like_condition(model, columns, term))
+    similarity = func.greatest(
+        *(func.similarity(func.coalesce(getattr(model, column), ""), term) for column in columns)
+    )
+    return condition, func.ts_rank(document, query) + similarity
+
+
+def _fts_match(model: Any, term: str) -> Tuple[Any, ColumnElement]:
+    """SQLite FTS5 테이블과 MATCH 조건 (검색어는 연산자로 해석되지 않도록 따옴표 처리)"""
+    fts_name = fts_table_name(model.__table__.name)
+    fts = table(fts_name, column("rowid"))
+    phrase = '"' + term.replace('"', '""') + '"'
+    return fts, literal_column(fts_name).op("MATCH")(phrase)
+
+
+def search_condition(
+    model: Any, columns: Sequence[str], term: str, dialect_name: str, fts_ready: bool = False
+) -> ColumnElement:
+    """
+    검색 조건 (순위 없이 WHERE 절만 필요한 경우, 예: sqladmin 목록)
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+        columns: 검색 컬럼 이름 목록
+        term: 검색어
+        dialect_name: 데이터베이스 방언 이름
+        fts_ready: SQLite FTS5 테이블 사용 가능 여부
+
+    Returns:
+        WHERE 절에 사용할 조건
+    """
+    if dialect_name == "postgresql":
+        return _postgres_parts(model, columns, term)[0]
+    if dialect_name == "sqlite" and fts_ready and len(term) >= MIN_TRIGRAM_LENGTH:
+        fts, match = _fts_match(model, term)
+        return model.id.in_(select(fts.c.rowid).where(match))
+    return _like_condition(model, columns, term)
+
+
+def search_statement(
+    base: Select,
+    model: Any,
+    columns: Sequence[str],
+    term: str,
+    dialect_name: str,
+    fts_ready: bool = False,
+) -> Select:
+    """
+    select 문에 검색 조건과 관련도 순 정렬 적용
+
+    Args:
+        base: select 문 (모델 또는 일부 컬럼 조회)
+        model: SQLAlchemy 모델 클래스
+        columns: 검색 컬럼 이름 목록
+        term: 검색어
+        dialect_name: 데이터베이스 방언 이름
+        fts_ready: SQLite FTS5 테이블 사용 가능 여부
+
+    Returns:
+        관련도가 높은 순(같으면 ID 순)으로 정렬된 select 문
+    """
+    if dialect_name == "postgresql":
+        condition, rank = _postgres_parts(model, columns, term)
+        return base.where(condition).order_by(rank.desc(), model.id)
+    if dialect_name == "sqlite" and fts_ready and len(term) >= MIN_TRIGRAM_LENGTH:
+        fts, match = _fts_match(model, term)
+        return (
+            base.join(fts, fts.c.rowid == model.id)
+            .where(match)
+            .order_by(func.bm25(literal_column(fts.name)), model.id)
+        )
+    return base.where(_like_condition(model, columns, term)).order_by(model.id)
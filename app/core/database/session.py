@@ -1,22 +1,172 @@
+import threading
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core.database.instrumentation import instrument_queries
+from app.core.database.pool import engine_options, instrument_engine
+from app.core.database.routing import RoutingSession, parse_database_urls
+from app.core.database.transaction import needs_commit
+
+# 동기 드라이버에 대응하는 비동기 드라이버 (의존성에 포함된 aiosqlite/asyncpg만 지원,
+# 그 외 데이터베이스는 ASYNC_DATABASE_URL을 직접 지정)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def get_async_database_url(url: str) -> str:
+    """
+    동기 데이터베이스 URL을 비동기 드라이버 URL로 변환
+
+    Args:
+        url: 동기 데이터베이스 URL
+
+    Returns:
+        비동기 드라이버를 사용하는 데이터베이스 URL
+    """
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def create_instrumented_engine(url: str, name: str, *, is_async: bool = False) -> Any:
+    """
+    풀 설정과 계측이 적용된 엔진 생성
+
+    Args:
+        url: 데이터베이스 URL
+        name: 풀 이름 (통계와 로그에 사용)
+        is_async: 비동기 엔진 여부
+
+    Returns:
+        동기 또는 비동기 엔진
+    """
+    factory = create_async_engine if is_async else create_engine
+    created = factory(url, **engine_options(url, name, is_async=is_async))
+    instrument_engine(created, name)
+    instrument_queries(created)
+    return created
+
 
 # 데이터베이스 엔진 생성
-engine = create_engine(settings.DATABASE_URL)
+engine = create_instrumented_engine(settings.DATABASE_URL, "primary")
+
+# 비동기 데이터베이스 URL
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL)
+
+# 읽기 복제본 엔진 생성 (DATABASE_REPLICA_URLS 미지정 시 모든 조회가 주 데이터베이스로 감)
+REPLICA_URLS = parse_database_urls(settings.DATABASE_REPLICA_URLS)
+replica_engines = [
+    create_instrumented_engine(url, f"replica{index}")
+    for index, url in enumerate(REPLICA_URLS, start=1)
+]
+
+# 비동기 엔진은 처음 사용할 때 생성 (비동기 저장소를 쓰지 않으면 비동기 드라이버가 없어도 됨)
+_async_engine: Optional[Any] = None
+_async_replica_engines: List[Any] = []
+_async_engine_lock = threading.Lock()
 
-# 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_async_engine() -> Any:
+    """
+    비동기 데이터베이스 엔진 조회 (처음 호출할 때 복제본 엔진과 함께 생성)
+
+    Returns:
+        비동기 엔진
+    """
+    global _async_engine
+    if _async_engine is None:
+        with _async_engine_lock:
+            if _async_engine is None:
+                _async_replica_engines.extend(
+                    create_instrumented_engine(get_async_database_url(url), f"async_replica{index}", is_async=True)
+                    for index, url in enumerate(REPLICA_URLS, start=1)
+                )
+                _async_engine = create_instrumented_engine(ASYNC_DATABASE_URL, "async", is_async=True)
+    return _async_engine
+
+
+def get_async_replica_engines() -> List[Any]:
+    """
+    비동기 읽기 복제본 엔진 목록 조회
+
+    Returns:
+        비동기 복제본 엔진 목록 (복제본이 없으면 빈 목록)
+    """
+    get_async_engine()
+    return _async_replica_engines
+
+
+class LazyAsyncSessionMaker(async_sessionmaker):
+    """처음 세션을 만들 때 비동기 엔진을 생성해 연결하는 세션 팩토리"""
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        if self.kw.get("bind") is None:
+            self.configure(**_async_bind_options())
+        return super().__call__(**local_kw)
+
+
+def _async_bind_options() -> Dict[str, Any]:
+    """비동기 세션 팩토리의 엔진 설정"""
+    async_engine = get_async_engine()
+    return {
+        "bind": async_engine,
+        "primary": async_engine.sync_engine,
+        "replicas": [replica.sync_engine for replica in get_async_replica_engines()],
+    }
+
+# 세션 팩토리 생성 (조회는 복제본, 쓰기와 쓰기 이후 조회는 주 데이터베이스)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    primary=engine,
+    replicas=replica_engines,
+)
+
+# 비동기 세션 팩토리 생성 (엔진은 첫 세션 생성 시 연결)
+# AsyncSession은 만료된 속성을 암묵적으로 다시 읽을 수 없으므로 커밋 후에도 만료시키지 않음
+AsyncSessionLocal = LazyAsyncSessionMaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 # 모델 기본 클래스
 Base = declarative_base()
 
 # 의존성 주입을 위한 데이터베이스 세션 함수
+# 요청 하나가 트랜잭션 하나입니다. 저장소의 쓰기는 flush만 하고, 요청이 정상적으로 끝나면
+# 여기서 한 번 커밋하며 예외가 발생하면 전체를 롤백합니다.
 def get_db():
     db = SessionLocal()
     try:
         yield db
+        if needs_commit(db):
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+# 의존성 주입을 위한 비동기 데이터베이스 세션 함수
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            if needs_commit(db):
+                await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
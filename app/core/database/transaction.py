@@ -0,0 +1,123 @@
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# 세션의 info에 저장하는 키
+_UNCOMMITTED_WRITES = "uncommitted_writes"
+_AFTER_COMMIT = "after_commit_callbacks"
+
+# 요청 단위 작업(unit of work)
+#
+# 저장소의 쓰기 메서드는 기본적으로 flush만 하고, 커밋은 요청이 끝날 때 get_db가
+# 한 번 수행합니다 (예외가 발생하면 롤백). 따라서 한 요청의 여러 쓰기는 하나의
+# 트랜잭션으로 묶이고 fsync도 한 번만 발생합니다. 즉시 커밋이 필요하면 쓰기 메서드에
+# commit=True를 전달합니다.
+
+
+def _sync_session(db: Any) -> Session:
+    """AsyncSession이면 내부 동기 세션 반환"""
+    return getattr(db, "sync_session", db)
+
+
+def mark_written(db: Any) -> None:
+    """
+    세션에 커밋되지 않은 쓰기가 있음을 기록
+
+    Args:
+        db: 동기 또는 비동기 데이터베이스 세션
+    """
+    _sync_session(db).info[_UNCOMMITTED_WRITES] = True
+
+
+def has_uncommitted_writes(db: Any) -> bool:
+    """
+    세션에 커밋되지 않은 쓰기가 있는지 확인
+
+    커밋 전 데이터를 캐시에 저장하지 않도록 할 때 사용합니다.
+
+    Args:
+        db: 동기 또는 비동기 데이터베이스 세션
+
+    Returns:
+        커밋되지 않은 쓰기 여부
+    """
+    return bool(_sync_session(db).info.get(_UNCOMMITTED_WRITES))
+
+
+def needs_commit(db: Any) -> bool:
+    """
+    요청이 끝날 때 커밋해야 하는지 확인
+
+    저장소를 거친 쓰기뿐 아니라 세션에 직접 add/delete 한 변경도 포함합니다.
+    변경이 없는 읽기 전용 요청은 커밋 왕복 없이 세션을 닫습니다.
+
+    Args:
+        db: 동기 또는 비동기 데이터베이스 세션
+
+    Returns:
+        커밋 필요 여부
+    """
+    session = _sync_session(db)
+    return has_uncommitted_writes(session) or bool(session.new or session.dirty or session.deleted)
+
+
+def run_after_commit(db: Any, callback: Callable[[], Any]) -> None:
+    """
+    트랜잭션이 커밋된 뒤 실행할 작업 등록 (롤백되면 버림)
+
+    Args:
+        db: 동기 또는 비동기 데이터베이스 세션
+        callback: 실행할 함수
+    """
+    _sync_session(db).info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+def persist(db: Session, *, commit: bool = False) -> None:
+    """
+    세션의 변경 사항을 데이터베이스에 반영
+
+    즉시 커밋하는 경우 이 커밋에서만 객체를 만료시키지 않아, 저장소가 RETURNING으로 받은
+    객체를 호출자가 읽을 때 행마다 다시 조회하지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        commit: 즉시 커밋할지 여부 (False면 flush만 하고 커밋은 요청 단위 작업에 맡김)
+    """
+    if commit:
+        expire_on_commit, db.expire_on_commit = db.expire_on_commit, False
+        try:
+            db.commit()
+        finally:
+            db.expire_on_commit = expire_on_commit
+    else:
+        db.flush()
+        mark_written(db)
+
+
+async def apersist(db: Any, *, commit: bool = False) -> None:
+    """
+    비동기 세션의 변경 사항을 데이터베이스에 반영
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        commit: 즉시 커밋할지 여부 (False면 flush만 하고 커밋은 요청 단위 작업에 맡김)
+    """
+    if commit:
+        await db.commit()
+    else:
+        await db.flush()
+        mark_written(db)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    session.info.pop(_UNCOMMITTED_WRITES, None)
+    for callback in session.info.pop(_AFTER_COMMIT, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_UNCOMMITTED_WRITES, None)
+    session.info.pop(_AFTER_COMMIT, None)
@@ -27,7 +27,7 @@ def create_first_superuser(db: Session) -> None:
         return
 
     # 이미 존재하는지 확인
-    user = user_service.get_user_by_email(db, email=settings.FIRST_SUPERUSER)
+    user = user_service.get_by_email(db, email=settings.FIRST_SUPERUSER)
     if user:
         logger.info(f"관리자 사용자가 이미 존재합니다: {settings.FIRST_SUPERUSER}")
         return
@@ -42,7 +42,8 @@ def create_first_superuser(db: Session) -> None:
     )
 
     try:
-        user = user_service.create_user(db, user_in=user_in)
+        # 요청 밖에서 실행되므로 직접 커밋
+        user = user_service.create(db, obj_in=user_in, commit=True)
         logger.info(f"관리자 사용자가 생성되었습니다: {settings.FIRST_SUPERUSER}")
     except Exception as e:
         logger.error(f"관리자 사용자 생성 중 오류 발생: {e}") 
\ No newline at end of file
@@ -1,4 +1,6 @@
 from app.core.middlewares.logging_middleware import LoggingMiddleware
 from app.core.middlewares.auth_middleware import AuthMiddleware
+from app.core.middlewares.replica_middleware import ReadYourWritesMiddleware
+from app.core.middlewares.metrics_middleware import MetricsMiddleware
 
-__all__ = ["LoggingMiddleware", "AuthMiddleware"] 
\ No newline at end of file
+__all__ = ["LoggingMiddleware", "AuthMiddleware", "ReadYourWritesMiddleware", "MetricsMiddleware"] 
\ No newline at end of file
@@ -1,32 +1,91 @@
-from fastapi import Request, Response, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from jose import jwt, JWTError
+import re
+from typing import Iterable, Optional
 
-from app.core.config import settings
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """인증 미들웨어"""
+from app.core.utils.tokens import get_token_claims
+
+# 인증이 필요 없는 경로 목록 ("/"는 루트 경로만, 나머지는 접두사로 일치)
+PUBLIC_PATHS = (
+    "/",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/metrics",  # 사용자 토큰 대신 METRICS_TOKEN/METRICS_ALLOWED_IPS로 확인
+    "/api/v1/health",
+    "/api/v1/health/db",
+    "/api/v1/health/supabase",
+    "/api/v1/auth/login",
+    "/api/v1/auth/register",
+)
+
+
+def compile_path_matcher(paths: Iterable[str]) -> "re.Pattern[str]":
+    """
+    공개 경로 목록을 한 번의 정규식 일치로 확인하는 매처로 컴파일
+    
+    "/"로 끝나는 경로는 정확히 일치할 때만, 나머지는 접두사로 일치합니다.
+    ("/"를 접두사로 취급하면 모든 경로가 공개되므로)
+    
+    Args:
+        paths: 공개 경로 목록
+    
+    Returns:
+        경로 매처 (matcher.match(path)가 None이 아니면 공개 경로)
+    """
+    alternatives = [
+        re.escape(path) + ("$" if path.endswith("/") else "")
+        for path in sorted(set(paths), key=len, reverse=True)
+    ]
+    return re.compile("|".join(alternatives) or "(?!)")
+
+
+class AuthMiddleware:
+    """
+    인증 미들웨어 (순수 ASGI)
     
-    async def dispatch(self, request: Request, call_next):
-        # 인증이 필요 없는 경로 목록
-        public_paths = [
-            "/",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/api/v1/health",
-            "/api/v1/health/db",
-            "/api/v1/health/supabase",
-            "/api/v1/auth/login",
-            "/api/v1/auth/register",
-        ]
+    공개 경로가 아닌 HTTP 요청의 Bearer 토큰을 검증하고, 사용자 ID를 request.state.user_id에,
+    검증한 클레임을 scope에 저장해 인증 의존성이 다시 검증하지 않도록 합니다.
+    """
+    
+    def __init__(self, app: ASGIApp, public_paths: Optional[Iterable[str]] = None):
+        """
+        미들웨어 초기화
+        
+        Args:
+            app: 다음 ASGI 애플리케이션
+            public_paths: 인증이 필요 없는 경로 목록 (기본값: PUBLIC_PATHS)
+        """
+        self.app = app
+        self.public_paths = compile_path_matcher(
+            PUBLIC_PATHS if public_paths is None else public_paths
+        )
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.public_paths.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
         
-        # 현재 경로가 인증이 필요 없는 경로인지 확인
-        if any(request.url.path.startswith(path) for path in public_paths):
-            return await call_next(request)
+        try:
+            user_id = self._authenticate(scope)
+        except HTTPException as e:
+            response = JSONResponse(
+                {"detail": e.detail}, status_code=e.status_code, headers=e.headers
+            )
+            await response(scope, receive, send)
+            return
         
-        # Authorization 헤더 확인
-        authorization = request.headers.get("Authorization")
+        # 요청 상태에 사용자 정보 저장 (request.state와 같은 딕셔너리)
+        scope.setdefault("state", {})["user_id"] = user_id
+        await self.app(scope, receive, send)
+    
+    @staticmethod
+    def _authenticate(scope: Scope) -> Optional[str]:
+        """Authorization 헤더의 Bearer 토큰 검증 후 사용자 ID 반환"""
+        authorization = Headers(scope=scope).get("authorization")
         if not authorization:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,30 +93,13 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Bearer 토큰 확인
-        try:
-            scheme, token = authorization.split()
-            if scheme.lower() != "bearer":
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="유효하지 않은 인증 방식입니다",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            # 토큰 검증
-            payload = jwt.decode(
-                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-            )
-            
-            # 요청 상태에 사용자 정보 저장
-            request.state.user_id = payload.get("sub")
-            
-        except JWTError:
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not token:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="유효하지 않은 토큰입니다",
+                detail="유효하지 않은 인증 방식입니다",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # 다음 미들웨어 또는 엔드포인트 호출
-        return await call_next(request) 
\ No newline at end of file
+        # 토큰 검증 (클레임을 scope에 저장해 인증 의존성이 다시 검증하지 않도록 함)
+        return get_token_claims(token, scope).get("sub")
@@ -1,28 +1,106 @@
+import hmac
 import time
 import logging
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.database.instrumentation import track_queries
+from app.core.observability import collect_timings, log_access, route_template
+from app.core.utils.tokens import SCOPE_KEY
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """요청 및 응답 로깅을 위한 미들웨어"""
+class LoggingMiddleware:
+    """
+    요청 및 응답 로깅을 위한 미들웨어 (순수 ASGI)
     
-    async def dispatch(self, request: Request, call_next):
-        # 요청 시작 시간
-        start_time = time.time()
+    응답 본문을 가로채지 않고 send만 감싸 상태 코드를 기록하므로 스트리밍 응답도 그대로 흘려보냅니다.
+    요청이 끝나면 JSON 접근 로그 한 건(메서드, 라우트 템플릿, 상태, 처리 시간, 사용자 ID, SQL 시간)을
+    샘플링 규칙에 따라 기록합니다. 처리 시간은 응답 본문 전송이 끝날 때까지입니다.
+    
+    요청 처리 중 기록한 구간별 시간(인증, SQL, 비밀번호 해싱, Supabase, 렌더링)은 접근 로그의
+    timings 필드에 남기고, SERVER_TIMING_ENABLED이거나 X-Server-Timing 요청 헤더가
+    SERVER_TIMING_TOKEN과 같으면 Server-Timing 응답 헤더로도 내보냅니다.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # 요청 정보 로깅
-        logger.info(f"Request: {request.method} {request.url.path}")
+        method = scope["method"]
+        path = scope["path"]
+        # 응답을 시작하기 전에 예외가 나면 500으로 기록
+        status_code = 500
         
-        # 다음 미들웨어 또는 엔드포인트 호출
-        response = await call_next(request)
+        server_timing = _server_timing_requested(scope)
         
-        # 처리 시간 계산
-        process_time = time.time() - start_time
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # 응답 시작 전까지 실행한 SQL을 db 구간으로 기록
+                if query_stats.count:
+                    timings.add("db", query_stats.total_ms, query_stats.count)
+                if server_timing:
+                    total_ms = (time.perf_counter() - start_time) * 1000
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", timings.header(total_ms).encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
         
-        # 응답 정보 로깅
-        logger.info(f"Response: {request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.4f}s")
+        # 요청 시작 시간
+        start_time = time.perf_counter()
         
-        return response 
\ No newline at end of file
+        # 다음 미들웨어 또는 엔드포인트 호출 (실행된 SQL과 구간별 처리 시간 추적)
+        try:
+            with track_queries() as query_stats, collect_timings() as timings:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            # 처리 시간 계산
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            
+            # 접근 로그 (일치하는 라우트가 없으면 요청 경로)
+            summary = query_stats.summary()
+            log_access(
+                method=method,
+                route=route_template(scope) or path,
+                status_code=status_code,
+                latency_ms=latency_ms,
+                user_id=_user_id(scope),
+                db_queries=summary["db_queries"],
+                db_time_ms=summary["db_time_ms"],
+                timings=timings.as_dict(),
+            )
+            
+            # 같은 문장이 반복 실행된 경우 N+1 의심 경고
+            for suspect in summary["db_n_plus_one"]:
+                logger.warning(
+                    f"N+1 의심: {method} {path} - {suspect['count']}회 실행"
+                    f" ({suspect['call_site']}): {suspect['sql']}"
+                )
+
+
+def _server_timing_requested(scope: Scope) -> bool:
+    """Server-Timing 헤더를 붙일 요청인지 확인 (설정으로 켜져 있거나 요청 헤더가 토큰과 일치)"""
+    if settings.SERVER_TIMING_ENABLED:
+        return True
+    if not settings.SERVER_TIMING_TOKEN:
+        return False
+    for name, value in scope["headers"]:
+        if name == b"x-server-timing":
+            return hmac.compare_digest(value, settings.SERVER_TIMING_TOKEN.encode())
+    return False
+
+
+def _user_id(scope: Scope) -> Optional[str]:
+    """인증 미들웨어/인증 의존성이 확인한 사용자 ID"""
+    user_id = scope.get("state", {}).get("user_id")
+    if user_id is None and SCOPE_KEY in scope:
+        user_id = scope[SCOPE_KEY][1].get("sub")
+    return user_id
@@ -0,0 +1,48 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.observability import (
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+    route_template,
+)
+
+# 일치하는 라우트가 없는 요청의 라우트 레이블 (요청 경로를 그대로 쓰면 레이블 종류가 무한히 늘어남)
+UNMATCHED_ROUTE = "<unmatched>"
+
+class MetricsMiddleware:
+    """
+    요청 메트릭 수집 미들웨어 (순수 ASGI)
+    
+    처리 중인 요청 수, 라우트 템플릿/상태 코드별 요청 수와 처리 시간 히스토그램을 기록합니다.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # 응답을 시작하기 전에 예외가 나면 500으로 기록
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        http_requests_in_flight.inc()
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start_time
+            http_requests_in_flight.dec()
+            method = scope["method"]
+            route = route_template(scope) or UNMATCHED_ROUTE
+            http_requests_total.inc(method, route, str(status_code))
+            http_request_duration_seconds.observe(elapsed, method, route)
@@ -0,0 +1,56 @@
+import math
+import time
+from http.cookies import SimpleCookie
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.database.routing import primary_pin_active, request_routing
+
+# 쓰기 이후 읽기를 주 데이터베이스로 고정하는 만료 시각 쿠키
+PRIMARY_PIN_COOKIE = "db_primary_until"
+
+class ReadYourWritesMiddleware:
+    """
+    읽기 복제본 사용 시 read-your-writes 보장을 위한 미들웨어 (순수 ASGI)
+
+    요청 안의 모든 세션이 라우팅 상태를 공유해, 쓰기 이후의 조회는 주 데이터베이스로 보냅니다.
+    쓰기가 있었던 요청의 응답에는 DB_REPLICA_STICKY_SECONDS 동안 유효한 쿠키를 붙여
+    복제 지연 중에 들어오는 같은 클라이언트의 다음 요청도 주 데이터베이스에서 읽도록 합니다.
+    쿠키는 응답 시작 시점까지의 쓰기를 기준으로 붙입니다 (본문 스트리밍 중의 쓰기는 제외).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        pinned = primary_pin_active(HTTPConnection(scope).cookies.get(PRIMARY_PIN_COOKIE))
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and routing.wrote
+                and settings.DB_REPLICA_STICKY_SECONDS > 0
+            ):
+                headers = MutableHeaders(scope=message)
+                headers.append("set-cookie", _primary_pin_cookie())
+            await send(message)
+
+        with request_routing(pinned=pinned) as routing:
+            await self.app(scope, receive, send_wrapper)
+
+
+def _primary_pin_cookie() -> str:
+    """DB_REPLICA_STICKY_SECONDS 뒤에 만료되는 읽기 고정 쿠키 (Set-Cookie 값)"""
+    cookie: SimpleCookie = SimpleCookie()
+    cookie[PRIMARY_PIN_COOKIE] = str(time.time() + settings.DB_REPLICA_STICKY_SECONDS)
+    cookie[PRIMARY_PIN_COOKIE]["max-age"] = math.ceil(settings.DB_REPLICA_STICKY_SECONDS)
+    cookie[PRIMARY_PIN_COOKIE]["path"] = "/"
+    cookie[PRIMARY_PIN_COOKIE]["httponly"] = True
+    cookie[PRIMARY_PIN_COOKIE]["samesite"] = "lax"
+    return cookie.output(header="").strip()
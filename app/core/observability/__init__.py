@@ -0,0 +1,65 @@
+from app.core.observability.logs import (
+    JsonFormatter,
+    AccessLogSampler,
+    access_log_sampler,
+    log_access,
+    route_template,
+    setup_logging,
+    shutdown_logging,
+    get_logging_stats,
+)
+from app.core.observability.metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    registry,
+    metrics_exporter,
+    metrics_access_allowed,
+    render_metrics,
+    http_requests_total,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    celery_enqueue_seconds,
+    celery_enqueue_errors_total,
+)
+from app.core.observability.timing import (
+    RequestTimings,
+    TimedJSONResponse,
+    collect_timings,
+    get_request_timings,
+    record_timing,
+    timed,
+)
+
+__all__ = [
+    "JsonFormatter",
+    "AccessLogSampler",
+    "access_log_sampler",
+    "log_access",
+    "route_template",
+    "setup_logging",
+    "shutdown_logging",
+    "get_logging_stats",
+    "METRICS_CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "registry",
+    "metrics_exporter",
+    "metrics_access_allowed",
+    "render_metrics",
+    "http_requests_total",
+    "http_request_duration_seconds",
+    "http_requests_in_flight",
+    "celery_enqueue_seconds",
+    "celery_enqueue_errors_total",
+    "RequestTimings",
+    "TimedJSONResponse",
+    "collect_timings",
+    "get_request_timings",
+    "record_timing",
+    "timed",
+]
@@ -0,0 +1,311 @@
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+
+from app.core.config import settings
+
+# 비차단 로깅
+#
+# 요청을 처리하는 스레드(이벤트 루프)는 기록을 메모리 큐에 넣기만 하고, 실제 출력은
+# 백그라운드 QueueListener 스레드가 합니다. 출력이 느려져도(stdout 파이프, 디스크) 요청 지연으로
+# 번지지 않으며, 큐가 가득 차면 기다리지 않고 기록을 버린 뒤 개수를 셉니다.
+# 접근 로그는 요청마다 JSON 한 줄이며 라우트별 비율로 샘플링하되, 느린 요청과 오류 응답은
+# 항상 기록합니다.
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# 접근 로그 로거 이름
+ACCESS_LOGGER = "app.access"
+
+# LogRecord 기본 속성 (나머지는 extra로 전달된 필드로 보고 JSON에 포함)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+# 자체 핸들러를 가진 서버 로거 (큐를 거치도록 핸들러를 교체)
+_SERVER_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access", "gunicorn.error", "gunicorn.access")
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 기록을 JSON 한 줄로 변환 (extra로 전달한 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc_info"] = record.exc_text
+        if record.stack_info:
+            data["stack_info"] = record.stack_info
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    큐가 가득 차면 기다리지 않고 기록을 버리는 QueueHandler
+
+    메시지와 예외는 기록한 스레드에서 문자열로 만들어 두므로 출력 스레드의 포맷터가
+    text/JSON 어느 쪽이든 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class AccessLogSampler:
+    """라우트별 비율로 접근 로그를 샘플링 (느린 요청과 오류 응답은 항상 기록)"""
+
+    def __init__(
+        self,
+        *,
+        default_rate: float,
+        route_rates: Dict[str, float],
+        slow_ms: float,
+        error_status: int,
+    ):
+        """
+        샘플러 초기화
+
+        Args:
+            default_rate: 기본 기록 비율 (0~1)
+            route_rates: 라우트 템플릿별 기록 비율
+            slow_ms: 이보다 오래 걸린 요청은 항상 기록 (밀리초)
+            error_status: 이 상태 코드 이상은 항상 기록
+        """
+        self.default_rate = default_rate
+        self.route_rates = route_rates
+        self.slow_ms = slow_ms
+        self.error_status = error_status
+
+    @staticmethod
+    def parse_rates(spec: str) -> Dict[str, float]:
+        """
+        "라우트=비율" 목록(쉼표 구분)을 딕셔너리로 변환
+
+        Args:
+            spec: 설정 문자열 (예: "/api/v1/health=0,/api/v1/users/me=0.1")
+
+        Returns:
+            라우트 템플릿별 기록 비율
+        """
+        rates = {}
+        for item in spec.split(","):
+            route, sep, rate = item.strip().rpartition("=")
+            if sep and route:
+                rates[route.strip()] = float(rate)
+        return rates
+
+    def should_log(self, route: str, status_code: int, latency_ms: float) -> bool:
+        """
+        접근 로그 기록 여부 결정
+
+        Args:
+            route: 라우트 템플릿 (예: /api/v1/users/{user_id})
+            status_code: 응답 상태 코드
+            latency_ms: 처리 시간 (밀리초)
+
+        Returns:
+            기록 여부
+        """
+        if status_code >= self.error_status or latency_ms >= self.slow_ms:
+            return True
+        rate = self.route_rates.get(route, self.default_rate)
+        return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
+def route_template(scope: MutableMapping[str, Any]) -> Optional[str]:
+    """
+    요청과 일치한 라우트의 전체 경로 템플릿 (예: /api/v1/users/{user_id})
+
+    라우팅이 끝난 뒤에 호출해야 하며, 일치하는 라우트가 없으면 None을 반환합니다.
+    include_router가 라우트를 복사하지 않는 FastAPI 버전은 scope["route"]의 경로에
+    상위 라우터 접두사가 빠져 있으므로 FastAPI가 기록한 전체 경로를 먼저 사용합니다.
+
+    Args:
+        scope: ASGI scope
+
+    Returns:
+        경로 템플릿 또는 None
+    """
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    path = getattr(context, "path_format", None)
+    if path is None:
+        path = getattr(scope.get("route"), "path", None)
+    return path
+
+
+access_log_sampler = AccessLogSampler(
+    default_rate=settings.LOG_ACCESS_SAMPLE_RATE,
+    route_rates=AccessLogSampler.parse_rates(settings.LOG_ACCESS_SAMPLE_RATES),
+    slow_ms=settings.LOG_SLOW_REQUEST_MS,
+    error_status=settings.LOG_ERROR_STATUS,
+)
+access_logger = logging.getLogger(ACCESS_LOGGER)
+
+
+def log_access(
+    *,
+    method: str,
+    route: str,
+    status_code: int,
+    latency_ms: float,
+    user_id: Optional[str] = None,
+    db_queries: int = 0,
+    db_time_ms: float = 0.0,
+    timings: Optional[Dict[str, float]] = None,
+) -> None:
+    """
+    요청 하나의 접근 로그 기록 (샘플링 규칙 적용)
+
+    Args:
+        method: HTTP 메서드
+        route: 라우트 템플릿 (일치하는 라우트가 없으면 요청 경로)
+        status_code: 응답 상태 코드
+        latency_ms: 처리 시간 (밀리초)
+        user_id: 인증된 사용자 ID
+        db_queries: 실행한 SQL 수
+        db_time_ms: SQL 실행 시간 합계 (밀리초)
+        timings: 구간별 처리 시간 (밀리초, Server-Timing 헤더와 같은 값)
+    """
+    if not access_logger.isEnabledFor(logging.INFO):
+        return
+    if not access_log_sampler.should_log(route, status_code, latency_ms):
+        return
+    access_logger.info(
+        "%s %s %s %.1fms",
+        method,
+        route,
+        status_code,
+        latency_ms,
+        extra={
+            "method": method,
+            "route": route,
+            "status": status_code,
+            "latency_ms": round(latency_ms, 2),
+            "user_id": user_id,
+            "db_queries": db_queries,
+            "db_time_ms": db_time_ms,
+            "timings": timings,
+        },
+    )
+
+
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+# 출력 스레드가 기록을 넘기는 핸들러 (출력 스레드를 다시 시작할 때 재사용)
+_output_handlers: Tuple[logging.Handler, ...] = ()
+
+
+def setup_logging(level: Optional[str] = None, fmt: Optional[str] = None) -> None:
+    """
+    루트 로거를 큐 기반 비차단 로깅으로 설정 (이미 설정되어 있으면 아무것도 하지 않음)
+
+    shutdown_logging으로 출력 스레드만 멈춘 경우(같은 프로세스에서 애플리케이션 수명 주기를
+    다시 시작하는 테스트 등)에는 기존 설정으로 출력 스레드를 다시 시작해 그동안 쌓인 기록도 출력합니다.
+
+    Args:
+        level: 로그 레벨 (기본값: LOG_LEVEL, 미지정 시 DEBUG 모드면 DEBUG 아니면 INFO)
+        fmt: 출력 형식 json 또는 text (기본값: LOG_FORMAT)
+    """
+    global _queue_handler, _listener, _output_handlers
+    if _listener is not None:
+        return
+    if _queue_handler is not None:
+        _listener = QueueListener(_queue_handler.queue, *_output_handlers, respect_handler_level=True)
+        _listener.start()
+        return
+
+    level = level or settings.LOG_LEVEL or ("DEBUG" if settings.DEBUG else "INFO")
+    fmt = fmt or settings.LOG_FORMAT
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+
+    _queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_MAXSIZE))
+    root = logging.getLogger()
+    root.handlers = [_queue_handler]
+    root.setLevel(level.upper())
+    for name in _SERVER_LOGGERS:
+        server_logger = logging.getLogger(name)
+        if server_logger.handlers:
+            server_logger.handlers = [_queue_handler]
+
+    _output_handlers = (output,)
+    _listener = QueueListener(_queue_handler.queue, *_output_handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 기록을 모두 출력하고 출력 스레드 종료 (이후 기록은 setup_logging으로 다시 시작할 때까지 큐에 쌓임)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _restart_after_fork() -> None:
+    """
+    fork된 자식 프로세스에서 출력 스레드 다시 시작
+
+    스레드는 fork되지 않으므로 prefork 서버/Celery 워커의 자식은 새 큐와 출력 스레드를 만듭니다.
+    """
+    global _listener
+    if _listener is None or _queue_handler is None:
+        return
+    _queue_handler.queue = queue.Queue(maxsize=settings.LOG_QUEUE_MAXSIZE)
+    _listener = QueueListener(
+        _queue_handler.queue, *_listener.handlers, respect_handler_level=True
+    )
+    _listener.start()
+
+
+os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """
+    로그 큐 상태 조회
+
+    Returns:
+        대기 중인 기록 수, 큐 크기, 큐가 가득 차 버린 기록 수
+    """
+    if _queue_handler is None:
+        return {"queued": 0, "maxsize": settings.LOG_QUEUE_MAXSIZE, "dropped": 0}
+    return {
+        "queued": _queue_handler.queue.qsize(),
+        "maxsize": settings.LOG_QUEUE_MAXSIZE,
+        "dropped": _queue_handler.dropped,
+    }
@@ -0,0 +1,643 @@
+import glob
+import hmac
+import ipaddress
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 내 메트릭
+#
+# 카운터/게이지/고정 구간 히스토그램을 레이블 값 튜플별로 메모리에 누적하고
+# /metrics에서 Prometheus 텍스트 형식으로 내보냅니다. 기록은 잠금 한 번과 딕셔너리 갱신뿐이라
+# 요청당 몇 마이크로초 안에 끝납니다.
+# 풀 상태나 캐시 적중 수처럼 이미 다른 모듈이 세고 있는 값은 수집기(collector)가
+# 내보낼 때 읽어 옵니다.
+#
+# 여러 워커 프로세스로 실행할 때는 METRICS_MULTIPROC_DIR를 지정하세요. 각 워커가
+# METRICS_FLUSH_SECONDS마다 자기 스냅샷을 파일로 쓰고, /metrics를 받은 워커가 모든 파일을 합산합니다.
+# 카운터/히스토그램은 종료된 워커의 값까지 합하고 게이지는 살아 있는 워커의 값만 합합니다.
+# 워커가 시작할 때 이전 실행에서 남은 파일(종료된 프로세스가 가장 오래된 현재 워커보다 먼저 쓴 파일)을
+# 지우므로 이전 실행의 카운터가 섞이지 않습니다.
+#
+# /metrics는 METRICS_TOKEN과 일치하는 Bearer 토큰이나 METRICS_ALLOWED_IPS에 속한 클라이언트만
+# 읽을 수 있습니다 (metrics_access_allowed).
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 현재 프로세스 시작 시각 (/proc에서 읽지 못할 때 사용)
+_PROCESS_STARTED = time.time()
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 메트릭 스냅샷 (이름, 종류, 설명, 레이블 이름, [(레이블 값, 값)])
+Family = Dict[str, Any]
+
+
+def family(
+    name: str,
+    type: str,
+    help: str,
+    labelnames: Sequence[str],
+    samples: Iterable[Tuple[Sequence[str], Any]],
+) -> Family:
+    """
+    수집기가 반환하는 메트릭 스냅샷 생성
+
+    Args:
+        name: 메트릭 이름
+        type: counter, gauge, histogram
+        help: 설명
+        labelnames: 레이블 이름 목록
+        samples: (레이블 값 목록, 값) 목록 (히스토그램 값은 {"buckets", "counts", "sum"})
+
+    Returns:
+        메트릭 스냅샷
+    """
+    return {
+        "name": name,
+        "type": type,
+        "help": help,
+        "labelnames": list(labelnames),
+        "samples": [[list(labels), value] for labels, value in samples],
+    }
+
+
+class Metric:
+    """레이블 값 튜플별로 값을 누적하는 메트릭"""
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        """
+        메트릭 초기화
+
+        Args:
+            name: 메트릭 이름
+            help: 설명
+            labelnames: 레이블 이름 목록 (기록할 때 같은 순서로 값을 전달)
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _export(self, value: Any) -> Any:
+        return value
+
+    def collect(self) -> Family:
+        """현재 값의 스냅샷"""
+        with self._lock:
+            samples = [(labels, self._export(value)) for labels, value in self._values.items()]
+        return family(self.name, self.type, self.help, self.labelnames, samples)
+
+
+class Counter(Metric):
+    """증가만 하는 카운터"""
+    type = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """
+        카운터 증가
+
+        Args:
+            labels: 레이블 값 (labelnames 순서)
+            amount: 증가량
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+
+class Gauge(Metric):
+    """증감하거나 직접 지정하는 게이지"""
+    type = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """게이지 증가"""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """게이지 감소"""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def set(self, value: float, *labels: str) -> None:
+        """게이지 값 지정"""
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(Metric):
+    """고정 구간 히스토그램"""
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        히스토그램 초기화
+
+        Args:
+            name: 메트릭 이름
+            help: 설명
+            labelnames: 레이블 이름 목록
+            buckets: 구간 상한 목록 (오름차순, +Inf는 자동 추가)
+        """
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        """
+        값 기록
+
+        Args:
+            value: 관측 값
+            labels: 레이블 값 (labelnames 순서)
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def _export(self, value: Any) -> Any:
+        return {"buckets": list(self.buckets), "counts": list(value[0]), "sum": value[1]}
+
+
+class MetricsRegistry:
+    """메트릭과 수집기 목록"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Any:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """카운터 생성 (같은 이름이 있으면 기존 메트릭 반환)"""
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """게이지 생성 (같은 이름이 있으면 기존 메트릭 반환)"""
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """히스토그램 생성 (같은 이름이 있으면 기존 메트릭 반환)"""
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def collector(
+        self, func: Callable[[], Iterable[Family]]
+    ) -> Callable[[], Iterable[Family]]:
+        """
+        내보낼 때마다 호출할 수집기 등록 (데코레이터로 사용)
+
+        Args:
+            func: 메트릭 스냅샷 목록을 반환하는 함수
+
+        Returns:
+            등록한 함수
+        """
+        self._collectors.append(func)
+        return func
+
+    def collect(self) -> List[Family]:
+        """
+        현재 프로세스의 모든 메트릭 스냅샷
+
+        Returns:
+            메트릭 스냅샷 목록 (실패한 수집기는 건너뜀)
+        """
+        families = [metric.collect() for metric in list(self._metrics.values())]
+        for collector in self._collectors:
+            try:
+                families.extend(collector())
+            except Exception as e:
+                logger.warning(f"메트릭 수집 실패 ({collector.__name__}): {e}")
+        return families
+
+
+def merge_families(snapshots: Iterable[Tuple[List[Family], bool]]) -> List[Family]:
+    """
+    여러 프로세스의 스냅샷 합산
+
+    Args:
+        snapshots: (메트릭 스냅샷 목록, 프로세스 생존 여부) 목록
+
+    Returns:
+        합산한 메트릭 스냅샷 목록 (게이지는 살아 있는 프로세스만 합산)
+    """
+    merged: Dict[str, Family] = {}
+    values: Dict[str, Dict[Tuple[str, ...], Any]] = {}
+    for families, alive in snapshots:
+        for item in families:
+            if item["type"] == "gauge" and not alive:
+                continue
+            name = item["name"]
+            if name not in merged:
+                merged[name] = {**item, "samples": []}
+                values[name] = {}
+            target = values[name]
+            for labels, value in item["samples"]:
+                key = tuple(labels)
+                current = target.get(key)
+                if current is None:
+                    target[key] = (
+                        {**value, "counts": list(value["counts"])} if isinstance(value, dict) else value
+                    )
+                elif isinstance(value, dict):
+                    current["counts"] = [a + b for a, b in zip(current["counts"], value["counts"])]
+                    current["sum"] += value["sum"]
+                else:
+                    target[key] = current + value
+    for name, item in merged.items():
+        item["samples"] = [[list(key), value] for key, value in values[name].items()]
+    return list(merged.values())
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[Any], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def render_text(families: Iterable[Family]) -> str:
+    """
+    메트릭 스냅샷을 Prometheus 텍스트 형식으로 변환
+
+    Args:
+        families: 메트릭 스냅샷 목록
+
+    Returns:
+        Prometheus 텍스트
+    """
+    lines: List[str] = []
+    for item in sorted(families, key=lambda f: f["name"]):
+        name, names = item["name"], item["labelnames"]
+        lines.append(f"# HELP {name} {item['help']}")
+        lines.append(f"# TYPE {name} {item['type']}")
+        for labels, value in item["samples"]:
+            if item["type"] != "histogram":
+                lines.append(f"{name}{_labels(names, labels)} {float(value)}")
+                continue
+            cumulative = 0
+            uppers = [*map(str, map(float, value["buckets"])), "+Inf"]
+            for upper, count in zip(uppers, value["counts"]):
+                cumulative += count
+                le = 'le="' + upper + '"'
+                lines.append(f"{name}_bucket{_labels(names, labels, le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(names, labels)} {float(value['sum'])}")
+            lines.append(f"{name}_count{_labels(names, labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def metrics_access_allowed(authorization: Optional[str], client_host: Optional[str]) -> bool:
+    """
+    /metrics 접근 허용 여부
+
+    Authorization 헤더가 METRICS_TOKEN과 일치하는 Bearer 토큰이거나 클라이언트 IP가
+    METRICS_ALLOWED_IPS(쉼표로 구분한 주소/CIDR)에 속하면 허용합니다.
+    프록시 뒤에서는 프록시의 IP가 보이므로 토큰을 사용하세요.
+
+    Args:
+        authorization: Authorization 요청 헤더
+        client_host: 클라이언트 IP
+
+    Returns:
+        허용 여부
+    """
+    if settings.METRICS_TOKEN and authorization:
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(
+            token.strip().encode(), settings.METRICS_TOKEN.encode()
+        ):
+            return True
+    if not client_host or not settings.METRICS_ALLOWED_IPS:
+        return False
+    try:
+        address = ipaddress.ip_address(client_host)
+    except ValueError:
+        return False
+    for entry in settings.METRICS_ALLOWED_IPS.split(","):
+        try:
+            if entry.strip() and address in ipaddress.ip_network(entry.strip(), strict=False):
+                return True
+        except ValueError:
+            logger.warning(f"METRICS_ALLOWED_IPS 항목을 해석하지 못했습니다: {entry}")
+    return False
+
+
+def _process_started(pid: int) -> Optional[float]:
+    """프로세스 시작 시각 (유닉스 시간, /proc이 없는 환경이면 None)"""
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+            # 프로세스 이름에 공백이 있을 수 있으므로 ")" 뒤부터 나눔 (starttime은 22번째 필드)
+            started_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/stat", encoding="utf-8") as f:
+            boot_time = next(float(line.split()[1]) for line in f if line.startswith("btime "))
+    except (OSError, IndexError, ValueError, StopIteration):
+        return None
+    return boot_time + started_ticks / os.sysconf("SC_CLK_TCK")
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsExporter:
+    """
+    메트릭 내보내기
+
+    directory가 있으면 스냅샷을 주기적으로 파일로 쓰고, 내보낼 때 모든 워커의 파일을 합산합니다.
+    """
+
+    def __init__(self, registry: MetricsRegistry, directory: Optional[str], interval: float):
+        """
+        내보내기 초기화
+
+        Args:
+            registry: 메트릭 목록
+            directory: 워커별 스냅샷을 저장할 디렉터리 (None이면 현재 프로세스 값만 내보냄)
+            interval: 스냅샷 파일을 쓰는 간격 (초)
+        """
+        self.registry = registry
+        self.directory = directory
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def _path(self, pid: int) -> str:
+        return os.path.join(self.directory, f"metrics_{pid}.json")
+
+    def remove_stale(self) -> int:
+        """
+        이전 실행에서 남은 스냅샷 파일 삭제
+
+        종료된 프로세스의 파일 중 가장 오래된 현재 워커(자신 포함)가 시작되기 전에 쓰인 파일만 지웁니다.
+        현재 실행 중에 종료된 워커의 카운터는 남겨 합계가 줄어들지 않게 합니다.
+
+        Returns:
+            삭제한 파일 수
+        """
+        if self.directory is None:
+            return 0
+        files = []
+        run_started = _process_started(os.getpid()) or _PROCESS_STARTED
+        for path in glob.glob(os.path.join(self.directory, "metrics_*")):
+            try:
+                pid = int(os.path.basename(path)[len("metrics_"):].split(".", 1)[0])
+            except ValueError:
+                continue
+            if pid != os.getpid() and _pid_alive(pid):
+                run_started = min(run_started, _process_started(pid) or run_started)
+            elif pid != os.getpid():
+                files.append(path)
+        removed = 0
+        for path in files:
+            try:
+                if os.path.getmtime(path) < run_started:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                # 다른 워커가 먼저 지운 경우
+                continue
+        return removed
+
+    def write(self) -> None:
+        """현재 프로세스의 스냅샷을 파일로 저장 (다른 워커가 읽는 도중에도 안전하도록 교체 방식)"""
+        if self.directory is None:
+            return
+        path = self._path(os.getpid())
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.registry.collect(), f)
+        os.replace(tmp_path, path)
+
+    def _read_all(self) -> List[Tuple[List[Family], bool]]:
+        snapshots = []
+        own_pid = os.getpid()
+        for path in glob.glob(os.path.join(self.directory, "metrics_*.json")):
+            try:
+                pid = int(os.path.basename(path)[len("metrics_"):-len(".json")])
+                if pid == own_pid:
+                    continue
+                with open(path, encoding="utf-8") as f:
+                    snapshots.append((json.load(f), _pid_alive(pid)))
+            except (ValueError, OSError) as e:
+                logger.warning(f"메트릭 스냅샷을 읽지 못했습니다 ({path}): {e}")
+        return snapshots
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 생성
+
+        Returns:
+            현재 프로세스(멀티프로세스 모드면 모든 워커를 합산한) 메트릭
+        """
+        own = self.registry.collect()
+        if self.directory is None:
+            return render_text(own)
+        return render_text(merge_families([(own, True), *self._read_all()]))
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.interval):
+            try:
+                self.write()
+            except OSError as e:
+                logger.warning(f"메트릭 스냅샷 저장 실패: {e}")
+
+    def start(self) -> None:
+        """주기적인 스냅샷 저장 시작 (멀티프로세스 모드에서만)"""
+        if self.directory is None or self._thread is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        removed = self.remove_stale()
+        if removed:
+            logger.info(f"이전 실행의 메트릭 스냅샷 {removed}개를 삭제했습니다")
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """스냅샷 저장 중지 (종료 직전 값을 한 번 더 저장)"""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+            try:
+                self.write()
+            except OSError as e:
+                logger.warning(f"메트릭 스냅샷 저장 실패: {e}")
+
+
+registry = MetricsRegistry()
+metrics_exporter = MetricsExporter(
+    registry, settings.METRICS_MULTIPROC_DIR, settings.METRICS_FLUSH_SECONDS
+)
+
+# HTTP 요청
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (초)", ("method", "route")
+)
+http_requests_in_flight = registry.gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+
+# Celery 태스크 등록 (브로커로 보내는 데 걸린 시간)
+celery_enqueue_seconds = registry.histogram(
+    "celery_enqueue_seconds",
+    "Celery 태스크를 브로커에 보내는 데 걸린 시간 (초)",
+    ("task",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+celery_enqueue_errors_total = registry.counter(
+    "celery_enqueue_errors_total", "Celery 태스크 등록 실패 수", ("task",)
+)
+
+
+@registry.collector
+def _collect_db_pools() -> List[Family]:
+    """커넥션 풀 상태와 누적 통계"""
+    from app.core.database.pool import get_pool_stats
+
+    pools = get_pool_stats()
+    families = [
+        family(
+            f"db_pool_{key}",
+            "gauge",
+            f"커넥션 풀 {key}",
+            ("pool",),
+            [((pool["name"],), pool[key]) for pool in pools if key in pool],
+        )
+        for key in ("size", "checked_out", "checked_in", "overflow")
+    ]
+    families += [
+        family(
+            f"db_pool_{key}_total",
+            "counter",
+            f"커넥션 풀 누적 {key}",
+            ("pool",),
+            [((pool["name"],), pool[key]) for pool in pools],
+        )
+        for key in ("checkouts", "checkout_timeouts", "connects", "invalidations")
+    ]
+    wait_samples = []
+    for pool in pools:
+        wait = pool["wait_ms"]
+        uppers = [upper for upper in wait["buckets"] if upper != "+Inf"]
+        cumulative = list(wait["buckets"].values())
+        counts = [b - a for a, b in zip([0, *cumulative], cumulative)]
+        wait_samples.append(
+            (
+                (pool["name"],),
+                {
+                    "buckets": [float(upper) / 1000 for upper in uppers],
+                    "counts": counts,
+                    "sum": wait["sum"] / 1000,
+                },
+            )
+        )
+    families.append(
+        family(
+            "db_pool_checkout_wait_seconds",
+            "histogram",
+            "커넥션을 얻기까지 기다린 시간 (초)",
+            ("pool",),
+            wait_samples,
+        )
+    )
+    return families
+
+
+@registry.collector
+def _collect_caches() -> List[Family]:
+    """엔티티/인증 주체/토큰 클레임 캐시 적중 수 (적중률은 hits / (hits + misses))"""
+    from app.core.cache import get_cache_stats, principal_cache, supabase_principal_cache
+    from app.core.utils.tokens import token_claims_cache
+
+    hits, misses, sizes = [], [], []
+    for stats in get_cache_stats():
+        name = stats["namespace"]
+        hits += [((name, "local"), stats["local_hits"]), ((name, "remote"), stats["remote_hits"])]
+        misses.append(((name,), stats["misses"]))
+        sizes.append(((name,), stats["local_size"]))
+    for name, cache in (
+        ("principals", principal_cache),
+        ("supabase_principals", supabase_principal_cache),
+        ("token_claims", token_claims_cache),
+    ):
+        stats = cache.stats()
+        hits.append(((name, "local"), stats["hits"]))
+        misses.append(((name,), stats["misses"]))
+        sizes.append(((name,), stats["local_size"]))
+    return [
+        family("cache_hits_total", "counter", "캐시 적중 수", ("cache", "tier"), hits),
+        family("cache_misses_total", "counter", "캐시 미스 수", ("cache",), misses),
+        family("cache_entries", "gauge", "프로세스 내 캐시 항목 수", ("cache",), sizes),
+    ]
+
+
+@registry.collector
+def _collect_runtime() -> List[Family]:
+    """비밀번호 해싱 풀, 로그 큐, 토큰 폐기 목록 상태"""
+    from app.core.cache import token_revocations
+    from app.core.observability.logs import get_logging_stats
+    from app.core.utils.passwords import get_password_hash_pool_stats
+
+    hashing = get_password_hash_pool_stats()
+    logging_stats = get_logging_stats()
+    revocations = token_revocations.stats()
+    return [
+        family("password_hash_pending", "gauge", "대기 중인 비밀번호 해싱 작업 수", (), [((), hashing["pending"])]),
+        family("password_hash_completed_total", "counter", "완료한 비밀번호 해싱 작업 수", (), [((), hashing["completed"])]),
+        family("password_hash_rejected_total", "counter", "풀이 가득 차 거절한 비밀번호 해싱 작업 수", (), [((), hashing["rejected"])]),
+        family("log_queue_size", "gauge", "출력을 기다리는 로그 기록 수", (), [((), logging_stats["queued"])]),
+        family("log_records_dropped_total", "counter", "로그 큐가 가득 차 버린 기록 수", (), [((), logging_stats["dropped"])]),
+        family("revoked_tokens", "gauge", "프로세스 내 폐기된 토큰 수", (), [((), revocations["revoked_tokens"])]),
+        family("revoked_users", "gauge", "프로세스 내 토큰이 폐기된 사용자 수", (), [((), revocations["revoked_users"])]),
+    ]
+
+
+def render_metrics() -> str:
+    """
+    /metrics 응답 본문 생성
+
+    Returns:
+        Prometheus 텍스트
+    """
+    return metrics_exporter.render()
@@ -0,0 +1,135 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from fastapi.responses import JSONResponse
+
+# 요청별 처리 시간 구간
+#
+# 인증, 데이터베이스, 비밀번호 해싱, Supabase 요청, 응답 렌더링 등이 걸린 시간을 요청 단위로 모아
+# Server-Timing 헤더와 접근 로그의 timings 필드로 내보냅니다. 구간은 겹칠 수 있습니다
+# (예: 인증 중에 실행한 사용자 조회는 auth와 db 양쪽에 포함).
+# 요청 밖(백그라운드 작업, 비밀번호 해싱 프로세스 등)에서는 기록하지 않고 바로 반환합니다.
+
+
+class RequestTimings:
+    """한 요청에서 구간 이름별로 누적한 처리 시간"""
+
+    def __init__(self):
+        # 구간 이름 -> [합계(밀리초), 횟수]
+        self._spans: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, duration_ms: float, count: int = 1) -> None:
+        """
+        구간 시간 추가
+
+        Args:
+            name: 구간 이름 (auth, db, password, supabase, render 등)
+            duration_ms: 걸린 시간 (밀리초)
+            count: 횟수
+        """
+        with self._lock:
+            span = self._spans.get(name)
+            if span is None:
+                self._spans[name] = [duration_ms, count]
+            else:
+                span[0] += duration_ms
+                span[1] += count
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        구간별 합계
+
+        Returns:
+            구간 이름별 처리 시간 (밀리초)
+        """
+        with self._lock:
+            return {name: round(span[0], 2) for name, span in self._spans.items()}
+
+    def header(self, total_ms: Optional[float] = None) -> str:
+        """
+        Server-Timing 헤더 값 생성
+
+        Args:
+            total_ms: 요청 전체 처리 시간 (지정하면 total 구간으로 추가)
+
+        Returns:
+            헤더 값 (예: auth;dur=1.20, db;dur=3.40;desc="2 calls", HTTP 헤더이므로 ASCII만 사용)
+        """
+        with self._lock:
+            spans = list(self._spans.items())
+        entries = [
+            f'{name};dur={duration:.2f}' + (f';desc="{int(count)} calls"' if count > 1 else "")
+            for name, (duration, count) in spans
+        ]
+        if total_ms is not None:
+            entries.append(f"total;dur={total_ms:.2f}")
+        return ", ".join(entries)
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def collect_timings() -> Iterator[RequestTimings]:
+    """
+    블록 안(요청 하나)의 처리 시간 구간 수집
+
+    Returns:
+        수집 중인 구간 (블록 안에서 계속 갱신됨)
+    """
+    timings = RequestTimings()
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def get_request_timings() -> Optional[RequestTimings]:
+    """현재 요청의 처리 시간 구간 (요청 밖이면 None)"""
+    return _request_timings.get()
+
+
+def record_timing(name: str, duration_ms: float, count: int = 1) -> None:
+    """
+    현재 요청에 구간 시간 추가 (요청 밖이면 무시)
+
+    Args:
+        name: 구간 이름
+        duration_ms: 걸린 시간 (밀리초)
+        count: 횟수
+    """
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add(name, duration_ms, count)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """
+    블록 실행 시간을 현재 요청의 구간으로 기록
+
+    Args:
+        name: 구간 이름
+    """
+    timings = _request_timings.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, (time.perf_counter() - started) * 1000)
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSON 직렬화 시간을 현재 요청의 render 구간으로 기록하는 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        with timed("render"):
+            return super().render(content)
@@ -1,3 +1,11 @@
 from app.core.repositories.base import BaseRepository
+from app.core.repositories.async_base import AsyncBaseRepository
+from app.core.repositories.loader import RepositoryLoader, get_loader, loader_dependency
 
-__all__ = ["BaseRepository"] 
\ No newline at end of file
+__all__ = [
+    "BaseRepository",
+    "AsyncBaseRepository",
+    "RepositoryLoader",
+    "get_loader",
+    "loader_dependency",
+]
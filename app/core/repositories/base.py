@@ -1,46 +1,68 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
-from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.engine import Engine
+from sqlalchemy import inspect, select
+from sqlalchemy.sql import Select
 
-# 모델 타입 변수
-ModelType = TypeVar("ModelType")
-# 생성 스키마 타입 변수
-CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
-# 업데이트 스키마 타입 변수
-UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+from app.core.database.search import has_fts_table, search_condition
+from app.core.database.transaction import persist
+from app.core.config import settings
+from app.core.repositories.mixins import CreateSchemaType, ModelType, SQLRepositoryMixin, UpdateSchemaType
+from app.core.repositories.statements import count_statement, lookup_many_statement, lookup_statement
+from app.core.utils.common import chunked
+from app.core.utils.counting import (
+    CountStrategy,
+    estimated_count_statement,
+    get_cached_count,
+    set_cached_count,
+    usable_estimate,
+)
+from app.core.utils.pagination import split_keyset_page
+from app.core.utils.filtering import QuerySpec
 
-class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+class BaseRepository(SQLRepositoryMixin[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
     기본 저장소 클래스
     
     CRUD 작업을 위한 기본 메서드를 제공합니다.
+    설정, 입력 변환, 캐시 직렬화와 SQL 문 생성은 SQLRepositoryMixin에 있고
+    여기서는 동기 세션에서 실행/flush/커밋만 합니다.
     """
-    def __init__(self, model: Type[ModelType]):
-        """
-        저장소 초기화
-        
-        Args:
-            model: SQLAlchemy 모델 클래스
-        """
-        self.model = model
     
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
+    def get(
+        self, db: Session, id: Any, fields: Optional[Sequence[str]] = None
+    ) -> Optional[ModelType]:
         """
         ID로 항목 조회
         
         Args:
             db: 데이터베이스 세션
             id: 항목 ID
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
             
         Returns:
             조회된 항목 또는 None
         """
-        return db.query(self.model).filter(self.model.id == id).first()
+        if fields:
+            rows = self._fetch(db, self._select(fields).where(self.model.id == id), fields)
+            return rows[0] if rows else None
+        if self.cache is not None:
+            data = self.cache.get(id)
+            if data is not None:
+                return self._from_cache_data(db, data)
+        db_obj = db.scalars(lookup_statement(self.model, "id"), {"value": id}).first()
+        if db_obj is not None:
+            self._cache_store(db, db_obj)
+        return db_obj
     
     def get_multi(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        spec: Optional[QuerySpec] = None,
     ) -> List[ModelType]:
         """
         여러 항목 조회
@@ -49,44 +71,114 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db: 데이터베이스 세션
             skip: 건너뛸 항목 수
             limit: 최대 항목 수
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
+            spec: 필터 조건과 정렬 순서 (기본값: 조건 없이 ID 순)
             
         Returns:
             항목 목록
         """
-        return db.query(self.model).offset(skip).limit(limit).all()
+        stmt = self._list_statement(skip=skip, limit=limit, fields=fields, spec=spec)
+        return self._fetch(db, stmt, fields)
+    
+    def stream_multi(
+        self,
+        db: Session,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        전체 항목을 ID 순으로 스트리밍 조회
+        
+        yield_per로 batch_size 행씩 가져오므로 (PostgreSQL에서는 서버 측 커서 사용)
+        테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+        세션은 반복이 끝날 때까지 열려 있어야 합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
+            batch_size: 한 번에 가져올 행 수 (기본값: DB_STREAM_BATCH_SIZE)
+            
+        Returns:
+            항목 이터레이터
+        """
+        stmt = self._stream_statement(fields, batch_size or settings.DB_STREAM_BATCH_SIZE)
+        result = db.execute(stmt)
+        yield from (result.mappings() if fields else result.scalars())
     
-    def get_count(self, db: Session) -> int:
+    def get_count(
+        self,
+        db: Session,
+        *,
+        strategy: Optional[CountStrategy] = None,
+        spec: Optional[QuerySpec] = None,
+    ) -> Optional[int]:
         """
         항목 수 조회
         
         Args:
             db: 데이터베이스 세션
+            strategy: 계산 방식 (기본값: 저장소의 count_strategy)
+            spec: 필터 조건 (지정 시 조건에 맞는 항목 수를 정확히 계산)
             
         Returns:
-            항목 수
+            항목 수 또는 None (CountStrategy.NONE인 경우)
         """
-        return db.query(func.count(self.model.id)).scalar()
+        strategy = self._count_strategy(strategy)
+        if strategy == CountStrategy.NONE:
+            return None
+        stmt = self._filtered_count_statement(spec)
+        if stmt is not None:
+            return db.scalar(stmt)
+        
+        table_name = self.model.__table__.fullname
+        if strategy == CountStrategy.ESTIMATED:
+            stmt = estimated_count_statement(db.get_bind().dialect.name)
+            if stmt is not None:
+                estimate = usable_estimate(db.execute(stmt, {"table_name": table_name}).scalar())
+                if estimate is not None:
+                    return estimate
+        elif strategy == CountStrategy.CACHED:
+            count = get_cached_count(table_name)
+            if count is not None:
+                return count
+        
+        count = db.scalar(count_statement(self.model))
+        if strategy == CountStrategy.CACHED:
+            set_cached_count(table_name, count)
+        return count
     
-    def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
+    def create(
+        self, db: Session, *, obj_in: CreateSchemaType, commit: bool = False
+    ) -> ModelType:
         """
         항목 생성
         
         Args:
             db: 데이터베이스 세션
             obj_in: 생성할 항목 데이터
+            commit: 즉시 커밋할지 여부 (기본값: flush만 하고 커밋은 요청이 끝날 때 get_db가 수행)
             
         Returns:
             생성된 항목
         """
-        obj_in_data = jsonable_encoder(obj_in)
-        db_obj = self.model(**obj_in_data)
+        return self._create_row(db, self._prepare_create_data(obj_in), commit=commit)
+    
+    def _create_row(self, db: Session, row: Dict[str, Any], commit: bool = False) -> ModelType:
+        """_prepare_create_data로 변환을 마친 컬럼 딕셔너리로 항목 생성"""
+        db_obj = self.model(**row)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        persist(db, commit=commit)
+        self._refresh_expired(db, db_obj)
         return db_obj
     
     def update(
-        self, db: Session, *, db_obj: ModelType, obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+        self,
+        db: Session,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        commit: bool = False,
     ) -> ModelType:
         """
         항목 업데이트
@@ -95,40 +187,92 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db: 데이터베이스 세션
             db_obj: 업데이트할 기존 항목
             obj_in: 업데이트 데이터
+            commit: 즉시 커밋할지 여부 (기본값: flush만 하고 커밋은 요청이 끝날 때 get_db가 수행)
             
         Returns:
             업데이트된 항목
         """
-        obj_data = jsonable_encoder(db_obj)
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.model_dump(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        update_data = self._prepare_update_data(obj_in)
+        for field, value in update_data.items():
+            setattr(db_obj, field, value)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        persist(db, commit=commit)
+        self._invalidate(db, db_obj.id)
+        self._refresh_expired(db, db_obj)
         return db_obj
     
-    def remove(self, db: Session, *, id: Any) -> ModelType:
+    def update_by_id(
+        self,
+        db: Session,
+        *,
+        id: Any,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        where: Optional[Dict[str, Any]] = None,
+        commit: bool = False,
+    ) -> Optional[ModelType]:
         """
-        항목 삭제
+        ID로 항목 업데이트 (UPDATE ... RETURNING)
+        
+        기존 항목을 먼저 조회하지 않고 변경된 컬럼만 한 번의 쿼리로 갱신합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            id: 업데이트할 항목 ID
+            obj_in: 업데이트 데이터
+            where: 추가 조건 (필드 이름과 값, 일치하는 행만 갱신)
+            commit: 즉시 커밋할지 여부 (기본값: flush만 하고 커밋은 요청이 끝날 때 get_db가 수행)
+            
+        Returns:
+            업데이트된 항목 또는 None (조건에 맞는 항목이 없는 경우)
+        """
+        update_data = self._prepare_update_data(obj_in)
+        if not update_data:
+            return db.scalars(select(self.model).where(*self._build_id_criteria(id, where))).first()
+        
+        stmt = self._update_statement(id, where, update_data)
+        if db.get_bind().dialect.update_returning:
+            db_obj = db.scalars(
+                stmt.returning(self.model), execution_options={"populate_existing": True}
+            ).first()
+            persist(db, commit=commit)
+            self._invalidate(db, id)
+            return db_obj
+        # RETURNING을 지원하지 않는 데이터베이스는 갱신 후 다시 조회
+        result = db.execute(stmt)
+        persist(db, commit=commit)
+        self._invalidate(db, id)
+        if not result.rowcount:
+            return None
+        return self.get(db, id=id)
+    
+    def remove(self, db: Session, *, id: Any, commit: bool = False) -> Optional[ModelType]:
+        """
+        항목 삭제 (DELETE ... RETURNING)
         
         Args:
             db: 데이터베이스 세션
             id: 삭제할 항목 ID
+            commit: 즉시 커밋할지 여부 (기본값: flush만 하고 커밋은 요청이 끝날 때 get_db가 수행)
             
         Returns:
-            삭제된 항목
+            삭제된 항목 또는 None (항목이 없는 경우)
         """
-        obj = db.query(self.model).get(id)
-        db.delete(obj)
-        db.commit()
+        if not db.get_bind().dialect.delete_returning:
+            obj = db.get(self.model, id)
+            if obj is None:
+                return None
+            db.delete(obj)
+            persist(db, commit=commit)
+            self._invalidate(db, id)
+            return obj
+        obj = db.scalars(self._delete_statement(id)).first()
+        persist(db, commit=commit)
+        self._invalidate(db, id)
         return obj
     
-    def get_by_field(self, db: Session, field_name: str, value: Any) -> Optional[ModelType]:
+    def get_by_field(
+        self, db: Session, field_name: str, value: Any, *, use_cache: bool = True
+    ) -> Optional[ModelType]:
         """
         필드 값으로 항목 조회
         
@@ -136,14 +280,81 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db: 데이터베이스 세션
             field_name: 필드 이름
             value: 필드 값
+            use_cache: 엔티티 캐시 사용 여부 (False면 항상 데이터베이스에서 조회)
             
         Returns:
             조회된 항목 또는 None
         """
-        return db.query(self.model).filter(getattr(self.model, field_name) == value).first()
+        use_cache = use_cache and self.cache is not None and field_name in self.cache_fields
+        if use_cache:
+            data = self.cache.get_by_field(field_name, value)
+            if data is not None:
+                return self._from_cache_data(db, data)
+        db_obj = db.scalars(lookup_statement(self.model, field_name), {"value": value}).first()
+        if db_obj is not None and use_cache:
+            self._cache_store(db, db_obj)
+        return db_obj
+    
+    def get_many(self, db: Session, ids: Sequence[Any]) -> List[ModelType]:
+        """
+        ID 목록으로 여러 항목 조회
+        
+        캐시에 있는 항목은 캐시에서 복원하고, 나머지는 WHERE id IN (...) 한 번으로 조회합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            ids: 항목 ID 목록
+            
+        Returns:
+            조회된 항목 목록 (순서는 보장하지 않으며, 없는 ID는 제외)
+        """
+        found = []
+        missing = list(dict.fromkeys(ids))
+        if self.cache is not None:
+            pending = []
+            for id in missing:
+                data = self.cache.get(id)
+                if data is not None:
+                    found.append(self._from_cache_data(db, data))
+                else:
+                    pending.append(id)
+            missing = pending
+        for batch in chunked(missing, settings.DB_BULK_BATCH_SIZE):
+            db_objs = db.scalars(lookup_many_statement(self.model, "id"), {"values": batch}).all()
+            for db_obj in db_objs:
+                self._cache_store(db, db_obj)
+                found.append(db_obj)
+        return found
+    
+    def get_many_by_field(
+        self, db: Session, field_name: str, values: Sequence[Any]
+    ) -> List[ModelType]:
+        """
+        필드 값 목록으로 여러 항목 조회 (WHERE field IN (...))
+        
+        Args:
+            db: 데이터베이스 세션
+            field_name: 필드 이름
+            values: 필드 값 목록
+            
+        Returns:
+            조회된 항목 목록 (ID 순)
+        """
+        stmt = lookup_many_statement(self.model, field_name)
+        found = []
+        for batch in chunked(list(dict.fromkeys(values)), settings.DB_BULK_BATCH_SIZE):
+            found.extend(db.scalars(stmt, {"values": batch}).all())
+        return found
     
     def get_multi_by_field(
-        self, db: Session, field_name: str, value: Any, *, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        field_name: str,
+        value: Any,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[ModelType]:
         """
         필드 값으로 여러 항목 조회
@@ -154,14 +365,270 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             value: 필드 값
             skip: 건너뛸 항목 수
             limit: 최대 항목 수
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
+            
+        Returns:
+            항목 목록
+        """
+        stmt = self._field_list_statement(field_name, value, skip=skip, limit=limit, fields=fields)
+        return self._fetch(db, stmt, fields)
+    
+    def get_multi_keyset(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: str = "id",
+        fields: Optional[Sequence[str]] = None,
+        spec: Optional[QuerySpec] = None,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        커서 기반(키셋) 페이지네이션으로 여러 항목 조회
+        
+        OFFSET 없이 정렬 키 + ID 인덱스를 타므로 페이지 깊이와 무관하게 일정한 비용으로 조회합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            limit: 최대 항목 수
+            order_by: 정렬 기준 필드 (내림차순은 "-" 접두사)
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
+            spec: 필터 조건 (정렬은 order_by를 사용하며 spec.order는 무시)
+            
+        Returns:
+            (항목 목록, 다음 페이지 커서) 튜플
+        """
+        stmt = self._keyset_statement(
+            cursor=cursor, limit=limit, order_by=order_by, fields=fields, spec=spec
+        )
+        return split_keyset_page(self._fetch(db, stmt, fields), order_by, limit)
+    
+    def get_multi_by_field_keyset(
+        self,
+        db: Session,
+        field_name: str,
+        value: Any,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: str = "id",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        필드 값으로 여러 항목을 커서 기반(키셋) 페이지네이션으로 조회
+        
+        Args:
+            db: 데이터베이스 세션
+            field_name: 필드 이름
+            value: 필드 값
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            limit: 최대 항목 수
+            order_by: 정렬 기준 필드 (내림차순은 "-" 접두사)
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
+            
+        Returns:
+            (항목 목록, 다음 페이지 커서) 튜플
+        """
+        stmt = self._keyset_statement(
+            cursor=cursor,
+            limit=limit,
+            order_by=order_by,
+            fields=fields,
+            where=[getattr(self.model, field_name) == value],
+        )
+        return split_keyset_page(self._fetch(db, stmt, fields), order_by, limit)
+    
+    def search(
+        self,
+        db: Session,
+        query: str,
+        *,
+        skip: int = 0,
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ModelType]:
+        """
+        검색어로 항목 검색 (관련도 순)
+        
+        search_fields 컬럼을 대상으로 PostgreSQL은 tsvector/pg_trgm 인덱스,
+        SQLite는 FTS5 테이블을 사용합니다 (app.core.database.search).
+        
+        Args:
+            db: 데이터베이스 세션
+            query: 검색어
+            skip: 건너뛸 항목 수
+            limit: 최대 항목 수
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
             
         Returns:
             항목 목록
         """
-        return (
-            db.query(self.model)
-            .filter(getattr(self.model, field_name) == value)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        ) 
\ No newline at end of file
+        dialect_name, fts_ready = self._search_backend(db)
+        stmt = self._search_statement(
+            query, dialect_name, fts_ready, skip=skip, limit=limit, fields=fields
+        )
+        return self._fetch(db, stmt, fields)
+    
+    def search_condition(self, db: Union[Session, Engine], query: str) -> Any:
+        """
+        검색 조건 (관련도 정렬 없이 WHERE 절에만 사용, 예: 어드민 목록 검색)
+        
+        Args:
+            db: 데이터베이스 세션 또는 엔진 (세션 없이 조건만 만들 때)
+            query: 검색어
+            
+        Returns:
+            WHERE 절에 사용할 조건
+        """
+        dialect_name, fts_ready = self._search_backend(db)
+        return search_condition(self.model, self._search_fields(), query, dialect_name, fts_ready)
+    
+    def _search_backend(self, db: Union[Session, Engine]) -> Tuple[str, bool]:
+        """(데이터베이스 방언 이름, SQLite FTS5 테이블 사용 가능 여부)"""
+        dialect_name = (db if isinstance(db, Engine) else db.get_bind()).dialect.name
+        fts_ready = dialect_name == "sqlite" and has_fts_table(db, self.model.__table__.name)
+        return dialect_name, fts_ready
+    
+    def create_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        batch_size: Optional[int] = None,
+        commit: bool = False,
+    ) -> List[ModelType]:
+        """
+        여러 항목 일괄 생성
+        
+        batch_size 단위의 다중 행 INSERT ... RETURNING으로 생성하고 한 번에 반영합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            objs_in: 생성할 항목 데이터 목록
+            batch_size: 한 번에 INSERT할 최대 행 수 (기본값: DB_BULK_BATCH_SIZE)
+            commit: 즉시 커밋할지 여부 (기본값: flush만 하고 커밋은 요청이 끝날 때 get_db가 수행)
+            
+        Returns:
+            생성된 항목 목록 (입력 순서 유지)
+        """
+        rows = self._prepare_create_rows(objs_in)
+        stmt = self._insert_many_statement()
+        created: List[ModelType] = []
+        for batch in chunked(rows, batch_size or settings.DB_BULK_BATCH_SIZE):
+            created.extend(db.scalars(stmt, batch).all())
+        persist(db, commit=commit)
+        return created
+    
+    def upsert_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        conflict_fields: Optional[Sequence[str]] = None,
+        update_fields: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+        commit: bool = False,
+    ) -> List[ModelType]:
+        """
+        여러 항목 일괄 생성 또는 갱신 (INSERT ... ON CONFLICT DO UPDATE ... RETURNING)
+        
+        Args:
+            db: 데이터베이스 세션
+            objs_in: 생성 또는 갱신할 항목 데이터 목록
+            conflict_fields: 충돌 판단에 사용할 고유 키 (기본값: upsert_conflict_fields)
+            update_fields: 충돌 시 갱신할 필드 (기본값: upsert_update_fields, 없으면 고유 키를 제외한 입력 필드 전체)
+            batch_size: 한 번에 처리할 최대 행 수 (기본값: DB_BULK_BATCH_SIZE)
+            commit: 즉시 커밋할지 여부 (기본값: flush만 하고 커밋은 요청이 끝날 때 get_db가 수행)
+            
+        Returns:
+            생성 또는 갱신된 항목 목록
+        """
+        rows = self._prepare_create_rows(objs_in)
+        if not rows:
+            return []
+        stmt = self._upsert_statement(
+            db.get_bind().dialect.name, rows, conflict_fields, update_fields
+        )
+        
+        upserted: List[ModelType] = []
+        for batch in chunked(rows, batch_size or settings.DB_BULK_BATCH_SIZE):
+            upserted.extend(
+                db.scalars(stmt, batch, execution_options={"populate_existing": True}).all()
+            )
+        persist(db, commit=commit)
+        self._invalidate(db, *(db_obj.id for db_obj in upserted))
+        return upserted
+    
+    def remove_many(
+        self,
+        db: Session,
+        *,
+        ids: Sequence[Any],
+        batch_size: Optional[int] = None,
+        commit: bool = False,
+    ) -> List[ModelType]:
+        """
+        여러 항목 일괄 삭제 (DELETE ... WHERE id IN (...) RETURNING)
+        
+        Args:
+            db: 데이터베이스 세션
+            ids: 삭제할 항목 ID 목록
+            batch_size: 한 번에 삭제할 최대 행 수 (기본값: DB_BULK_BATCH_SIZE)
+            commit: 즉시 커밋할지 여부 (기본값: flush만 하고 커밋은 요청이 끝날 때 get_db가 수행)
+            
+        Returns:
+            삭제된 항목 목록 (존재하지 않는 ID는 제외)
+        """
+        removed: List[ModelType] = []
+        for batch in chunked(ids, batch_size or settings.DB_BULK_BATCH_SIZE):
+            removed.extend(db.scalars(self._delete_many_statement(batch)).all())
+        persist(db, commit=commit)
+        self._invalidate(db, *ids)
+        return removed
+    
+    def _from_cache_data(self, db: Session, data: Dict[str, Any]) -> ModelType:
+        """
+        캐시된 컬럼 딕셔너리를 세션에 연결된 ORM 객체로 복원
+        
+        데이터베이스를 조회하지 않고 detached 상태로 만든 뒤 세션에 병합합니다.
+        cache_exclude_fields는 채우지 않으므로 처음 읽을 때 데이터베이스에서 조회합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            data: 컬럼 이름과 값의 딕셔너리
+            
+        Returns:
+            ORM 객체
+        """
+        db_obj = self._cached_instance(data)
+        make_transient_to_detached(db_obj)
+        return db.merge(db_obj, load=False)
+    
+    def _refresh_expired(self, db: Session, db_obj: ModelType) -> None:
+        """
+        만료된 컬럼만 다시 조회
+        
+        RETURNING으로 서버 기본값을 받지 못한 컬럼(예: onupdate)이 있을 때만 쿼리를 실행합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            db_obj: ORM 객체
+        """
+        expired = inspect(db_obj).expired_attributes
+        if expired:
+            db.refresh(db_obj, attribute_names=list(expired))
+    
+    def _fetch(self, db: Session, stmt: Select, fields: Optional[Sequence[str]] = None) -> List[Any]:
+        """
+        select 문 실행
+        
+        Args:
+            db: 데이터베이스 세션
+            stmt: select 문
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
+            
+        Returns:
+            ORM 객체 목록 또는 딕셔너리 목록
+        """
+        return self._rows(db.execute(stmt), fields)
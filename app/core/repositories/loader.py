@@ -0,0 +1,221 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from fastapi import Depends, Request
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.database.session import get_async_db, get_db
+
+
+class RepositoryLoader:
+    """
+    요청 범위 일괄 조회기 (DataLoader)
+
+    같은 이벤트 루프 틱에 요청된 load/load_by_field 호출을 모아
+    WHERE id IN (...) (또는 WHERE field IN (...)) 한 번으로 조회하고,
+    결과를 요청이 끝날 때까지 기억합니다. 저장소는 get_many/get_many_by_field를
+    제공해야 하며, 동기 저장소는 스레드풀에서 실행합니다.
+    """
+    def __init__(self, repository: Any, db: Any):
+        """
+        조회기 초기화
+
+        Args:
+            repository: 저장소 (BaseRepository, AsyncBaseRepository 또는 SupabaseBaseRepository)
+            db: 저장소에 전달할 데이터베이스 세션 또는 클라이언트
+        """
+        self.repository = repository
+        self.db = db
+        self.is_async = asyncio.iscoroutinefunction(repository.get_many)
+        self._results: Dict[Tuple[str, Hashable], Any] = {}
+        self._pending: Dict[Tuple[str, Hashable], asyncio.Future] = {}
+        self._scheduled = False
+        # 실행 중인 일괄 조회 작업 (이벤트 루프는 작업을 약하게 참조하므로 직접 보관)
+        self._task: Optional[asyncio.Task] = None
+        # 동기 세션은 스레드 간에 동시에 사용할 수 없으므로 조회를 하나씩 실행
+        self._lock = asyncio.Lock()
+
+    async def load(self, id: Any) -> Optional[Any]:
+        """
+        ID로 항목 조회
+
+        Args:
+            id: 항목 ID
+
+        Returns:
+            조회된 항목 또는 None
+        """
+        return await self._load("id", id)
+
+    async def load_many(self, ids: Sequence[Any]) -> List[Optional[Any]]:
+        """
+        ID 목록으로 항목 조회
+
+        Args:
+            ids: 항목 ID 목록
+
+        Returns:
+            ID 순서대로 조회된 항목 목록 (없는 항목은 None)
+        """
+        return list(await asyncio.gather(*(self.load(id) for id in ids)))
+
+    async def load_by_field(self, field_name: str, value: Any) -> Optional[Any]:
+        """
+        필드 값으로 항목 조회
+
+        Args:
+            field_name: 필드 이름
+            value: 필드 값
+
+        Returns:
+            조회된 항목 또는 None (여러 항목이 일치하면 ID가 가장 작은 항목)
+        """
+        return await self._load(field_name, value)
+
+    def prime(self, item: Any) -> None:
+        """
+        조회 결과 미리 채우기
+
+        핸들러가 항목을 변경한 뒤 최신 객체를 기억시킬 때 사용합니다.
+
+        Args:
+            item: ORM 객체 또는 딕셔너리
+        """
+        self._results[("id", _item_value(item, "id"))] = item
+
+    def clear(self, id: Optional[Any] = None) -> None:
+        """
+        기억한 조회 결과 삭제
+
+        Args:
+            id: 삭제할 항목 ID (None이면 전체 삭제)
+        """
+        if id is None:
+            self._results.clear()
+            return
+        self._results = {
+            key: item
+            for key, item in self._results.items()
+            if key != ("id", id) and (item is None or _item_value(item, "id") != id)
+        }
+
+    async def _load(self, field_name: str, value: Any) -> Optional[Any]:
+        key = (field_name, value)
+        if key in self._results:
+            return self._results[key]
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if not self._scheduled:
+                # 현재 틱에 대기 중인 다른 호출이 모두 등록된 뒤 한 번에 조회
+                self._scheduled = True
+                loop.call_soon(self._start_dispatch, loop)
+        return await future
+
+    def _start_dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._task = loop.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        try:
+            await self._resolve(pending)
+        except Exception as e:
+            # 조회 밖에서 실패해도 기다리는 호출이 멈추지 않도록 남은 Future를 모두 실패시킴
+            _fail_pending(pending, e)
+        except BaseException:
+            for future in pending.values():
+                future.cancel()
+            raise
+
+    async def _resolve(self, pending: Dict[Tuple[str, Hashable], asyncio.Future]) -> None:
+        values_by_field: Dict[str, List[Any]] = defaultdict(list)
+        for field_name, value in pending:
+            values_by_field[field_name].append(value)
+
+        async with self._lock:
+            for field_name, values in values_by_field.items():
+                try:
+                    items = await self._fetch(field_name, values)
+                except Exception as e:
+                    _fail_pending({(field_name, value): pending[(field_name, value)] for value in values}, e)
+                    continue
+
+                found: Dict[Any, Any] = {}
+                for item in items:
+                    found.setdefault(_item_value(item, field_name), item)
+                    self._results[("id", _item_value(item, "id"))] = item
+                for value in values:
+                    item = found.get(value)
+                    self._results[(field_name, value)] = item
+                    future = pending[(field_name, value)]
+                    if not future.done():
+                        future.set_result(item)
+
+    async def _fetch(self, field_name: str, values: List[Any]) -> List[Any]:
+        if field_name == "id":
+            method, args = self.repository.get_many, (self.db, values)
+        else:
+            method, args = self.repository.get_many_by_field, (self.db, field_name, values)
+        if self.is_async:
+            return await method(*args)
+        return await run_in_threadpool(method, *args)
+
+
+def _fail_pending(pending: Dict[Tuple[str, Hashable], asyncio.Future], error: Exception) -> None:
+    for future in pending.values():
+        if not future.done():
+            future.set_exception(error)
+
+
+def _item_value(item: Any, field_name: str) -> Any:
+    if isinstance(item, dict):
+        return item.get(field_name)
+    return getattr(item, field_name)
+
+
+def get_loader(request: Request, repository: Any, db: Any) -> RepositoryLoader:
+    """
+    요청 범위 조회기 조회 (없으면 생성)
+
+    조회기는 request.state에 저장되므로 같은 요청의 의존성과 핸들러가 공유합니다.
+
+    Args:
+        request: 현재 요청
+        repository: 저장소
+        db: 저장소에 전달할 데이터베이스 세션 또는 클라이언트
+
+    Returns:
+        요청 범위 조회기
+    """
+    loaders = getattr(request.state, "loaders", None)
+    if loaders is None:
+        loaders = request.state.loaders = {}
+    loader = loaders.get(id(repository))
+    if loader is None or loader.db is not db:
+        loader = loaders[id(repository)] = RepositoryLoader(repository, db)
+    return loader
+
+
+def loader_dependency(repository: Any, db_dependency: Optional[Callable] = None) -> Callable:
+    """
+    요청 범위 조회기 의존성 생성
+
+    Args:
+        repository: 저장소
+        db_dependency: 세션 의존성 (기본값: 저장소 종류에 맞는 get_db 또는 get_async_db)
+
+    Returns:
+        RepositoryLoader를 반환하는 FastAPI 의존성
+    """
+    if db_dependency is None:
+        is_async = asyncio.iscoroutinefunction(repository.get_many)
+        db_dependency = get_async_db if is_async else get_db
+
+    async def dependency(request: Request, db: Any = Depends(db_dependency)) -> RepositoryLoader:
+        return get_loader(request, repository, db)
+
+    return dependency
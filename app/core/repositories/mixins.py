@@ -0,0 +1,380 @@
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import Result
+from sqlalchemy.sql import Delete, Insert, Select, Update
+
+from app.core.cache import EntityCache
+from app.core.database.search import search_statement
+from app.core.database.transaction import has_uncommitted_writes, run_after_commit
+from app.core.repositories.statements import count_statement
+from app.core.utils.counting import CountStrategy, resolve_count_strategy
+from app.core.utils.filtering import QuerySpec, apply_filters, apply_order
+from app.core.utils.pagination import apply_keyset, coerce_column_value, parse_order_by
+from app.core.utils.projection import project_columns
+
+# 모델 타입 변수
+ModelType = TypeVar("ModelType")
+# 생성 스키마 타입 변수
+CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
+# 업데이트 스키마 타입 변수
+UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+
+
+def get_dialect_insert(dialect_name: str) -> Any:
+    """
+    ON CONFLICT를 지원하는 데이터베이스별 insert 생성자 반환
+
+    Args:
+        dialect_name: SQLAlchemy 방언 이름
+
+    Returns:
+        방언별 insert 함수
+    """
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"upsert를 지원하지 않는 데이터베이스입니다: {dialect_name}")
+    return dialect_insert
+
+
+class SQLRepositoryMixin(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    SQLAlchemy 저장소 공통 기능
+
+    BaseRepository(Session)와 AsyncBaseRepository(AsyncSession)가 공유하는 설정, 입력 변환,
+    캐시 직렬화와 SQL 문 생성을 모아 둡니다. 세션에서 실행/flush/커밋하는 부분만 각 저장소에 있습니다.
+    """
+    # upsert_many에서 충돌 판단에 사용할 기본 고유 키
+    upsert_conflict_fields: Sequence[str] = ("id",)
+    # upsert_many에서 기존 행에 덮어쓸 기본 필드 (None이면 고유 키를 제외한 입력 필드 전체,
+    # 자격 증명/권한 컬럼이 있는 모델은 반드시 안전한 필드만 지정)
+    upsert_update_fields: Optional[Sequence[str]] = None
+    # get_by_field 결과를 캐시할 필드 (고유 컬럼만 지정)
+    cache_fields: Sequence[str] = ()
+    # 캐시에 저장하지 않을 필드 (비밀번호 해시 등 비밀 값, 캐시에서 복원한 객체는 처음 읽을 때
+    # 데이터베이스에서 조회하며 비동기 세션은 지연 로딩할 수 없으므로 use_cache=False로 조회)
+    cache_exclude_fields: Sequence[str] = ()
+    # 전체 개수 계산 방식 (None이면 DEFAULT_COUNT_STRATEGY 사용)
+    count_strategy: Optional[CountStrategy] = None
+    # 목록 조회에서 필터/정렬할 수 있는 필드 (인덱스가 있는 컬럼만 지정, id는 항상 정렬 가능)
+    filter_fields: Sequence[str] = ()
+    sort_fields: Sequence[str] = ()
+    # search에서 검색할 컬럼 (app.core.database.search의 인덱스와 같은 순서)
+    search_fields: Sequence[str] = ()
+
+    def __init__(self, model: Type[ModelType], cache: Optional[EntityCache] = None):
+        """
+        저장소 초기화
+
+        Args:
+            model: SQLAlchemy 모델 클래스
+            cache: 엔티티 읽기 캐시 (None이면 캐시하지 않음, 동기/비동기 저장소가 같은 캐시를 공유할 수 있음)
+        """
+        self.model = model
+        self.cache = cache
+
+    def _prepare_create_data(self, obj_in: Union[CreateSchemaType, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        생성 스키마를 INSERT에 사용할 컬럼 딕셔너리로 변환
+
+        하위 클래스에서 비밀번호 해싱 등 저장 전 변환이 필요하면 재정의합니다.
+
+        Args:
+            obj_in: 생성할 항목 데이터
+
+        Returns:
+            컬럼 이름과 값의 딕셔너리
+        """
+        return jsonable_encoder(obj_in)
+
+    def _prepare_create_rows(
+        self, objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 생성 스키마를 INSERT에 사용할 컬럼 딕셔너리 목록으로 변환
+
+        대량 작업에서 사용하며, 비밀번호 해싱처럼 행마다 비용이 큰 변환을 묶어서 처리해야 하면 재정의합니다.
+
+        Args:
+            objs_in: 생성할 항목 데이터 목록
+
+        Returns:
+            컬럼 이름과 값의 딕셔너리 목록 (입력 순서 유지)
+        """
+        return [self._prepare_create_data(obj_in) for obj_in in objs_in]
+
+    def _prepare_update_data(self, obj_in: Union[UpdateSchemaType, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        업데이트 스키마를 변경된 컬럼만 담은 딕셔너리로 변환
+
+        Args:
+            obj_in: 업데이트 데이터
+
+        Returns:
+            컬럼 이름과 값의 딕셔너리 (설정되지 않은 필드와 모델에 없는 필드는 제외)
+        """
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        columns = self.model.__table__.columns
+        return {field: value for field, value in update_data.items() if field in columns}
+
+    def _build_id_criteria(self, id: Any, where: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        ID와 추가 조건으로 WHERE 절 목록 생성
+
+        Args:
+            id: 항목 ID
+            where: 추가 조건 (필드 이름과 값)
+
+        Returns:
+            WHERE 절 목록
+        """
+        criteria = [self.model.id == id]
+        for field_name, value in (where or {}).items():
+            criteria.append(getattr(self.model, field_name) == value)
+        return criteria
+
+    def _search_fields(self) -> Sequence[str]:
+        """검색 대상 컬럼 (지정되지 않았으면 오류)"""
+        if not self.search_fields:
+            raise NotImplementedError(f"{self.model.__name__} 저장소에는 search_fields가 없습니다")
+        return self.search_fields
+
+    def _select(self, fields: Optional[Sequence[str]] = None, *extra: str) -> Select:
+        """
+        조회할 필드에 맞는 select 문 생성
+
+        Args:
+            fields: 조회할 필드 목록 (None이면 모델 전체)
+            extra: 함께 조회해야 하는 필드 (예: 커서 생성을 위한 정렬 키)
+
+        Returns:
+            select 문
+        """
+        if not fields:
+            return select(self.model)
+        return select(*project_columns(self.model, fields, *extra))
+
+    @staticmethod
+    def _rows(result: Result, fields: Optional[Sequence[str]] = None) -> List[Any]:
+        """
+        select 문 실행 결과를 ORM 객체 목록 또는 딕셔너리 목록으로 변환
+
+        Args:
+            result: 실행 결과
+            fields: 조회할 필드 목록 (지정 시 딕셔너리 반환)
+
+        Returns:
+            ORM 객체 목록 또는 딕셔너리 목록
+        """
+        if fields:
+            return [dict(row) for row in result.mappings()]
+        return list(result.scalars().all())
+
+    def _list_statement(
+        self, *, skip: int, limit: int, fields: Optional[Sequence[str]], spec: Optional[QuerySpec]
+    ) -> Select:
+        """get_multi 조회 문 (다음 페이지 커서를 만들 수 있도록 정렬 필드도 함께 조회)"""
+        spec = spec or QuerySpec()
+        stmt = apply_filters(self._select(fields, *spec.sort_fields), self.model, spec.filters)
+        return apply_order(stmt, self.model, spec.order).offset(skip).limit(limit)
+
+    def _stream_statement(self, fields: Optional[Sequence[str]], batch_size: int) -> Select:
+        """stream_multi 조회 문 (ID 순, batch_size 행씩 가져옴)"""
+        return self._select(fields).order_by(self.model.id).execution_options(yield_per=batch_size)
+
+    def _field_list_statement(
+        self, field_name: str, value: Any, *, skip: int, limit: int, fields: Optional[Sequence[str]]
+    ) -> Select:
+        """get_multi_by_field 조회 문"""
+        return (
+            self._select(fields)
+            .where(getattr(self.model, field_name) == value)
+            .order_by(self.model.id)
+            .offset(skip)
+            .limit(limit)
+        )
+
+    def _keyset_statement(
+        self,
+        *,
+        cursor: Optional[str],
+        limit: int,
+        order_by: str,
+        fields: Optional[Sequence[str]],
+        spec: Optional[QuerySpec] = None,
+        where: Sequence[Any] = (),
+    ) -> Select:
+        """
+        키셋 페이지네이션 조회 문 (limit + 1개를 조회해 split_keyset_page로 나눔)
+
+        Args:
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            limit: 최대 항목 수
+            order_by: 정렬 기준 필드 (내림차순은 "-" 접두사)
+            fields: 조회할 필드 목록
+            spec: 필터 조건 (spec.order는 무시)
+            where: 추가 WHERE 절
+
+        Returns:
+            select 문
+        """
+        stmt = self._select(fields, parse_order_by(order_by)[0]).where(*where)
+        stmt = apply_filters(stmt, self.model, spec.filters if spec else ())
+        return apply_keyset(stmt, self.model, cursor=cursor, order_by=order_by, limit=limit)
+
+    def _search_statement(
+        self,
+        query: str,
+        dialect_name: str,
+        fts_ready: bool,
+        *,
+        skip: int,
+        limit: int,
+        fields: Optional[Sequence[str]],
+    ) -> Select:
+        """search 조회 문 (관련도 순)"""
+        stmt = search_statement(
+            self._select(fields), self.model, self._search_fields(), query, dialect_name, fts_ready
+        )
+        return stmt.offset(skip).limit(limit)
+
+    def _count_strategy(self, strategy: Optional[CountStrategy]) -> CountStrategy:
+        """요청한 계산 방식 (없으면 저장소의 count_strategy, 그것도 없으면 DEFAULT_COUNT_STRATEGY)"""
+        return resolve_count_strategy(strategy, self.count_strategy)
+
+    def _filtered_count_statement(self, spec: Optional[QuerySpec]) -> Optional[Select]:
+        """
+        조건이 있는 경우의 개수 조회 문
+
+        조건이 있으면 추정치나 테이블 전체 캐시를 쓸 수 없으므로 항상 정확히 계산합니다.
+
+        Returns:
+            조건이 있으면 COUNT 문, 없으면 None
+        """
+        if spec is None or not spec.filters:
+            return None
+        return apply_filters(count_statement(self.model), self.model, spec.filters)
+
+    def _update_statement(
+        self, id: Any, where: Optional[Dict[str, Any]], update_data: Dict[str, Any]
+    ) -> Update:
+        """update_by_id UPDATE 문 (RETURNING은 호출하는 쪽에서 방언에 맞게 추가)"""
+        return update(self.model).where(*self._build_id_criteria(id, where)).values(**update_data)
+
+    def _insert_many_statement(self) -> Insert:
+        """create_many 다중 행 INSERT ... RETURNING 문 (입력 순서 유지)"""
+        return insert(self.model).returning(self.model, sort_by_parameter_order=True)
+
+    def _upsert_statement(
+        self,
+        dialect_name: str,
+        rows: List[Dict[str, Any]],
+        conflict_fields: Optional[Sequence[str]] = None,
+        update_fields: Optional[Sequence[str]] = None,
+    ) -> Insert:
+        """
+        upsert_many INSERT ... ON CONFLICT DO UPDATE ... RETURNING 문
+
+        Args:
+            dialect_name: 데이터베이스 방언 이름
+            rows: INSERT할 컬럼 딕셔너리 목록 (비어 있지 않아야 함)
+            conflict_fields: 충돌 판단에 사용할 고유 키 (기본값: upsert_conflict_fields)
+            update_fields: 충돌 시 갱신할 필드 (기본값: upsert_update_fields, 없으면 고유 키를 제외한 입력 필드 전체)
+
+        Returns:
+            insert 문
+        """
+        conflict_fields = list(conflict_fields or self.upsert_conflict_fields)
+        if update_fields is None:
+            update_fields = self.upsert_update_fields
+        if update_fields is None:
+            update_fields = [field for field in rows[0] if field not in conflict_fields]
+
+        stmt = get_dialect_insert(dialect_name)(self.model)
+        return stmt.on_conflict_do_update(
+            index_elements=conflict_fields,
+            set_={field: stmt.excluded[field] for field in update_fields},
+        ).returning(self.model)
+
+    def _delete_statement(self, id: Any) -> Delete:
+        """remove DELETE ... RETURNING 문"""
+        return delete(self.model).where(self.model.id == id).returning(self.model)
+
+    def _delete_many_statement(self, ids: Sequence[Any]) -> Delete:
+        """remove_many DELETE ... WHERE id IN (...) RETURNING 문"""
+        return delete(self.model).where(self.model.id.in_(ids)).returning(self.model)
+
+    def _to_cache_data(self, db_obj: ModelType) -> Dict[str, Any]:
+        """
+        ORM 객체를 캐시에 저장할 컬럼 딕셔너리로 변환
+
+        Args:
+            db_obj: ORM 객체
+
+        Returns:
+            컬럼 이름과 값의 딕셔너리 (cache_exclude_fields 제외)
+        """
+        return {
+            key: getattr(db_obj, key)
+            for key in self.model.__table__.columns.keys()
+            if key not in self.cache_exclude_fields
+        }
+
+    def _cached_instance(self, data: Dict[str, Any]) -> ModelType:
+        """
+        캐시된 컬럼 딕셔너리로 세션에 병합하기 전의 ORM 객체 생성 (데이터베이스를 조회하지 않음)
+
+        cache_exclude_fields는 채우지 않습니다. 세션에 병합할 때 make_transient_to_detached로
+        detached 상태로 만든 뒤 merge(load=False)를 사용합니다.
+
+        Args:
+            data: 컬럼 이름과 값의 딕셔너리
+
+        Returns:
+            ORM 객체
+        """
+        values = {
+            column.key: coerce_column_value(column, data[column.key])
+            for column in self.model.__table__.columns
+            if column.key in data and column.key not in self.cache_exclude_fields
+        }
+        return self.model(**values)
+
+    def _invalidate(self, db: Any, *ids: Any) -> None:
+        """
+        변경된 항목을 캐시에서 제거
+
+        아직 커밋되지 않았다면 커밋 직후에도 한 번 더 제거해, 커밋 전에 다른 요청이
+        이전 값을 다시 캐시에 넣은 경우를 정리합니다.
+
+        Args:
+            db: 동기 또는 비동기 데이터베이스 세션
+            ids: 변경된 항목 ID 목록
+        """
+        if self.cache is None or not ids:
+            return
+        cache = self.cache
+        cache.invalidate(*ids)
+        if has_uncommitted_writes(db):
+            run_after_commit(db, lambda: cache.invalidate(*ids))
+
+    def _cache_store(self, db: Any, db_obj: ModelType) -> None:
+        """
+        조회한 항목을 캐시에 저장
+
+        커밋되지 않은 쓰기가 있는 세션에서 읽은 값은 롤백될 수 있으므로 저장하지 않습니다.
+
+        Args:
+            db: 동기 또는 비동기 데이터베이스 세션
+            db_obj: 조회한 항목
+        """
+        if self.cache is not None and not has_uncommitted_writes(db):
+            self.cache.set(db_obj.id, self._to_cache_data(db_obj), fields=self.cache_fields)
@@ -0,0 +1,56 @@
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.sql import Select
+
+# 자주 실행되는 조회 문을 모델/필드별로 한 번만 만들어 재사용합니다.
+# 같은 문 객체를 실행하면 SQLAlchemy가 문 생성과 캐시 키 계산을 반복하지 않고
+# 컴파일 캐시를 바로 사용하므로 호출마다 드는 Python 비용이 줄어듭니다.
+# 값은 바인딩 파라미터로 전달합니다 (lookup: value, lookup_many: values).
+
+
+@lru_cache(maxsize=None)
+def lookup_statement(model: Any, field_name: str) -> Select:
+    """
+    필드 값으로 항목 하나를 조회하는 문
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+        field_name: 필드 이름
+
+    Returns:
+        :value 파라미터를 받는 select 문
+    """
+    column = getattr(model, field_name)
+    return select(model).where(column == bindparam("value")).limit(1)
+
+
+@lru_cache(maxsize=None)
+def lookup_many_statement(model: Any, field_name: str) -> Select:
+    """
+    필드 값 목록으로 여러 항목을 조회하는 문 (WHERE field IN (...), ID 순)
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+        field_name: 필드 이름
+
+    Returns:
+        :values 파라미터(목록)를 받는 select 문
+    """
+    column = getattr(model, field_name)
+    return select(model).where(column.in_(bindparam("values", expanding=True))).order_by(model.id)
+
+
+@lru_cache(maxsize=None)
+def count_statement(model: Any) -> Select:
+    """
+    전체 항목 수를 세는 문
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+
+    Returns:
+        select 문
+    """
+    return select(func.count(model.id))
@@ -1,8 +1,22 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from supabase import Client
 
+from app.core.cache import EntityCache
+from app.core.config import settings
+from app.core.observability import timed
+from app.core.utils.common import chunked
+from app.core.utils.counting import (
+    CountStrategy,
+    get_cached_count,
+    resolve_count_strategy,
+    set_cached_count,
+)
+from app.core.utils.pagination import parse_order_by, postgrest_keyset_filter, split_keyset_page
+from app.core.utils.filtering import QuerySpec, postgrest_filters, postgrest_order
+from app.core.utils.projection import postgrest_select
+
 # 모델 타입 변수
 ModelType = TypeVar("ModelType")
 # 생성 스키마 타입 변수
@@ -16,32 +30,84 @@ class SupabaseBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaTy
     
     Supabase를 사용한 CRUD 작업을 위한 기본 메서드를 제공합니다.
     """
-    def __init__(self, table_name: str):
+    # upsert_many에서 충돌 판단에 사용할 기본 고유 키
+    upsert_conflict_fields: Sequence[str] = ("id",)
+    # upsert_many에서 기존 행에 덮어쓸 기본 필드 (None이면 입력 필드 전체,
+    # 자격 증명/권한 컬럼이 있는 테이블은 반드시 안전한 필드만 지정)
+    upsert_update_fields: Optional[Sequence[str]] = None
+    # get_by_field 결과를 캐시할 필드 (고유 컬럼만 지정)
+    cache_fields: Sequence[str] = ()
+    # 캐시에 저장하지 않을 필드 (비밀번호 해시 등 비밀 값, 캐시에서 반환한 항목에는 없음)
+    cache_exclude_fields: Sequence[str] = ()
+    # 전체 개수 계산 방식 (None이면 DEFAULT_COUNT_STRATEGY 사용)
+    count_strategy: Optional[CountStrategy] = None
+    # 목록 조회에서 필터/정렬할 수 있는 필드 (인덱스가 있는 컬럼만 지정, id는 항상 정렬 가능)
+    filter_fields: Sequence[str] = ()
+    sort_fields: Sequence[str] = ()
+    
+    def __init__(self, table_name: str, cache: Optional[EntityCache] = None):
         """
         저장소 초기화
         
         Args:
             table_name: Supabase 테이블 이름
+            cache: 엔티티 읽기 캐시 (None이면 캐시하지 않음)
         """
         self.table_name = table_name
+        self.cache = cache
+    
+    def _execute(self, query: Any) -> Any:
+        """
+        PostgREST 요청 실행 (걸린 시간을 현재 요청의 supabase 구간으로 기록)
+        
+        Args:
+            query: 실행할 쿼리 빌더
+            
+        Returns:
+            응답 객체
+        """
+        with timed("supabase"):
+            return query.execute()
     
-    def get(self, supabase: Client, id: Any) -> Optional[Dict[str, Any]]:
+    def get(
+        self, supabase: Client, id: Any, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         ID로 항목 조회
         
         Args:
             supabase: Supabase 클라이언트
             id: 항목 ID
+            fields: 조회할 필드 목록 (지정 시 해당 컬럼만 조회)
             
         Returns:
             조회된 항목 또는 None
         """
-        response = supabase.table(self.table_name).select("*").eq("id", id).execute()
+        if fields:
+            response = self._execute(
+                supabase.table(self.table_name)
+                .select(postgrest_select(fields))
+                .eq("id", id)
+            )
+            return response.data[0] if response.data else None
+        if self.cache is not None:
+            cached = self.cache.get(id)
+            if cached is not None:
+                return self._cache_data(cached)
+        response = self._execute(supabase.table(self.table_name).select("*").eq("id", id))
         data = response.data
+        if data and self.cache is not None:
+            self._cache_store(data[0])
         return data[0] if data else None
     
     def get_multi(
-        self, supabase: Client, *, skip: int = 0, limit: int = 100
+        self,
+        supabase: Client,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        spec: Optional[QuerySpec] = None,
     ) -> List[Dict[str, Any]]:
         """
         여러 항목 조회
@@ -50,24 +116,94 @@ class SupabaseBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaTy
             supabase: Supabase 클라이언트
             skip: 건너뛸 항목 수
             limit: 최대 항목 수
+            fields: 조회할 필드 목록 (지정 시 해당 컬럼만 조회)
+            spec: 필터 조건과 정렬 순서 (기본값: 조건 없이 ID 순)
             
         Returns:
             항목 목록
         """
-        response = supabase.table(self.table_name).select("*").range(skip, skip + limit - 1).execute()
+        spec = spec or QuerySpec()
+        query = postgrest_filters(
+            supabase.table(self.table_name).select(postgrest_select(fields, *spec.sort_fields)),
+            spec.filters,
+        )
+        response = self._execute(postgrest_order(query, spec.order).range(skip, skip + limit - 1))
         return response.data
     
-    def get_count(self, supabase: Client) -> int:
+    def stream_multi(
+        self,
+        supabase: Client,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        전체 항목을 ID 순으로 스트리밍 조회
+        
+        batch_size 행씩 나눠 요청합니다. range() 오프셋 대신 마지막 ID 이후를
+        조회하므로 뒤쪽 묶음도 앞쪽과 같은 비용으로 가져옵니다.
+        
+        Args:
+            supabase: Supabase 클라이언트
+            fields: 조회할 필드 목록 (None이면 전체)
+            batch_size: 한 번에 가져올 행 수 (기본값: DB_STREAM_BATCH_SIZE)
+            
+        Returns:
+            항목 이터레이터
+        """
+        batch_size = batch_size or settings.DB_STREAM_BATCH_SIZE
+        last_id = None
+        while True:
+            query = supabase.table(self.table_name).select(postgrest_select(fields))
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            data = self._execute(query.order("id").limit(batch_size)).data
+            yield from data
+            if len(data) < batch_size:
+                return
+            last_id = data[-1]["id"]
+    
+    def get_count(
+        self,
+        supabase: Client,
+        *,
+        strategy: Optional[CountStrategy] = None,
+        spec: Optional[QuerySpec] = None,
+    ) -> Optional[int]:
         """
         항목 수 조회
         
+        행 데이터는 받지 않고(head 요청) Content-Range 헤더의 개수만 사용합니다.
+        
         Args:
             supabase: Supabase 클라이언트
+            strategy: 계산 방식 (기본값: 저장소의 count_strategy)
+            spec: 필터 조건 (지정 시 조건에 맞는 항목 수를 정확히 계산)
             
         Returns:
-            항목 수
+            항목 수 또는 None (CountStrategy.NONE인 경우)
         """
-        response = supabase.table(self.table_name).select("id", count="exact").execute()
+        strategy = resolve_count_strategy(strategy, self.count_strategy)
+        if strategy == CountStrategy.NONE:
+            return None
+        if spec is not None and spec.filters:
+            # 조건이 있으면 추정치나 테이블 전체 캐시를 쓸 수 없으므로 정확히 계산
+            query = supabase.table(self.table_name).select("id", count="exact", head=True)
+            return self._execute(postgrest_filters(query, spec.filters)).count
+        
+        cache_key = f"supabase:{self.table_name}"
+        if strategy == CountStrategy.CACHED:
+            count = get_cached_count(cache_key)
+            if count is not None:
+                return count
+        
+        count_method = "planned" if strategy == CountStrategy.ESTIMATED else "exact"
+        response = self._execute(
+            supabase.table(self.table_name)
+            .select("id", count=count_method, head=True)
+        )
+        if strategy == CountStrategy.CACHED:
+            set_cached_count(cache_key, response.count)
         return response.count
     
     def create(self, supabase: Client, *, obj_in: CreateSchemaType) -> Dict[str, Any]:
@@ -81,33 +217,47 @@ class SupabaseBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaTy
         Returns:
             생성된 항목
         """
-        obj_in_data = jsonable_encoder(obj_in)
-        response = supabase.table(self.table_name).insert(obj_in_data).execute()
+        obj_in_data = self._prepare_create_data(obj_in)
+        response = self._execute(supabase.table(self.table_name).insert(obj_in_data))
         return response.data[0] if response.data else None
     
     def update(
-        self, supabase: Client, *, id: Any, obj_in: Union[UpdateSchemaType, Dict[str, Any]]
-    ) -> Dict[str, Any]:
+        self,
+        supabase: Client,
+        *,
+        id: Any,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        where: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
-        항목 업데이트
+        항목 업데이트 (PATCH ... return=representation)
+        
+        기존 항목을 먼저 조회하지 않고 변경된 필드만 한 번의 요청으로 갱신합니다.
         
         Args:
             supabase: Supabase 클라이언트
             id: 업데이트할 항목 ID
             obj_in: 업데이트 데이터
+            where: 추가 조건 (필드 이름과 값, 일치하는 행만 갱신)
             
         Returns:
-            업데이트된 항목
+            업데이트된 항목 또는 None (조건에 맞는 항목이 없는 경우)
         """
-        if isinstance(obj_in, dict):
-            update_data = obj_in
+        update_data = self._prepare_update_data(obj_in)
+        if update_data:
+            query = supabase.table(self.table_name).update(update_data).eq("id", id)
         else:
-            update_data = obj_in.model_dump(exclude_unset=True)
-        
-        response = supabase.table(self.table_name).update(update_data).eq("id", id).execute()
+            # 바꿀 필드가 없어도 추가 조건에 맞지 않으면 None (조건부 갱신이 성공한 것처럼 보이지 않도록)
+            query = supabase.table(self.table_name).select("*").eq("id", id)
+        for field_name, value in (where or {}).items():
+            query = query.eq(field_name, value)
+        response = self._execute(query)
+        if not update_data:
+            return response.data[0] if response.data else None
+        self._invalidate(id)
         return response.data[0] if response.data else None
     
-    def remove(self, supabase: Client, *, id: Any) -> Dict[str, Any]:
+    def remove(self, supabase: Client, *, id: Any) -> Optional[Dict[str, Any]]:
         """
         항목 삭제
         
@@ -116,12 +266,15 @@ class SupabaseBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaTy
             id: 삭제할 항목 ID
             
         Returns:
-            삭제된 항목
+            삭제된 항목 또는 None (항목이 없는 경우)
         """
-        response = supabase.table(self.table_name).delete().eq("id", id).execute()
+        response = self._execute(supabase.table(self.table_name).delete().eq("id", id))
+        self._invalidate(id)
         return response.data[0] if response.data else None
     
-    def get_by_field(self, supabase: Client, field_name: str, value: Any) -> Optional[Dict[str, Any]]:
+    def get_by_field(
+        self, supabase: Client, field_name: str, value: Any, *, use_cache: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """
         필드 값으로 항목 조회
         
@@ -129,16 +282,88 @@ class SupabaseBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaTy
             supabase: Supabase 클라이언트
             field_name: 필드 이름
             value: 필드 값
+            use_cache: 엔티티 캐시 사용 여부 (False면 항상 Supabase에서 조회)
             
         Returns:
             조회된 항목 또는 None
         """
-        response = supabase.table(self.table_name).select("*").eq(field_name, value).execute()
+        use_cache = use_cache and self.cache is not None and field_name in self.cache_fields
+        if use_cache:
+            cached = self.cache.get_by_field(field_name, value)
+            if cached is not None:
+                return self._cache_data(cached)
+        response = self._execute(supabase.table(self.table_name).select("*").eq(field_name, value))
         data = response.data
+        if data and use_cache:
+            self._cache_store(data[0])
         return data[0] if data else None
     
+    def get_many(self, supabase: Client, ids: Sequence[Any]) -> List[Dict[str, Any]]:
+        """
+        ID 목록으로 여러 항목 조회
+        
+        캐시에 있는 항목은 캐시에서 반환하고, 나머지는 id=in.(...) 한 번으로 조회합니다.
+        
+        Args:
+            supabase: Supabase 클라이언트
+            ids: 항목 ID 목록
+            
+        Returns:
+            조회된 항목 목록 (순서는 보장하지 않으며, 없는 ID는 제외)
+        """
+        found = []
+        missing = list(dict.fromkeys(ids))
+        if self.cache is not None:
+            pending = []
+            for id in missing:
+                cached = self.cache.get(id)
+                if cached is not None:
+                    found.append(self._cache_data(cached))
+                else:
+                    pending.append(id)
+            missing = pending
+        for batch in chunked(missing, settings.DB_BULK_BATCH_SIZE):
+            response = self._execute(supabase.table(self.table_name).select("*").in_("id", batch))
+            for item in response.data:
+                if self.cache is not None:
+                    self._cache_store(item)
+                found.append(item)
+        return found
+    
+    def get_many_by_field(
+        self, supabase: Client, field_name: str, values: Sequence[Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        필드 값 목록으로 여러 항목 조회 (field=in.(...))
+        
+        Args:
+            supabase: Supabase 클라이언트
+            field_name: 필드 이름
+            values: 필드 값 목록
+            
+        Returns:
+            조회된 항목 목록 (ID 순)
+        """
+        found = []
+        for batch in chunked(list(dict.fromkeys(values)), settings.DB_BULK_BATCH_SIZE):
+            response = self._execute(
+                supabase.table(self.table_name)
+                .select("*")
+                .in_(field_name, batch)
+                .order("id")
+            )
+            found.extend(response.data)
+        return found
+    
     def get_multi_by_field(
-        self, supabase: Client, field_name: str, value: Any, *, skip: int = 0, limit: int = 100
+        self,
+        supabase: Client,
+        field_name: str,
+        value: Any,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         필드 값으로 여러 항목 조회
@@ -149,15 +374,296 @@ class SupabaseBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaTy
             value: 필드 값
             skip: 건너뛸 항목 수
             limit: 최대 항목 수
+            fields: 조회할 필드 목록 (지정 시 해당 컬럼만 조회)
             
         Returns:
             항목 목록
         """
-        response = (
+        response = self._execute(
             supabase.table(self.table_name)
-            .select("*")
+            .select(postgrest_select(fields))
             .eq(field_name, value)
+            .order("id")
             .range(skip, skip + limit - 1)
-            .execute()
         )
-        return response.data 
\ No newline at end of file
+        return response.data
+    
+    def get_multi_keyset(
+        self,
+        supabase: Client,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: str = "id",
+        fields: Optional[Sequence[str]] = None,
+        spec: Optional[QuerySpec] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        커서 기반(키셋) 페이지네이션으로 여러 항목 조회
+        
+        Args:
+            supabase: Supabase 클라이언트
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            limit: 최대 항목 수
+            order_by: 정렬 기준 필드 (내림차순은 "-" 접두사)
+            fields: 조회할 필드 목록 (지정 시 해당 컬럼만 조회)
+            spec: 필터 조건 (정렬은 order_by를 사용하며 spec.order는 무시)
+            
+        Returns:
+            (항목 목록, 다음 페이지 커서) 튜플
+        """
+        query = postgrest_keyset_filter(
+            postgrest_filters(
+                supabase.table(self.table_name).select(
+                    postgrest_select(fields, parse_order_by(order_by)[0])
+                ),
+                spec.filters if spec else (),
+            ),
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+        response = self._execute(query)
+        return split_keyset_page(response.data, order_by, limit)
+    
+    def get_multi_by_field_keyset(
+        self,
+        supabase: Client,
+        field_name: str,
+        value: Any,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: str = "id",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        필드 값으로 여러 항목을 커서 기반(키셋) 페이지네이션으로 조회
+        
+        Args:
+            supabase: Supabase 클라이언트
+            field_name: 필드 이름
+            value: 필드 값
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            limit: 최대 항목 수
+            order_by: 정렬 기준 필드 (내림차순은 "-" 접두사)
+            fields: 조회할 필드 목록 (지정 시 해당 컬럼만 조회)
+            
+        Returns:
+            (항목 목록, 다음 페이지 커서) 튜플
+        """
+        query = postgrest_keyset_filter(
+            supabase.table(self.table_name)
+            .select(postgrest_select(fields, parse_order_by(order_by)[0]))
+            .eq(field_name, value),
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+        response = self._execute(query)
+        return split_keyset_page(response.data, order_by, limit)
+    
+    def _prepare_create_data(self, obj_in: Union[CreateSchemaType, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        생성 스키마를 INSERT에 사용할 딕셔너리로 변환
+        
+        하위 클래스에서 비밀번호 해싱 등 저장 전 변환이 필요하면 재정의합니다.
+        
+        Args:
+            obj_in: 생성할 항목 데이터
+            
+        Returns:
+            컬럼 이름과 값의 딕셔너리
+        """
+        return jsonable_encoder(obj_in)
+    
+    def _prepare_create_rows(
+        self, objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 생성 스키마를 저장할 딕셔너리 목록으로 변환
+        
+        대량 작업에서 사용하며, 비밀번호 해싱처럼 행마다 비용이 큰 변환을 묶어서 처리해야 하면 재정의합니다.
+        
+        Args:
+            objs_in: 생성할 항목 데이터 목록
+            
+        Returns:
+            저장할 딕셔너리 목록 (입력 순서 유지)
+        """
+        return [self._prepare_create_data(obj_in) for obj_in in objs_in]
+    
+    def _prepare_update_data(self, obj_in: Union[UpdateSchemaType, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        업데이트 스키마를 변경된 필드만 담은 딕셔너리로 변환
+        
+        Args:
+            obj_in: 업데이트 데이터
+            
+        Returns:
+            필드 이름과 값의 딕셔너리 (설정되지 않은 필드는 제외)
+        """
+        if isinstance(obj_in, dict):
+            return jsonable_encoder(obj_in)
+        return jsonable_encoder(obj_in.model_dump(exclude_unset=True))
+    
+    def create_many(
+        self,
+        supabase: Client,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        batch_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 항목 일괄 생성
+        
+        batch_size 단위로 묶어 한 번의 요청(다중 행 INSERT ... RETURNING)으로 생성합니다.
+        
+        Args:
+            supabase: Supabase 클라이언트
+            objs_in: 생성할 항목 데이터 목록
+            batch_size: 한 번에 INSERT할 최대 행 수 (기본값: DB_BULK_BATCH_SIZE)
+            
+        Returns:
+            생성된 항목 목록
+        """
+        rows = self._prepare_create_rows(objs_in)
+        created: List[Dict[str, Any]] = []
+        for batch in chunked(rows, batch_size or settings.DB_BULK_BATCH_SIZE):
+            response = self._execute(supabase.table(self.table_name).insert(batch))
+            created.extend(response.data)
+        return created
+    
+    def upsert_many(
+        self,
+        supabase: Client,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        conflict_fields: Optional[Sequence[str]] = None,
+        update_fields: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 항목 일괄 생성 또는 갱신 (ON CONFLICT DO UPDATE)
+        
+        PostgREST의 upsert는 보낸 컬럼을 모두 덮어쓰므로, update_fields가 있으면 이미 있는 행은
+        그 밖의 필드를 현재 값으로 바꿔 보냅니다 (배치마다 조회 요청 한 번 추가).
+        
+        Args:
+            supabase: Supabase 클라이언트
+            objs_in: 생성 또는 갱신할 항목 데이터 목록
+            conflict_fields: 충돌 판단에 사용할 고유 키 (기본값: upsert_conflict_fields)
+            update_fields: 충돌 시 갱신할 필드 (기본값: upsert_update_fields, 없으면 입력 필드 전체)
+            batch_size: 한 번에 처리할 최대 행 수 (기본값: DB_BULK_BATCH_SIZE)
+            
+        Returns:
+            생성 또는 갱신된 항목 목록
+        """
+        rows = self._prepare_create_rows(objs_in)
+        conflict_fields = list(conflict_fields or self.upsert_conflict_fields)
+        if update_fields is None:
+            update_fields = self.upsert_update_fields
+        on_conflict = ",".join(conflict_fields)
+        upserted: List[Dict[str, Any]] = []
+        for batch in chunked(rows, batch_size or settings.DB_BULK_BATCH_SIZE):
+            if update_fields is not None:
+                batch = self._keep_existing_values(supabase, batch, conflict_fields, update_fields)
+            response = self._execute(
+                supabase.table(self.table_name)
+                .upsert(batch, on_conflict=on_conflict)
+            )
+            upserted.extend(response.data)
+        self._invalidate(*(item["id"] for item in upserted))
+        return upserted
+    
+    def _keep_existing_values(
+        self,
+        supabase: Client,
+        rows: List[Dict[str, Any]],
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        이미 있는 행은 update_fields 외의 필드를 현재 값으로 바꾼 upsert 데이터 반환
+        
+        Args:
+            supabase: Supabase 클라이언트
+            rows: upsert할 행 목록
+            conflict_fields: 충돌 판단에 사용할 고유 키
+            update_fields: 충돌 시 갱신할 필드
+            
+        Returns:
+            upsert할 행 목록
+        """
+        def key(row: Dict[str, Any]) -> Tuple[Any, ...]:
+            return tuple(row.get(field) for field in conflict_fields)
+        
+        existing = {
+            key(item): item
+            for item in self.get_many_by_field(
+                supabase, conflict_fields[0], [row[conflict_fields[0]] for row in rows]
+            )
+        }
+        keep = set(conflict_fields) | set(update_fields)
+        prepared = []
+        for row in rows:
+            current = existing.get(key(row))
+            if current is not None:
+                row = {
+                    field: value if field in keep else current.get(field)
+                    for field, value in row.items()
+                }
+            prepared.append(row)
+        return prepared
+    
+    def remove_many(
+        self, supabase: Client, *, ids: Sequence[Any], batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 항목 일괄 삭제 (DELETE ... WHERE id IN (...) RETURNING)
+        
+        Args:
+            supabase: Supabase 클라이언트
+            ids: 삭제할 항목 ID 목록
+            batch_size: 한 번에 삭제할 최대 행 수 (기본값: DB_BULK_BATCH_SIZE)
+            
+        Returns:
+            삭제된 항목 목록
+        """
+        removed: List[Dict[str, Any]] = []
+        for batch in chunked(ids, batch_size or settings.DB_BULK_BATCH_SIZE):
+            response = self._execute(supabase.table(self.table_name).delete().in_("id", batch))
+            removed.extend(response.data)
+        self._invalidate(*ids)
+        return removed
+    
+    def _cache_data(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        캐시에 저장하거나 캐시에서 꺼낸 행에서 cache_exclude_fields를 뺀 복사본
+        
+        Args:
+            row: 항목 데이터
+            
+        Returns:
+            비밀 값을 제외한 항목 데이터
+        """
+        return {key: value for key, value in row.items() if key not in self.cache_exclude_fields}
+    
+    def _cache_store(self, row: Dict[str, Any]) -> None:
+        """
+        조회한 항목을 캐시에 저장
+        
+        Args:
+            row: 항목 데이터
+        """
+        self.cache.set(row["id"], self._cache_data(row), fields=self.cache_fields)
+    
+    def _invalidate(self, *ids: Any) -> None:
+        """
+        변경된 항목을 캐시에서 제거
+        
+        Args:
+            ids: 변경된 항목 ID 목록
+        """
+        if self.cache is not None and ids:
+            self.cache.invalidate(*ids)
@@ -1,11 +1,24 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, AsyncIterator, Callable, Dict, Generic, Iterator, List, Optional, Type, TypeVar, Union
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database.session import get_db
+from app.core.database.instrumentation import atrack_iteration, get_query_stats, track_iteration
+from app.core.database.session import AsyncSessionLocal, SessionLocal, get_async_db, get_db
+from app.core.observability import TimedJSONResponse
+from app.core.services.async_base import AsyncBaseService
 from app.core.services.base import BaseService
 from app.core.schemas.base import BaseResponseSchema, PaginatedResponseSchema
+from app.core.utils.counting import CountStrategy
+from app.core.utils.export import ExportFormat, aencode_rows, encode_rows, export_headers
+from app.core.utils.filtering import QuerySpec, parse_query_spec
+from app.core.utils.pagination import build_next_cursor
+from app.core.utils.projection import parse_fields
+from app.core.utils.security import get_current_active_superuser
 
 # 모델 타입 변수
 ModelType = TypeVar("ModelType")
@@ -21,10 +34,12 @@ class BaseRouter(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Response
     기본 라우터 클래스
     
     API 엔드포인트를 생성하는 기본 메서드를 제공합니다.
+    BaseService와 AsyncBaseService를 모두 지원하며, 동기 서비스는 스레드풀에서 실행해
+    이벤트 루프를 막지 않습니다.
     """
     def __init__(
         self,
-        service: BaseService,
+        service: Union[BaseService, AsyncBaseService],
         response_model: Type[ResponseSchemaType],
         create_schema: Type[CreateSchemaType],
         update_schema: Type[UpdateSchemaType],
@@ -43,39 +58,241 @@ class BaseRouter(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Response
             tags: 태그 목록
         """
         self.service = service
+        self.is_async = isinstance(service, AsyncBaseService)
+        self.db_dependency = get_async_db if self.is_async else get_db
         self.response_model = response_model
         self.create_schema = create_schema
         self.update_schema = update_schema
         self.router = APIRouter(prefix=prefix, tags=tags)
         self._setup_routes()
     
+    async def _call(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        """
+        서비스 메서드 호출
+        
+        비동기 서비스는 직접 await하고, 동기 서비스는 스레드풀에서 실행합니다.
+        
+        Args:
+            method: 호출할 서비스 메서드
+            kwargs: 메서드 인자
+            
+        Returns:
+            서비스 메서드 결과
+        """
+        if self.is_async:
+            return await method(**kwargs)
+        return await run_in_threadpool(method, **kwargs)
+    
+    def _parse_fields(self, fields: Optional[str]) -> Optional[List[str]]:
+        """
+        fields 쿼리 파라미터를 응답 모델의 필드와 대조해 파싱
+        
+        Args:
+            fields: 쉼표로 구분된 필드 목록
+            
+        Returns:
+            필드 이름 목록 또는 None (전체 필드 조회)
+        """
+        try:
+            return parse_fields(fields, self.response_model.model_fields)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+    
+    def _parse_spec(self, filters: Optional[List[str]], sort: Optional[str]) -> QuerySpec:
+        """
+        filter/sort 쿼리 파라미터를 저장소의 filter_fields/sort_fields와 대조해 파싱
+        
+        Args:
+            filters: "필드:연산자:값" 형식의 필터 목록
+            sort: 쉼표로 구분된 정렬 필드 목록 (내림차순은 "-" 접두사)
+            
+        Returns:
+            필터/정렬 명세
+        """
+        repository = self.service.repository
+        try:
+            return parse_query_spec(
+                filters,
+                sort,
+                filter_fields=getattr(repository, "filter_fields", ()),
+                sort_fields=getattr(repository, "sort_fields", ()),
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+    
+    def _export_row(self, item: Any, fields: Optional[List[str]]) -> Dict[str, Any]:
+        """
+        내보낼 항목을 딕셔너리로 변환
+        
+        Args:
+            item: ORM 객체 또는 일부 필드만 조회한 행
+            fields: 조회한 필드 목록
+            
+        Returns:
+            컬럼 이름과 값의 딕셔너리
+        """
+        if fields:
+            return dict(item)
+        return self.response_model.model_validate(item).model_dump()
+    
+    def _export_rows(self, fields: Optional[List[str]]) -> Iterator[Dict[str, Any]]:
+        """
+        동기 서비스로 전체 항목 스트리밍
+        
+        의존성으로 주입된 세션은 응답 전송 전에 닫히므로 반복이 끝날 때까지 쓸 세션을 직접 엽니다.
+        
+        Args:
+            fields: 조회할 필드 목록
+            
+        Returns:
+            딕셔너리 이터레이터
+        """
+        db = SessionLocal()
+        try:
+            for item in self.service.stream_multi(db=db, fields=fields):
+                yield self._export_row(item, fields)
+        finally:
+            db.close()
+    
+    async def _aexport_rows(self, fields: Optional[List[str]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        비동기 서비스로 전체 항목 스트리밍
+        
+        Args:
+            fields: 조회할 필드 목록
+            
+        Returns:
+            딕셔너리 비동기 이터레이터
+        """
+        async with AsyncSessionLocal() as db:
+            async for item in self.service.stream_multi(db=db, fields=fields):
+                yield self._export_row(item, fields)
+    
     def _setup_routes(self):
         """기본 라우트 설정"""
+        db_dependency = self.db_dependency
         
         @self.router.get(
             "/",
             response_model=PaginatedResponseSchema[self.response_model],
             summary="항목 목록 조회",
-            description="페이지네이션을 적용하여 항목 목록을 조회합니다.",
+            description=(
+                "페이지네이션을 적용하여 항목 목록을 조회합니다. "
+                "응답의 next_cursor를 cursor로 전달하면 OFFSET 없이 다음 페이지를 조회합니다. "
+                "큰 테이블에서는 count=estimated 또는 count=none으로 전체 개수 계산 비용을 줄일 수 있습니다. "
+                "filter=필드:연산자:값(eq, in, gt, gte, lt, lte, prefix, is_null)과 "
+                "sort=필드 목록(내림차순은 - 접두사)으로 데이터베이스에서 조건과 정렬을 적용합니다. "
+                "커서 페이지네이션은 정렬 필드가 하나 이하일 때만 지원하며, 같은 filter/sort를 함께 전달해야 합니다."
+            ),
         )
         async def read_items(
             skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
             limit: int = Query(100, ge=1, le=100, description="최대 항목 수"),
-            db: Session = Depends(get_db),
+            cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 skip 무시)"),
+            count: Optional[CountStrategy] = Query(None, description="전체 개수 계산 방식 (기본값: 저장소 설정)"),
+            fields: Optional[str] = Query(None, description="조회할 필드 (쉼표로 구분, 예: id,name)"),
+            filters: Optional[List[str]] = Query(
+                None, alias="filter", description="필터 (필드:연산자:값, 여러 번 지정 가능, 예: is_active:eq:true)"
+            ),
+            sort: Optional[str] = Query(None, description="정렬 (쉼표로 구분, 내림차순은 - 접두사, 예: -created_at)"),
+            db: Union[Session, AsyncSession] = Depends(db_dependency),
         ):
             """
             여러 항목 조회
             """
-            items = self.service.get_multi(db=db, skip=skip, limit=limit)
-            total = self.service.get_count(db=db)
-            return {
+            field_names = self._parse_fields(fields)
+            spec = self._parse_spec(filters, sort)
+            # 정렬 필드가 두 개 이상이면 커서를 만들 수 없음 (None)
+            order_by = spec.sort_key
+            try:
+                if cursor:
+                    if order_by is None:
+                        raise ValueError("커서 페이지네이션은 정렬 필드를 하나만 지원합니다")
+                    items, next_cursor = await self._call(
+                        self.service.get_multi_keyset,
+                        db=db,
+                        cursor=cursor,
+                        limit=limit,
+                        order_by=order_by,
+                        fields=field_names,
+                        spec=spec,
+                    )
+                    has_more = next_cursor is not None
+                    page = None
+                else:
+                    # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+                    items = await self._call(
+                        self.service.get_multi,
+                        db=db,
+                        skip=skip,
+                        limit=limit + 1,
+                        fields=field_names,
+                        spec=spec,
+                    )
+                    has_more = len(items) > limit
+                    items = items[:limit]
+                    next_cursor = (
+                        build_next_cursor(items, order_by, limit) if has_more and order_by else None
+                    )
+                    page = skip // limit + 1 if limit > 0 else 1
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e),
+                )
+            total = await self._call(self.service.get_count, db=db, strategy=count, spec=spec)
+            response = {
                 "success": True,
                 "message": "항목 목록을 성공적으로 조회했습니다",
                 "total": total,
-                "page": skip // limit + 1 if limit > 0 else 1,
+                "page": page,
                 "size": limit,
                 "items": items,
+                "next_cursor": next_cursor,
+                "has_more": has_more,
             }
+            if field_names:
+                # 일부 필드만 조회한 경우 응답 모델 검증 없이 그대로 반환
+                return TimedJSONResponse(content=jsonable_encoder(response))
+            return response
+        
+        @self.router.get(
+            "/export",
+            summary="항목 내보내기",
+            description=(
+                "전체 항목을 ID 순으로 NDJSON 또는 CSV로 내보냅니다 (관리자 전용). "
+                "행을 묶음 단위로 읽어 바로 전송하므로 테이블 크기와 관계없이 메모리 사용량이 일정합니다."
+            ),
+            response_class=StreamingResponse,
+            dependencies=[Depends(get_current_active_superuser)],
+        )
+        async def export_items(
+            format: ExportFormat = Query(ExportFormat.NDJSON, description="내보내기 형식"),
+            fields: Optional[str] = Query(None, description="내보낼 필드 (쉼표로 구분, 예: id,name)"),
+        ):
+            """
+            전체 항목 내보내기
+            """
+            field_names = self._parse_fields(fields)
+            columns = field_names or list(self.response_model.model_fields)
+            # 본문은 엔드포인트가 반환된 뒤 반복되므로 내보내기 쿼리를 요청의 SQL 통계에 직접 연결
+            query_stats = get_query_stats()
+            if self.is_async:
+                rows = atrack_iteration(self._aexport_rows(field_names), query_stats)
+                body = aencode_rows(rows, format, columns)
+            else:
+                rows = track_iteration(self._export_rows(field_names), query_stats)
+                body = encode_rows(rows, format, columns)
+            filename = self.router.prefix.strip("/").replace("/", "_") or "export"
+            return StreamingResponse(
+                body, media_type=format.media_type, headers=export_headers(filename, format)
+            )
         
         @self.router.get(
             "/{id}",
@@ -85,22 +302,33 @@ class BaseRouter(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Response
         )
         async def read_item(
             id: int = Path(..., ge=1, description="항목 ID"),
-            db: Session = Depends(get_db),
+            fields: Optional[str] = Query(None, description="조회할 필드 (쉼표로 구분, 예: id,name)"),
+            db: Union[Session, AsyncSession] = Depends(db_dependency),
         ):
             """
             단일 항목 조회
             """
-            item = self.service.get(db=db, id=id)
+            field_names = self._parse_fields(fields)
+            try:
+                item = await self._call(self.service.get, db=db, id=id, fields=field_names)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e),
+                )
             if not item:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="항목을 찾을 수 없습니다",
                 )
-            return {
+            response = {
                 "success": True,
                 "message": "항목을 성공적으로 조회했습니다",
                 "data": item,
             }
+            if field_names:
+                return TimedJSONResponse(content=jsonable_encoder(response))
+            return response
         
         @self.router.post(
             "/",
@@ -111,12 +339,12 @@ class BaseRouter(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Response
         )
         async def create_item(
             item_in: self.create_schema,
-            db: Session = Depends(get_db),
+            db: Union[Session, AsyncSession] = Depends(db_dependency),
         ):
             """
             항목 생성
             """
-            item = self.service.create(db=db, obj_in=item_in)
+            item = await self._call(self.service.create, db=db, obj_in=item_in)
             return {
                 "success": True,
                 "message": "항목을 성공적으로 생성했습니다",
@@ -132,12 +360,12 @@ class BaseRouter(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Response
         async def update_item(
             id: int = Path(..., ge=1, description="항목 ID"),
             item_in: self.update_schema = None,
-            db: Session = Depends(get_db),
+            db: Union[Session, AsyncSession] = Depends(db_dependency),
         ):
             """
             항목 업데이트
             """
-            item = self.service.update(db=db, id=id, obj_in=item_in)
+            item = await self._call(self.service.update, db=db, id=id, obj_in=item_in)
             if not item:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -157,12 +385,12 @@ class BaseRouter(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Response
         )
         async def delete_item(
             id: int = Path(..., ge=1, description="항목 ID"),
-            db: Session = Depends(get_db),
+            db: Union[Session, AsyncSession] = Depends(db_dependency),
         ):
             """
             항목 삭제
             """
-            item = self.service.remove(db=db, id=id)
+            item = await self._call(self.service.remove, db=db, id=id)
             if not item:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -28,7 +28,9 @@ class BaseResponseSchema(BaseSchema, Generic[T]):
 
 class PaginatedResponseSchema(BaseResponseSchema[List[T]]):
     """페이지네이션 응답 스키마 클래스"""
-    total: int = Field(0, description="전체 항목 수")
-    page: int = Field(1, description="현재 페이지")
+    total: Optional[int] = Field(0, description="전체 항목 수 (count=none이면 None, count=estimated이면 추정치)")
+    page: Optional[int] = Field(1, description="현재 페이지 (커서 기반 조회 시 None)")
     size: int = Field(10, description="페이지 크기")
-    items: List[T] = Field([], description="항목 목록") 
\ No newline at end of file
+    items: List[T] = Field([], description="항목 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지이면 None)")
+    has_more: Optional[bool] = Field(None, description="다음 페이지 존재 여부") 
\ No newline at end of file
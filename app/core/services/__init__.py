@@ -1,3 +1,4 @@
 from app.core.services.base import BaseService
+from app.core.services.async_base import AsyncBaseService
 
-__all__ = ["BaseService"] 
\ No newline at end of file
+__all__ = ["BaseService", "AsyncBaseService"]
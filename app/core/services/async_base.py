@@ -0,0 +1,28 @@
+from app.core.repositories.async_base import AsyncBaseRepository
+from app.core.services.base import (
+    BaseService,
+    CreateSchemaType,
+    ModelType,
+    ResponseSchemaType,
+    UpdateSchemaType,
+)
+
+class AsyncBaseService(BaseService[ModelType, CreateSchemaType, UpdateSchemaType, ResponseSchemaType]):
+    """
+    비동기 기본 서비스 클래스
+
+    AsyncBaseRepository를 사용해 비즈니스 로직을 처리하는 기본 메서드를 제공합니다.
+    BaseService의 메서드는 저장소 호출 결과를 그대로 반환하므로, 비동기 저장소에서는
+    코루틴(stream_multi는 비동기 이터레이터)을 반환하며 호출하는 쪽에서 await합니다.
+    하위 클래스에서 재정의할 때는 async def로 정의하고 super() 호출 결과를 await합니다.
+    """
+    repository: AsyncBaseRepository
+
+    def __init__(self, repository: AsyncBaseRepository):
+        """
+        서비스 초기화
+
+        Args:
+            repository: 비동기 저장소 인스턴스
+        """
+        super().__init__(repository)
@@ -1,8 +1,10 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.core.repositories.base import BaseRepository
+from app.core.utils.counting import CountStrategy
+from app.core.utils.filtering import QuerySpec
 
 # 모델 타입 변수
 ModelType = TypeVar("ModelType")
@@ -28,21 +30,30 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
         """
         self.repository = repository
     
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
+    def get(
+        self, db: Session, id: Any, fields: Optional[Sequence[str]] = None
+    ) -> Optional[ModelType]:
         """
         ID로 항목 조회
         
         Args:
             db: 데이터베이스 세션
             id: 항목 ID
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
             
         Returns:
             조회된 항목 또는 None
         """
-        return self.repository.get(db=db, id=id)
+        return self.repository.get(db=db, id=id, fields=fields)
     
     def get_multi(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        spec: Optional[QuerySpec] = None,
     ) -> List[ModelType]:
         """
         여러 항목 조회
@@ -51,39 +62,104 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
             db: 데이터베이스 세션
             skip: 건너뛸 항목 수
             limit: 최대 항목 수
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
+            spec: 필터 조건과 정렬 순서 (기본값: 조건 없이 ID 순)
             
         Returns:
             항목 목록
         """
-        return self.repository.get_multi(db=db, skip=skip, limit=limit)
+        return self.repository.get_multi(
+            db=db, skip=skip, limit=limit, fields=fields, spec=spec
+        )
     
-    def get_count(self, db: Session) -> int:
+    def stream_multi(
+        self,
+        db: Session,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        전체 항목을 ID 순으로 스트리밍 조회
+        
+        Args:
+            db: 데이터베이스 세션 (반복이 끝날 때까지 열려 있어야 함)
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
+            batch_size: 한 번에 가져올 행 수 (기본값: DB_STREAM_BATCH_SIZE)
+            
+        Returns:
+            항목 이터레이터
+        """
+        return self.repository.stream_multi(db=db, fields=fields, batch_size=batch_size)
+    
+    def get_count(
+        self,
+        db: Session,
+        *,
+        strategy: Optional[CountStrategy] = None,
+        spec: Optional[QuerySpec] = None,
+    ) -> Optional[int]:
         """
         항목 수 조회
         
         Args:
             db: 데이터베이스 세션
+            strategy: 계산 방식 (기본값: 저장소의 count_strategy)
+            spec: 필터 조건 (지정 시 조건에 맞는 항목 수를 정확히 계산)
+            
+        Returns:
+            항목 수 또는 None (CountStrategy.NONE인 경우)
+        """
+        return self.repository.get_count(db=db, strategy=strategy, spec=spec)
+    
+    def search(
+        self,
+        db: Session,
+        query: str,
+        *,
+        skip: int = 0,
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ModelType]:
+        """
+        검색어로 항목 검색 (관련도 순)
+        
+        Args:
+            db: 데이터베이스 세션
+            query: 검색어
+            skip: 건너뛸 항목 수
+            limit: 최대 항목 수
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
             
         Returns:
-            항목 수
+            항목 목록
         """
-        return self.repository.get_count(db=db)
+        return self.repository.search(db, query, skip=skip, limit=limit, fields=fields)
     
-    def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
+    def create(
+        self, db: Session, *, obj_in: CreateSchemaType, commit: bool = False
+    ) -> ModelType:
         """
         항목 생성
         
         Args:
             db: 데이터베이스 세션
             obj_in: 생성할 항목 데이터
+            commit: 즉시 커밋할지 여부 (기본값: 요청이 끝날 때 커밋)
             
         Returns:
             생성된 항목
         """
-        return self.repository.create(db=db, obj_in=obj_in)
+        return self.repository.create(db=db, obj_in=obj_in, commit=commit)
     
     def update(
-        self, db: Session, *, id: Any, obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+        self,
+        db: Session,
+        *,
+        id: Any,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        where: Optional[Dict[str, Any]] = None,
+        commit: bool = False,
     ) -> Optional[ModelType]:
         """
         항목 업데이트
@@ -92,30 +168,29 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
             db: 데이터베이스 세션
             id: 업데이트할 항목 ID
             obj_in: 업데이트 데이터
+            where: 추가 조건 (일치하는 항목만 갱신)
+            commit: 즉시 커밋할지 여부 (기본값: 요청이 끝날 때 커밋)
             
         Returns:
             업데이트된 항목 또는 None
         """
-        db_obj = self.repository.get(db=db, id=id)
-        if not db_obj:
-            return None
-        return self.repository.update(db=db, db_obj=db_obj, obj_in=obj_in)
+        return self.repository.update_by_id(
+            db=db, id=id, obj_in=obj_in, where=where, commit=commit
+        )
     
-    def remove(self, db: Session, *, id: Any) -> Optional[ModelType]:
+    def remove(self, db: Session, *, id: Any, commit: bool = False) -> Optional[ModelType]:
         """
         항목 삭제
         
         Args:
             db: 데이터베이스 세션
             id: 삭제할 항목 ID
+            commit: 즉시 커밋할지 여부 (기본값: 요청이 끝날 때 커밋)
             
         Returns:
             삭제된 항목 또는 None
         """
-        db_obj = self.repository.get(db=db, id=id)
-        if not db_obj:
-            return None
-        return self.repository.remove(db=db, id=id)
+        return self.repository.remove(db=db, id=id, commit=commit)
     
     def get_by_field(self, db: Session, field_name: str, value: Any) -> Optional[ModelType]:
         """
@@ -132,7 +207,14 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
         return self.repository.get_by_field(db=db, field_name=field_name, value=value)
     
     def get_multi_by_field(
-        self, db: Session, field_name: str, value: Any, *, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        field_name: str,
+        value: Any,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[ModelType]:
         """
         필드 값으로 여러 항목 조회
@@ -143,10 +225,154 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
             value: 필드 값
             skip: 건너뛸 항목 수
             limit: 최대 항목 수
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
             
         Returns:
             항목 목록
         """
         return self.repository.get_multi_by_field(
-            db=db, field_name=field_name, value=value, skip=skip, limit=limit
-        ) 
\ No newline at end of file
+            db=db, field_name=field_name, value=value, skip=skip, limit=limit, fields=fields
+        )
+    
+    def get_multi_keyset(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: str = "id",
+        fields: Optional[Sequence[str]] = None,
+        spec: Optional[QuerySpec] = None,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        커서 기반(키셋) 페이지네이션으로 여러 항목 조회
+        
+        Args:
+            db: 데이터베이스 세션
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            limit: 최대 항목 수
+            order_by: 정렬 기준 필드 (내림차순은 "-" 접두사)
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
+            spec: 필터 조건 (정렬은 order_by 사용)
+            
+        Returns:
+            (항목 목록, 다음 페이지 커서) 튜플
+        """
+        return self.repository.get_multi_keyset(
+            db=db, cursor=cursor, limit=limit, order_by=order_by, fields=fields, spec=spec
+        )
+    
+    def get_multi_by_field_keyset(
+        self,
+        db: Session,
+        field_name: str,
+        value: Any,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: str = "id",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        필드 값으로 여러 항목을 커서 기반(키셋) 페이지네이션으로 조회
+        
+        Args:
+            db: 데이터베이스 세션
+            field_name: 필드 이름
+            value: 필드 값
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            limit: 최대 항목 수
+            order_by: 정렬 기준 필드 (내림차순은 "-" 접두사)
+            fields: 조회할 필드 목록 (지정 시 ORM 객체 대신 딕셔너리 반환)
+            
+        Returns:
+            (항목 목록, 다음 페이지 커서) 튜플
+        """
+        return self.repository.get_multi_by_field_keyset(
+            db=db,
+            field_name=field_name,
+            value=value,
+            cursor=cursor,
+            limit=limit,
+            order_by=order_by,
+            fields=fields,
+        )
+    
+    def create_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        batch_size: Optional[int] = None,
+        commit: bool = False,
+    ) -> List[ModelType]:
+        """
+        여러 항목 일괄 생성
+        
+        Args:
+            db: 데이터베이스 세션
+            objs_in: 생성할 항목 데이터 목록
+            batch_size: 한 번에 처리할 최대 행 수
+            commit: 즉시 커밋할지 여부 (기본값: 요청이 끝날 때 커밋)
+        
+        Returns:
+            생성된 항목 목록
+        """
+        return self.repository.create_many(
+            db, objs_in=objs_in, batch_size=batch_size, commit=commit
+        )
+    
+    def upsert_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        conflict_fields: Optional[Sequence[str]] = None,
+        update_fields: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+        commit: bool = False,
+    ) -> List[ModelType]:
+        """
+        여러 항목 일괄 생성 또는 갱신
+        
+        Args:
+            db: 데이터베이스 세션
+            objs_in: 생성 또는 갱신할 항목 데이터 목록
+            conflict_fields: 충돌 판단에 사용할 고유 키
+            update_fields: 충돌 시 갱신할 필드 (기본값: 저장소의 upsert_update_fields)
+            batch_size: 한 번에 처리할 최대 행 수
+            commit: 즉시 커밋할지 여부 (기본값: 요청이 끝날 때 커밋)
+        
+        Returns:
+            생성 또는 갱신된 항목 목록
+        """
+        return self.repository.upsert_many(
+            db,
+            objs_in=objs_in,
+            conflict_fields=conflict_fields,
+            update_fields=update_fields,
+            batch_size=batch_size,
+            commit=commit,
+        )
+    
+    def remove_many(
+        self,
+        db: Session,
+        *,
+        ids: Sequence[Any],
+        batch_size: Optional[int] = None,
+        commit: bool = False,
+    ) -> List[ModelType]:
+        """
+        여러 항목 일괄 삭제
+        
+        Args:
+            db: 데이터베이스 세션
+            ids: 삭제할 항목 ID 목록
+            batch_size: 한 번에 처리할 최대 행 수
+            commit: 즉시 커밋할지 여부 (기본값: 요청이 끝날 때 커밋)
+        
+        Returns:
+            삭제된 항목 목록
+        """
+        return self.repository.remove_many(db, ids=ids, batch_size=batch_size, commit=commit)
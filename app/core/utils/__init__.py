@@ -8,10 +8,16 @@ from app.core.utils.common import (
     format_datetime,
     parse_datetime,
     truncate_string,
+    chunked,
 )
 from app.core.utils.security import (
     verify_password,
     get_password_hash,
+    verify_and_update_password,
+    averify_password,
+    averify_and_update_password,
+    ahash_password,
+    ahash_update_data,
     create_access_token,
     decode_token,
     get_current_user,
@@ -28,8 +34,14 @@ __all__ = [
     "format_datetime",
     "parse_datetime",
     "truncate_string",
+    "chunked",
     "verify_password",
     "get_password_hash",
+    "verify_and_update_password",
+    "averify_password",
+    "averify_and_update_password",
+    "ahash_password",
+    "ahash_update_data",
     "create_access_token",
     "decode_token",
     "get_current_user",
@@ -2,12 +2,14 @@ import os
 import json
 import uuid
 import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
 import logging
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 def generate_uuid() -> str:
     """
     UUID 생성
@@ -125,4 +127,26 @@ def truncate_string(text: str, max_length: int = 100) -> str:
     """
     if len(text) <= max_length:
         return text
-    return text[:max_length] + "..." 
\ No newline at end of file
+    return text[:max_length] + "..."
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    반복 가능한 객체를 일정 크기의 묶음으로 분할
+    
+    Args:
+        items: 분할할 항목들
+        size: 묶음 크기
+        
+    Returns:
+        항목 묶음 이터레이터
+    """
+    if size < 1:
+        raise ValueError("size는 1 이상이어야 합니다")
+    batch: List[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,108 @@
+from enum import Enum
+from typing import Any, Optional, Union
+
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+from app.core.cache.backends import MISSING, LocalTTLCache
+from app.core.config import settings
+
+# 테이블별 정확한 개수 캐시 (CountStrategy.CACHED)
+count_cache = LocalTTLCache(maxsize=1024, ttl=settings.COUNT_CACHE_TTL_SECONDS)
+
+
+class CountStrategy(str, Enum):
+    """
+    전체 항목 수 계산 방식
+
+    - exact: COUNT(*)로 정확히 계산
+    - cached: 정확한 개수를 COUNT_CACHE_TTL_SECONDS 동안 캐시
+    - estimated: 통계 기반 추정치 (PostgreSQL pg_class.reltuples / PostgREST count=planned)
+    - none: 계산하지 않음 (응답의 has_more로 다음 페이지 여부만 전달)
+    """
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+# 설정의 기본 계산 방식 (요청마다 변환하지 않도록 시작 시 한 번만 변환)
+DEFAULT_COUNT_STRATEGY = CountStrategy(settings.DEFAULT_COUNT_STRATEGY)
+
+
+def resolve_count_strategy(*candidates: Union[CountStrategy, str, None]) -> CountStrategy:
+    """
+    우선순위대로 처음 지정된 계산 방식 선택
+
+    요청 > 저장소 > 설정(DEFAULT_COUNT_STRATEGY) 순서로 전달합니다.
+
+    Args:
+        candidates: 계산 방식 후보 목록
+
+    Returns:
+        선택된 계산 방식
+    """
+    for candidate in candidates:
+        if candidate:
+            return CountStrategy(candidate)
+    return DEFAULT_COUNT_STRATEGY
+
+
+def get_cached_count(key: str) -> Optional[int]:
+    """
+    캐시된 개수 조회
+
+    Args:
+        key: 캐시 키 (보통 테이블 이름)
+
+    Returns:
+        캐시된 개수 또는 None
+    """
+    value = count_cache.get(key)
+    return None if value is MISSING else value
+
+
+def set_cached_count(key: str, count: int) -> None:
+    """
+    개수 캐시
+
+    Args:
+        key: 캐시 키 (보통 테이블 이름)
+        count: 정확한 개수
+    """
+    count_cache.set(key, count)
+
+
+def estimated_count_statement(dialect_name: str) -> Optional[TextClause]:
+    """
+    데이터베이스별 추정 개수 조회 쿼리 반환
+
+    Args:
+        dialect_name: SQLAlchemy 방언 이름
+
+    Returns:
+        :table_name 파라미터를 받는 쿼리 또는 None (추정치를 지원하지 않는 경우)
+    """
+    if dialect_name == "postgresql":
+        return text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"
+        )
+    return None
+
+
+def usable_estimate(estimate: Any) -> Optional[int]:
+    """
+    추정치 검증
+
+    ANALYZE 전인 테이블은 reltuples가 -1(PostgreSQL 14+) 또는 0이므로
+    이 경우 None을 반환해 정확한 개수로 대체하도록 합니다.
+
+    Args:
+        estimate: 조회된 추정치
+
+    Returns:
+        사용할 수 있는 추정치 또는 None
+    """
+    if estimate is None or estimate <= 0:
+        return None
+    return int(estimate)
@@ -0,0 +1,159 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.utils.common import chunked
+
+# 응답 한 조각에 묶을 행 수 (행마다 전송하면 스레드풀 전환과 write 호출이 많아짐)
+EXPORT_CHUNK_ROWS = 500
+
+
+class ExportFormat(str, Enum):
+    """
+    내보내기 형식
+
+    - ndjson: 한 줄에 JSON 객체 하나
+    - csv: 첫 줄이 헤더인 CSV
+    """
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """응답 Content-Type"""
+        if self is ExportFormat.CSV:
+            return "text/csv; charset=utf-8"
+        return "application/x-ndjson"
+
+
+class ExportEncoder:
+    """
+    행 묶음을 내보내기 형식의 문자열로 변환
+
+    CSV 헤더는 첫 묶음에만 씁니다.
+    """
+    def __init__(self, export_format: ExportFormat, columns: Optional[Sequence[str]] = None):
+        """
+        변환기 초기화
+
+        Args:
+            export_format: 내보내기 형식
+            columns: CSV 컬럼 순서 (None이면 첫 행의 키 순서)
+        """
+        self.export_format = export_format
+        self.columns = list(columns) if columns else None
+        self.header_written = False
+
+    def encode(self, rows: List[Dict[str, Any]]) -> str:
+        """
+        행 묶음 변환
+
+        Args:
+            rows: 컬럼 이름과 값의 딕셔너리 목록
+
+        Returns:
+            응답 본문 조각
+        """
+        rows = jsonable_encoder(rows)
+        if self.export_format is ExportFormat.NDJSON:
+            return "".join(
+                json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n" for row in rows
+            )
+        if self.columns is None:
+            if not rows:
+                return ""
+            self.columns = list(rows[0].keys())
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.columns, extrasaction="ignore")
+        if not self.header_written:
+            writer.writeheader()
+            self.header_written = True
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    def finish(self) -> str:
+        """
+        마지막 조각 반환
+
+        행이 하나도 없던 CSV도 헤더는 포함되도록 합니다.
+
+        Returns:
+            남은 응답 본문 조각
+        """
+        if self.export_format is ExportFormat.CSV and not self.header_written and self.columns:
+            return self.encode([])
+        return ""
+
+
+def export_headers(filename: str, export_format: ExportFormat) -> Dict[str, str]:
+    """
+    내보내기 응답 헤더 생성
+
+    Args:
+        filename: 확장자를 제외한 파일 이름
+        export_format: 내보내기 형식
+
+    Returns:
+        Content-Disposition 헤더
+    """
+    return {
+        "Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'
+    }
+
+
+def encode_rows(
+    rows: Iterable[Dict[str, Any]],
+    export_format: ExportFormat,
+    columns: Optional[Sequence[str]] = None,
+) -> Iterator[str]:
+    """
+    행 이터레이터를 EXPORT_CHUNK_ROWS 행씩 묶어 응답 본문 조각으로 변환
+
+    Args:
+        rows: 컬럼 이름과 값의 딕셔너리 이터레이터
+        export_format: 내보내기 형식
+        columns: CSV 컬럼 순서 (None이면 첫 행의 키 순서)
+
+    Returns:
+        응답 본문 조각 이터레이터
+    """
+    encoder = ExportEncoder(export_format, columns)
+    for batch in chunked(rows, EXPORT_CHUNK_ROWS):
+        yield encoder.encode(batch)
+    tail = encoder.finish()
+    if tail:
+        yield tail
+
+
+async def aencode_rows(
+    rows: AsyncIterator[Dict[str, Any]],
+    export_format: ExportFormat,
+    columns: Optional[Sequence[str]] = None,
+) -> AsyncIterator[str]:
+    """
+    비동기 행 이터레이터를 EXPORT_CHUNK_ROWS 행씩 묶어 응답 본문 조각으로 변환
+
+    Args:
+        rows: 컬럼 이름과 값의 딕셔너리 비동기 이터레이터
+        export_format: 내보내기 형식
+        columns: CSV 컬럼 순서 (None이면 첫 행의 키 순서)
+
+    Returns:
+        응답 본문 조각 비동기 이터레이터
+    """
+    encoder = ExportEncoder(export_format, columns)
+    batch: List[Dict[str, Any]] = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= EXPORT_CHUNK_ROWS:
+            yield encoder.encode(batch)
+            batch = []
+    if batch:
+        yield encoder.encode(batch)
+    tail = encoder.finish()
+    if tail:
+        yield tail
@@ -0,0 +1,340 @@
+import datetime
+import decimal
+from enum import Enum
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy.sql import Select
+
+# 목록 조회 필터/정렬 명세
+#
+# 쿼리 파라미터 형식:
+#   filter=필드:연산자:값 (여러 번 지정 가능, 모두 AND로 결합)
+#     예) filter=is_active:eq:true, filter=id:in:1,2,3,
+#         filter=created_at:gte:2024-01-01T00:00:00, filter=username:prefix:kim,
+#         filter=full_name:is_null:false
+#   sort=필드 목록 (쉼표로 구분, 내림차순은 "-" 접두사, 예: -created_at,username)
+#
+# 필터/정렬할 수 있는 필드는 저장소의 filter_fields/sort_fields로 모델별로 제한합니다.
+# 인덱스가 있는 컬럼만 지정해 조건과 정렬이 데이터베이스 인덱스를 타도록 합니다.
+
+# in 연산자에 전달할 수 있는 최대 값 수
+MAX_IN_VALUES = 100
+
+
+class FilterOp(str, Enum):
+    """
+    필터 연산자
+
+    - eq: 같음
+    - in: 쉼표로 구분한 값 중 하나
+    - gt, gte, lt, lte: 범위 (함께 지정해 구간 조회)
+    - prefix: 문자열 접두사 (LIKE 'abc%')
+    - is_null: NULL 여부 (true/false)
+    """
+    EQ = "eq"
+    IN = "in"
+    GT = "gt"
+    GTE = "gte"
+    LT = "lt"
+    LTE = "lte"
+    PREFIX = "prefix"
+    IS_NULL = "is_null"
+
+
+class FilterCondition:
+    """필드 하나에 대한 필터 조건"""
+    def __init__(self, field: str, op: FilterOp, value: Any):
+        """
+        조건 초기화
+
+        Args:
+            field: 필드 이름
+            op: 연산자
+            value: 값 (쿼리 문자열 그대로, in은 문자열 목록, is_null은 bool)
+        """
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"FilterCondition({self.field!r}, {self.op.value!r}, {self.value!r})"
+
+
+class QuerySpec:
+    """목록 조회에 적용할 필터 조건과 정렬 순서"""
+    def __init__(
+        self,
+        filters: Sequence[FilterCondition] = (),
+        order: Sequence[Tuple[str, bool]] = (),
+    ):
+        """
+        명세 초기화
+
+        Args:
+            filters: 필터 조건 목록 (AND로 결합)
+            order: (필드 이름, 내림차순 여부) 목록
+        """
+        self.filters = list(filters)
+        self.order = list(order)
+
+    @property
+    def sort_key(self) -> Optional[str]:
+        """
+        커서 페이지네이션에 사용할 정렬 기준 (내림차순은 "-" 접두사)
+
+        정렬 필드가 없으면 "id", 두 개 이상이면 커서를 만들 수 없으므로 None입니다.
+        """
+        if not self.order:
+            return "id"
+        if len(self.order) > 1:
+            return None
+        field_name, descending = self.order[0]
+        return f"-{field_name}" if descending else field_name
+
+    @property
+    def sort_fields(self) -> List[str]:
+        """정렬에 사용하는 필드 이름 목록"""
+        return [field_name for field_name, _ in self.order]
+
+
+def parse_query_spec(
+    filters: Optional[Sequence[str]],
+    sort: Optional[str],
+    *,
+    filter_fields: Iterable[str],
+    sort_fields: Iterable[str],
+) -> QuerySpec:
+    """
+    filter/sort 쿼리 파라미터 파싱
+
+    Args:
+        filters: "필드:연산자:값" 형식의 필터 목록
+        sort: 쉼표로 구분된 정렬 필드 목록 (내림차순은 "-" 접두사)
+        filter_fields: 필터할 수 있는 필드 이름 목록
+        sort_fields: 정렬할 수 있는 필드 이름 목록 (id는 항상 허용)
+
+    Returns:
+        파싱된 명세
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 허용되지 않은 필드/연산자인 경우
+    """
+    filter_fields = set(filter_fields)
+    conditions = []
+    for raw in filters or ():
+        parts = raw.split(":", 2)
+        if len(parts) != 3:
+            raise ValueError(f"필터 형식이 잘못되었습니다 (필드:연산자:값): {raw}")
+        field_name, op_name, value = (part.strip() for part in parts)
+        if field_name not in filter_fields:
+            raise ValueError(f"필터할 수 없는 필드입니다: {field_name}")
+        try:
+            op = FilterOp(op_name)
+        except ValueError:
+            raise ValueError(f"지원하지 않는 필터 연산자입니다: {op_name}")
+        conditions.append(FilterCondition(field_name, op, _parse_value(op, value)))
+
+    sort_fields = {"id", *sort_fields}
+    order = []
+    for name in (sort or "").split(","):
+        name = name.strip()
+        if not name:
+            continue
+        descending = name.startswith("-")
+        field_name = name.lstrip("-")
+        if field_name not in sort_fields:
+            raise ValueError(f"정렬할 수 없는 필드입니다: {field_name}")
+        if any(field_name == existing for existing, _ in order):
+            raise ValueError(f"정렬 필드가 중복되었습니다: {field_name}")
+        order.append((field_name, descending))
+    return QuerySpec(conditions, order)
+
+
+def _parse_value(op: FilterOp, value: str) -> Any:
+    """연산자에 맞게 쿼리 문자열 값 파싱 (타입 변환은 컬럼을 아는 단계에서 수행)"""
+    if op == FilterOp.IN:
+        values = [item.strip() for item in value.split(",") if item.strip()]
+        if not values:
+            raise ValueError("in 필터에는 값이 하나 이상 필요합니다")
+        if len(values) > MAX_IN_VALUES:
+            raise ValueError(f"in 필터에는 최대 {MAX_IN_VALUES}개의 값만 지정할 수 있습니다")
+        return values
+    if op == FilterOp.IS_NULL:
+        return _parse_bool(value)
+    if op == FilterOp.PREFIX and not value:
+        raise ValueError("prefix 필터에는 값이 필요합니다")
+    return value
+
+
+def _parse_bool(value: str) -> bool:
+    """true/false 문자열을 bool로 변환"""
+    lowered = value.lower()
+    if lowered in ("true", "1", "yes"):
+        return True
+    if lowered in ("false", "0", "no"):
+        return False
+    raise ValueError(f"true 또는 false가 필요합니다: {value}")
+
+
+def convert_column_value(column: Any, value: str) -> Any:
+    """
+    쿼리 문자열 값을 컬럼 타입에 맞게 변환
+
+    Args:
+        column: SQLAlchemy 컬럼
+        value: 쿼리 문자열 값
+
+    Returns:
+        변환된 값
+
+    Raises:
+        ValueError: 컬럼 타입으로 변환할 수 없는 경우
+    """
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        if python_type is bool:
+            return _parse_bool(value)
+        if python_type is datetime.datetime:
+            return datetime.datetime.fromisoformat(value)
+        if python_type is datetime.date:
+            return datetime.date.fromisoformat(value)
+        if python_type in (int, float, decimal.Decimal):
+            return python_type(value)
+    except (ValueError, decimal.InvalidOperation):
+        raise ValueError(f"{column.key} 필드에 사용할 수 없는 값입니다: {value}")
+    return value
+
+
+def apply_filters(stmt: Select, model: Any, filters: Sequence[FilterCondition]) -> Select:
+    """
+    select 문에 필터 조건 적용
+
+    Args:
+        stmt: select 문
+        model: SQLAlchemy 모델 클래스
+        filters: 필터 조건 목록
+
+    Returns:
+        WHERE 절이 추가된 select 문
+
+    Raises:
+        ValueError: 모델에 없는 필드이거나 값을 변환할 수 없는 경우
+    """
+    columns = model.__table__.columns
+    for condition in filters:
+        if condition.field not in columns:
+            raise ValueError(f"필터할 수 없는 필드입니다: {condition.field}")
+        column = getattr(model, condition.field)
+        op, value = condition.op, condition.value
+        if op == FilterOp.IS_NULL:
+            clause = column.is_(None) if value else column.is_not(None)
+        elif op == FilterOp.IN:
+            clause = column.in_([convert_column_value(column, item) for item in value])
+        elif op == FilterOp.PREFIX:
+            clause = column.startswith(value, autoescape=True)
+        else:
+            value = convert_column_value(column, value)
+            if op == FilterOp.EQ:
+                clause = column == value
+            elif op == FilterOp.GT:
+                clause = column > value
+            elif op == FilterOp.GTE:
+                clause = column >= value
+            elif op == FilterOp.LT:
+                clause = column < value
+            else:
+                clause = column <= value
+        stmt = stmt.where(clause)
+    return stmt
+
+
+def apply_order(stmt: Select, model: Any, order: Sequence[Tuple[str, bool]]) -> Select:
+    """
+    select 문에 정렬 적용
+
+    결과 순서가 항상 같도록 정렬 필드에 id가 없으면 마지막 정렬 필드와 같은 방향으로
+    id를 추가하고, 정렬 키가 NULL인 행은 방향과 관계없이 마지막에 둡니다 (NULLS LAST).
+    첫 페이지를 OFFSET으로 조회한 뒤 커서로 이어서 조회해도 apply_keyset의 정렬과 일치합니다.
+
+    Args:
+        stmt: select 문
+        model: SQLAlchemy 모델 클래스
+        order: (필드 이름, 내림차순 여부) 목록
+
+    Returns:
+        ORDER BY 절이 추가된 select 문
+
+    Raises:
+        ValueError: 모델에 없는 필드인 경우
+    """
+    columns = model.__table__.columns
+    clauses = []
+    for field_name, descending in order:
+        if field_name not in columns:
+            raise ValueError(f"정렬할 수 없는 필드입니다: {field_name}")
+        column = getattr(model, field_name)
+        clause = column.desc() if descending else column.asc()
+        clauses.append(clause if field_name == "id" else clause.nulls_last())
+    if not any(field_name == "id" for field_name, _ in order):
+        clauses.append(model.id.desc() if _last_descending(order) else model.id.asc())
+    return stmt.order_by(*clauses)
+
+
+def postgrest_filters(query: Any, filters: Sequence[FilterCondition]) -> Any:
+    """
+    PostgREST 쿼리 빌더에 필터 조건 적용
+
+    Args:
+        query: Supabase 쿼리 빌더
+        filters: 필터 조건 목록
+
+    Returns:
+        필터가 적용된 쿼리 빌더
+
+    Raises:
+        ValueError: PostgREST로 표현할 수 없는 값인 경우
+    """
+    for condition in filters:
+        field_name, op, value = condition.field, condition.op, condition.value
+        if op == FilterOp.IS_NULL:
+            query = query.is_(field_name, "null") if value else query.not_.is_(field_name, "null")
+        elif op == FilterOp.IN:
+            query = query.in_(field_name, value)
+        elif op == FilterOp.PREFIX:
+            # PostgREST는 *를 %로 바꾸므로 값에 포함된 *는 이스케이프할 수 없음
+            if "*" in value:
+                raise ValueError("prefix 필터 값에는 *를 사용할 수 없습니다")
+            escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            query = query.like(field_name, f"{escaped}*")
+        else:
+            query = getattr(query, op.value)(field_name, value)
+    return query
+
+
+def postgrest_order(query: Any, order: Sequence[Tuple[str, bool]]) -> Any:
+    """
+    PostgREST 쿼리 빌더에 정렬 적용
+
+    id가 없으면 마지막 정렬 필드와 같은 방향으로 추가하고, 정렬 키가 NULL인 행은
+    마지막에 둡니다 (postgrest_keyset_filter의 정렬과 일치).
+
+    Args:
+        query: Supabase 쿼리 빌더
+        order: (필드 이름, 내림차순 여부) 목록
+
+    Returns:
+        정렬이 적용된 쿼리 빌더
+    """
+    for field_name, descending in order:
+        query = query.order(field_name, desc=descending, nullsfirst=False)
+    if not any(field_name == "id" for field_name, _ in order):
+        query = query.order("id", desc=_last_descending(order))
+    return query
+
+
+def _last_descending(order: Sequence[Tuple[str, bool]]) -> bool:
+    """마지막 정렬 필드가 내림차순인지 여부 (정렬 필드가 없으면 False)"""
+    return bool(order) and order[-1][1]
@@ -0,0 +1,223 @@
+import base64
+import binascii
+import datetime
+import json
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import Select
+
+
+def encode_cursor(order_by: str, value: Any, id: Any) -> str:
+    """
+    커서 인코딩
+
+    마지막 항목의 정렬 키와 ID를 불투명한 URL-safe 문자열로 변환합니다.
+
+    Args:
+        order_by: 정렬 기준 (내림차순은 "-" 접두사)
+        value: 마지막 항목의 정렬 키 값
+        id: 마지막 항목의 ID
+
+    Returns:
+        커서 문자열
+    """
+    payload = jsonable_encoder({"o": order_by, "v": value, "id": id})
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str) -> Tuple[Any, Any]:
+    """
+    커서 디코딩
+
+    Args:
+        cursor: 커서 문자열
+        order_by: 현재 요청의 정렬 기준
+
+    Returns:
+        (정렬 키 값, ID) 튜플
+
+    Raises:
+        ValueError: 커서 형식이 잘못되었거나 정렬 기준이 다른 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_order_by, value, id = payload["o"], payload["v"], payload["id"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("유효하지 않은 커서입니다")
+    if cursor_order_by != order_by:
+        raise ValueError("커서의 정렬 기준이 요청과 일치하지 않습니다")
+    return value, id
+
+
+def parse_order_by(order_by: str) -> Tuple[str, bool]:
+    """
+    정렬 기준 파싱
+
+    Args:
+        order_by: 정렬 기준 (내림차순은 "-" 접두사)
+
+    Returns:
+        (필드 이름, 내림차순 여부) 튜플
+    """
+    if order_by.startswith("-"):
+        return order_by[1:], True
+    return order_by, False
+
+
+def get_item_value(item: Any, field_name: str) -> Any:
+    """ORM 객체와 딕셔너리 모두에서 필드 값 조회"""
+    if isinstance(item, dict):
+        return item.get(field_name)
+    return getattr(item, field_name)
+
+
+def build_next_cursor(items: Sequence[Any], order_by: str, limit: int) -> Optional[str]:
+    """
+    다음 페이지 커서 생성
+
+    Args:
+        items: 현재 페이지 항목 목록
+        order_by: 정렬 기준
+        limit: 페이지 크기
+
+    Returns:
+        다음 페이지 커서 또는 None (마지막 페이지인 경우)
+    """
+    if not items or len(items) < limit:
+        return None
+    field_name, _ = parse_order_by(order_by)
+    last = items[-1]
+    return encode_cursor(order_by, get_item_value(last, field_name), get_item_value(last, "id"))
+
+
+def split_keyset_page(
+    rows: List[Any], order_by: str, limit: int
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    limit + 1개로 조회한 결과를 현재 페이지와 다음 커서로 분리
+
+    Args:
+        rows: limit + 1개까지 조회한 항목 목록
+        order_by: 정렬 기준
+        limit: 페이지 크기
+
+    Returns:
+        (항목 목록, 다음 페이지 커서) 튜플
+    """
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    next_cursor = build_next_cursor(items, order_by, limit) if has_more else None
+    return items, next_cursor
+
+
+def coerce_column_value(column: Any, value: Any) -> Any:
+    """JSON으로 직렬화된 값을 컬럼 타입에 맞게 변환"""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime.datetime and isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    if python_type is datetime.date and isinstance(value, str):
+        return datetime.date.fromisoformat(value)
+    return value
+
+
+def apply_keyset(
+    stmt: Select, model: Any, *, cursor: Optional[str], order_by: str, limit: int
+) -> Select:
+    """
+    select 문에 키셋 페이지네이션 적용
+
+    정렬 키 + ID 복합 조건으로 이전 페이지 이후의 항목만 조회하며,
+    다음 페이지 존재 여부를 판단하기 위해 limit + 1개를 조회합니다.
+    정렬 키가 NULL인 행은 정렬 방향과 관계없이 마지막에 ID 순으로 옵니다 (NULLS LAST).
+
+    Args:
+        stmt: select 문
+        model: SQLAlchemy 모델 클래스
+        cursor: 이전 페이지의 커서
+        order_by: 정렬 기준 (내림차순은 "-" 접두사)
+        limit: 페이지 크기
+
+    Returns:
+        키셋 조건과 정렬이 적용된 select 문
+
+    Raises:
+        ValueError: 커서 또는 정렬 기준이 잘못된 경우
+    """
+    field_name, descending = parse_order_by(order_by)
+    if field_name not in model.__table__.columns:
+        raise ValueError(f"정렬할 수 없는 필드입니다: {field_name}")
+    column = getattr(model, field_name)
+    id_column = model.id
+
+    if cursor:
+        value, last_id = decode_cursor(cursor, order_by)
+        value = coerce_column_value(column, value)
+        after_id = id_column < last_id if descending else id_column > last_id
+        if field_name == "id":
+            stmt = stmt.where(after_id)
+        elif value is None:
+            # 마지막 항목이 NULL 구간이면 남은 NULL 행만 ID 순으로 조회
+            stmt = stmt.where(and_(column.is_(None), after_id))
+        else:
+            after_value = column < value if descending else column > value
+            conditions = [after_value, and_(column == value, after_id)]
+            if column.nullable:
+                conditions.append(column.is_(None))
+            stmt = stmt.where(or_(*conditions))
+
+    if field_name == "id":
+        order_clauses = [id_column.desc() if descending else id_column.asc()]
+    elif descending:
+        order_clauses = [column.desc().nulls_last(), id_column.desc()]
+    else:
+        order_clauses = [column.asc().nulls_last(), id_column.asc()]
+    return stmt.order_by(*order_clauses).limit(limit + 1)
+
+
+def postgrest_keyset_filter(
+    query: Any, *, cursor: Optional[str], order_by: str, limit: int
+) -> Any:
+    """
+    PostgREST 쿼리 빌더에 키셋 페이지네이션 적용
+
+    apply_keyset과 같이 정렬 키가 NULL인 행은 마지막에 ID 순으로 옵니다 (NULLS LAST).
+
+    Args:
+        query: Supabase 쿼리 빌더
+        cursor: 이전 페이지의 커서
+        order_by: 정렬 기준 (내림차순은 "-" 접두사)
+        limit: 페이지 크기
+
+    Returns:
+        키셋 조건과 정렬이 적용된 쿼리 빌더
+    """
+    field_name, descending = parse_order_by(order_by)
+    op = "lt" if descending else "gt"
+
+    if cursor:
+        value, last_id = decode_cursor(cursor, order_by)
+        if field_name == "id":
+            query = getattr(query, op)("id", last_id)
+        elif value is None:
+            query = getattr(query.is_(field_name, "null"), op)("id", last_id)
+        else:
+            quoted = json.dumps(value) if isinstance(value, str) else value
+            query = query.or_(
+                f"{field_name}.{op}.{quoted},"
+                f"and({field_name}.eq.{quoted},id.{op}.{last_id}),"
+                f"{field_name}.is.null"
+            )
+
+    query = query.order(field_name, desc=descending, nullsfirst=False)
+    if field_name != "id":
+        query = query.order("id", desc=descending)
+    return query.limit(limit + 1)
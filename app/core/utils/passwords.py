@@ -0,0 +1,361 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from app.core.config import settings
+from app.core.observability import record_timing, timed
+
+# 지원하는 해시 알고리즘 (설정한 알고리즘 외의 해시도 검증은 되며, 로그인 시 다시 해싱됨)
+SUPPORTED_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_password_context() -> CryptContext:
+    """
+    설정의 알고리즘/비용으로 비밀번호 해싱 컨텍스트 생성
+
+    비용은 scripts/calibrate_password_hash.py로 서버에서 측정해 정합니다.
+    저장된 해시의 알고리즘이나 비용이 설정과 다르면 needs_update가 참이 되어
+    로그인 시 새 설정으로 다시 해싱됩니다.
+
+    Returns:
+        비밀번호 해싱 컨텍스트
+    """
+    scheme = settings.PASSWORD_HASH_SCHEME
+    if scheme not in SUPPORTED_SCHEMES:
+        raise ValueError(f"지원하지 않는 비밀번호 해시 알고리즘입니다: {scheme}")
+    return CryptContext(
+        schemes=[scheme, *(other for other in SUPPORTED_SCHEMES if other != scheme)],
+        deprecated="auto",
+        bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+        argon2__time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+        argon2__memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST,
+        argon2__parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+    )
+
+
+# 비밀번호 해싱 컨텍스트
+pwd_context = build_password_context()
+
+# 비밀번호 해싱 풀
+#
+# bcrypt 해싱/검증은 호출당 수십~수백 밀리초의 CPU 작업입니다. 이벤트 루프에서 직접 실행하면
+# 그동안 다른 요청이 모두 멈추고, 스레드풀에서 실행해도 로그인 요청이 몰리면 스레드를 모두
+# 차지해 다른 동기 핸들러까지 대기하게 됩니다. 비동기 경로에서는 averify_password/ahash_password로
+# CPU 코어 수만큼의 프로세스 풀에서 실행하고, 대기 중인 작업 수를 제한해 가득 차면 줄을 세우는
+# 대신 즉시 503으로 거절합니다.
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    비밀번호 검증
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해시된 비밀번호
+
+    Returns:
+        검증 결과
+    """
+    with timed("password"):
+        return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    """
+    비밀번호 해싱
+
+    Args:
+        password: 평문 비밀번호
+
+    Returns:
+        해시된 비밀번호
+    """
+    with timed("password"):
+        return pwd_context.hash(password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 및 재해싱
+
+    저장된 해시가 현재 설정(알고리즘/비용)과 다르면 검증에 성공했을 때
+    새 설정으로 만든 해시를 함께 반환합니다.
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해시된 비밀번호
+
+    Returns:
+        (검증 결과, 새 해시 또는 None)
+    """
+    with timed("password"):
+        return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+class PasswordHashPool:
+    """
+    비밀번호 해싱 작업 풀
+
+    프로세스 풀은 첫 사용 시 만들어지므로 워커 프로세스가 fork된 뒤에 생성됩니다.
+    실행 중이거나 대기 중인 작업 수가 max_pending에 이르면 새 작업을 거절합니다.
+    작업 프로세스가 비정상 종료되어 풀이 깨지면 풀을 버리고 새로 만들어 한 번 다시 실행합니다.
+    """
+    def __init__(self, workers: int, max_pending: int, use_processes: bool = True):
+        """
+        풀 초기화
+
+        Args:
+            workers: 작업 프로세스 수
+            max_pending: 실행 중이거나 대기 중인 작업의 최대 수
+            use_processes: False면 프로세스 대신 이벤트 루프 기본 스레드풀에서 실행
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.use_processes = use_processes
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.run_ms_sum = 0.0
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Optional[Executor]:
+        """프로세스 풀 반환 (처음 호출될 때 생성, 스레드 실행이면 None)"""
+        if not self.use_processes:
+            return None
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _discard_executor(self, executor: Executor) -> None:
+        """깨진 프로세스 풀 폐기 (다음 호출에서 새로 생성, 다른 호출이 이미 바꿨으면 그대로 둠)"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def start(self) -> None:
+        """프로세스 풀을 미리 생성 (첫 로그인 요청이 프로세스 시작 비용을 치르지 않도록)"""
+        executor = self._get_executor()
+        if executor is not None:
+            for _ in range(self.workers):
+                executor.submit(os.getpid)
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        함수를 풀에서 실행하고 결과 반환
+
+        Args:
+            func: 실행할 함수 (프로세스로 전달되도록 모듈 최상위 함수)
+            *args: 함수 인자
+
+        Returns:
+            함수 반환값
+
+        Raises:
+            HTTPException: 대기 중인 작업이 가득 찬 경우 (503)
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="요청이 많아 잠시 후 다시 시도해 주세요",
+                    headers={"Retry-After": "1"},
+                )
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                return await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                self._discard_executor(executor)
+                return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            # 대기 시간을 포함해 요청이 해싱으로 기다린 시간 (작업 프로세스/스레드에서는 기록하지 않음)
+            record_timing("password", elapsed_ms)
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+                self.run_ms_sum += elapsed_ms
+
+    def map(self, func: Callable[[Any], Any], items: Sequence[Any]) -> List[Any]:
+        """
+        여러 입력을 풀의 작업 프로세스에 나눠 실행하고 결과 목록 반환 (동기, 대량 작업용)
+
+        호출한 스레드는 모든 결과가 나올 때까지 기다립니다. 대기 작업 수 제한을 적용하지 않으므로
+        대량 가져오기 같은 관리 작업에서만 사용합니다. 스레드 실행 설정이면 호출한 스레드에서 차례로 실행합니다.
+
+        Args:
+            func: 실행할 함수 (프로세스로 전달되도록 모듈 최상위 함수)
+            items: 함수 인자 목록
+
+        Returns:
+            함수 반환값 목록 (입력 순서 유지)
+        """
+        executor = self._get_executor()
+        if executor is None or len(items) < 2:
+            return [func(item) for item in items]
+        started = time.perf_counter()
+        chunksize = max(1, len(items) // (self.workers * 4))
+        try:
+            try:
+                return list(executor.map(func, items, chunksize=chunksize))
+            except BrokenProcessPool:
+                self._discard_executor(executor)
+                return list(self._get_executor().map(func, items, chunksize=chunksize))
+        finally:
+            record_timing("password", (time.perf_counter() - started) * 1000, len(items))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        풀 상태 조회
+
+        Returns:
+            작업자 수, 현재/최대 대기 작업 수, 완료/거절 횟수, 평균 처리 시간(대기 포함, 밀리초)
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "use_processes": self.use_processes,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_ms": round(self.run_ms_sum / self.completed, 2) if self.completed else 0.0,
+            }
+
+
+def _pool_workers() -> int:
+    """설정된 작업 프로세스 수 (0이면 CPU 코어 수)"""
+    return settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+
+
+password_hash_pool = PasswordHashPool(
+    workers=_pool_workers(),
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING or _pool_workers() * 8,
+    use_processes=settings.PASSWORD_HASH_USE_PROCESSES,
+)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    비밀번호 검증 (비동기, 해싱 풀에서 실행)
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해시된 비밀번호
+
+    Returns:
+        검증 결과
+
+    Raises:
+        HTTPException: 해싱 풀이 가득 찬 경우 (503)
+    """
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def averify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 및 재해싱 (비동기, 해싱 풀에서 실행)
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해시된 비밀번호
+
+    Returns:
+        (검증 결과, 새 해시 또는 None)
+
+    Raises:
+        HTTPException: 해싱 풀이 가득 찬 경우 (503)
+    """
+    return await password_hash_pool.run(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
+async def ahash_password(password: str) -> str:
+    """
+    비밀번호 해싱 (비동기, 해싱 풀에서 실행)
+
+    Args:
+        password: 평문 비밀번호
+
+    Returns:
+        해시된 비밀번호
+
+    Raises:
+        HTTPException: 해싱 풀이 가득 찬 경우 (503)
+    """
+    return await password_hash_pool.run(get_password_hash, password)
+
+
+async def ahash_update_data(obj_in: Any) -> Dict[str, Any]:
+    """
+    업데이트 데이터의 새 비밀번호를 해싱 풀에서 해싱해 hashed_password로 교체 (비동기)
+
+    Args:
+        obj_in: 업데이트 스키마 또는 딕셔너리
+
+    Returns:
+        설정된 필드만 담은 업데이트 딕셔너리 (password 대신 hashed_password)
+
+    Raises:
+        HTTPException: 해싱 풀이 가득 찬 경우 (503)
+    """
+    update_data = dict(obj_in) if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+    if update_data.get("password"):
+        update_data["hashed_password"] = await ahash_password(update_data.pop("password"))
+    else:
+        update_data.pop("password", None)
+    return update_data
+
+
+def hash_passwords(passwords: Sequence[str]) -> List[str]:
+    """
+    여러 비밀번호를 해싱 풀의 작업 프로세스에 나눠 해싱 (동기, 대량 생성용)
+
+    Args:
+        passwords: 평문 비밀번호 목록
+
+    Returns:
+        해시된 비밀번호 목록 (입력 순서 유지)
+    """
+    return password_hash_pool.map(get_password_hash, passwords)
+
+
+def get_password_hash_pool_stats() -> Dict[str, Any]:
+    """
+    비밀번호 해싱 풀 상태 조회 (현재 워커 프로세스 기준)
+
+    Returns:
+        풀 통계
+    """
+    return password_hash_pool.stats()
@@ -0,0 +1,69 @@
+from typing import Any, Iterable, List, Optional, Sequence
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[List[str]]:
+    """
+    fields 쿼리 파라미터 파싱
+
+    쉼표로 구분된 필드 목록을 허용된 필드와 대조해 검증합니다.
+    id는 커서와 식별을 위해 항상 포함합니다.
+
+    Args:
+        fields: 쉼표로 구분된 필드 목록 (예: "id,username")
+        allowed: 요청할 수 있는 필드 이름 목록 (보통 응답 스키마의 필드)
+
+    Returns:
+        필드 이름 목록 또는 None (전체 필드 조회)
+
+    Raises:
+        ValueError: 허용되지 않은 필드가 포함된 경우
+    """
+    if not fields:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    if not names:
+        return None
+    allowed = set(allowed)
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValueError(f"조회할 수 없는 필드입니다: {', '.join(unknown)}")
+    return list(dict.fromkeys(["id", *names]))
+
+
+def project_columns(model: Any, fields: Sequence[str], *extra: str) -> List[Any]:
+    """
+    필드 이름 목록을 모델 컬럼 목록으로 변환
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+        fields: 조회할 필드 이름 목록
+        extra: 함께 조회해야 하는 필드 (예: 커서 생성을 위한 정렬 키)
+
+    Returns:
+        select에 전달할 컬럼 목록
+
+    Raises:
+        ValueError: 모델에 없는 필드가 포함된 경우
+    """
+    names = list(dict.fromkeys(["id", *fields, *extra]))
+    columns = model.__table__.columns
+    unknown = [name for name in names if name not in columns]
+    if unknown:
+        raise ValueError(f"조회할 수 없는 필드입니다: {', '.join(unknown)}")
+    return [getattr(model, name) for name in names]
+
+
+def postgrest_select(fields: Optional[Sequence[str]], *extra: str) -> str:
+    """
+    필드 이름 목록을 PostgREST select 문자열로 변환
+
+    Args:
+        fields: 조회할 필드 이름 목록 (None이면 전체)
+        extra: 함께 조회해야 하는 필드 (예: 커서 생성을 위한 정렬 키)
+
+    Returns:
+        select 문자열 (예: "id,username")
+    """
+    if not fields:
+        return "*"
+    return ",".join(dict.fromkeys(["id", *fields, *extra]))
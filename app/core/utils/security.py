@@ -1,49 +1,38 @@
-from jose import jwt, JWTError
+from jose import jwt
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
+from app.core.cache.principal import Principal, principal_cache
+from app.core.cache.revocation import token_revocations
 from app.core.config import settings
 from app.core.database.deps import get_db
-
-# 비밀번호 해싱 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.observability import timed
+from app.core.utils.common import generate_uuid
+from app.core.utils.tokens import get_token_claims, verify_token
+from app.core.utils.passwords import (  # noqa: F401 (기존 import 경로 유지)
+    pwd_context,
+    verify_password,
+    get_password_hash,
+    verify_and_update_password,
+    averify_password,
+    averify_and_update_password,
+    ahash_password,
+    ahash_update_data,
+    hash_passwords,
+)
 
 # OAuth2 비밀번호 베어러 설정
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """
-    비밀번호 검증
-    
-    Args:
-        plain_password: 평문 비밀번호
-        hashed_password: 해시된 비밀번호
-        
-    Returns:
-        검증 결과
-    """
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    """
-    비밀번호 해싱
-    
-    Args:
-        password: 평문 비밀번호
-        
-    Returns:
-        해시된 비밀번호
-    """
-    return pwd_context.hash(password)
-
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     액세스 토큰 생성
     
+    로그아웃/비활성화 시 폐기할 수 있도록 토큰 ID(jti)와 발급 시각(iat)을 포함합니다.
+    
     Args:
         data: 토큰에 포함할 데이터
         expires_delta: 만료 시간
@@ -52,11 +41,12 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
         JWT 토큰
     """
     to_encode = data.copy()
+    now = datetime.utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+        expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode.update({"exp": expire, "iat": now, "jti": generate_uuid()})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -64,79 +54,132 @@ def decode_token(token: str) -> Dict[str, Any]:
     """
     토큰 디코딩
     
+    같은 토큰을 다시 디코딩하면 검증한 클레임 LRU에서 반환합니다.
+    
     Args:
         token: JWT 토큰
         
     Returns:
         디코딩된 데이터
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 토큰입니다",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    return dict(verify_token(token))
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    token: str = Depends(oauth2_scheme)
-) -> Any:
+def get_token_subject(token: str, request: Optional[Request] = None) -> str:
     """
-    현재 사용자 조회
+    토큰을 검증하고 사용자 ID(sub) 반환
+    
+    요청을 전달하면 같은 요청에서 이미 검증한 클레임(인증 미들웨어 등)을 재사용합니다.
     
     Args:
-        db: 데이터베이스 세션
         token: JWT 토큰
+        request: 현재 요청
         
     Returns:
-        사용자 객체
+        사용자 ID
     """
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="유효하지 않은 인증 정보입니다",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    except JWTError:
+        claims = get_token_claims(token, request.scope if request is not None else None)
+    except HTTPException:
+        claims = {}
+    user_id = claims.get("sub")
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 인증 정보입니다",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return user_id
+
+def revoke_access_token(token: str, request: Optional[Request] = None) -> None:
+    """
+    액세스 토큰 폐기 (로그아웃)
     
-    from app.users.services import user_service
+    모든 워커에서 토큰 만료 시각까지 거부됩니다. jti가 없는 이전 형식의 토큰은 만료될 때까지 유효합니다.
+    
+    Args:
+        token: JWT 토큰
+        request: 현재 요청
+    """
+    claims = get_token_claims(token, request.scope if request is not None else None)
+    jti = claims.get("jti")
+    if jti is not None and claims.get("exp") is not None:
+        token_revocations.revoke_token(jti, claims["exp"])
+
+async def _load_user(request: Request, db: Session, user_id: str) -> Any:
+    """요청 범위 조회기로 사용자를 조회하고 인증 주체 캐시에 저장"""
+    from app.core.repositories.loader import get_loader
+    from app.users.repositories import user_repository
     
-    user = user_service.get(db, id=int(user_id))
+    user = await get_loader(request, user_repository, db).load(int(user_id))
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="사용자를 찾을 수 없습니다",
         )
+    principal_cache.set(Principal.from_user(user))
     return user
 
-def get_current_active_user(
-    current_user = Depends(get_current_user),
+async def get_current_user(
+    request: Request,
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme)
 ) -> Any:
     """
-    현재 활성 사용자 조회
+    현재 사용자 조회
+    
+    요청 범위 조회기를 사용하므로 같은 요청에서 핸들러가 같은 사용자를
+    다시 조회해도 쿼리가 실행되지 않습니다. 사용자 행 전체가 필요하지 않으면
+    get_current_principal을 사용하세요.
+    
+    Args:
+        request: 현재 요청
+        db: 데이터베이스 세션
+        token: JWT 토큰
+        
+    Returns:
+        사용자 객체
+    """
+    with timed("auth"):
+        return await _load_user(request, db, get_token_subject(token, request))
+
+async def get_current_principal(
+    request: Request,
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme)
+) -> Principal:
+    """
+    현재 사용자의 권한 확인용 요약 정보 조회
+    
+    인증 주체 캐시에 있으면 데이터베이스를 조회하지 않고, 없으면 사용자를 조회해 캐시합니다.
     
     Args:
-        current_user: 현재 사용자
+        request: 현재 요청
+        db: 데이터베이스 세션
+        token: JWT 토큰
         
     Returns:
-        활성 사용자 객체
+        사용자 ID와 활성/관리자 여부
     """
-    from app.users.services import user_service
+    with timed("auth"):
+        user_id = get_token_subject(token, request)
+        principal = principal_cache.get(user_id)
+        if principal is None:
+            principal = Principal.from_user(await _load_user(request, db, user_id))
+    return principal
+
+def get_current_active_user(
+    current_user: Principal = Depends(get_current_principal),
+) -> Principal:
+    """
+    현재 활성 사용자 조회
     
-    if not user_service.is_active(current_user):
+    Args:
+        current_user: 현재 사용자 요약 정보
+        
+    Returns:
+        활성 사용자 요약 정보 (사용자 행이 필요하면 current_user.id로 조회)
+    """
+    if not current_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="비활성화된 사용자입니다",
@@ -144,22 +187,20 @@ def get_current_active_user(
     return current_user
 
 def get_current_active_superuser(
-    current_user = Depends(get_current_user),
-) -> Any:
+    current_user: Principal = Depends(get_current_principal),
+) -> Principal:
     """
     현재 활성 관리자 조회
     
     Args:
-        current_user: 현재 사용자
+        current_user: 현재 사용자 요약 정보
         
     Returns:
-        활성 관리자 객체
+        활성 관리자 요약 정보
     """
-    from app.users.services import user_service
-    
-    if not user_service.is_superuser(current_user):
+    if not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="권한이 없습니다",
         )
-    return current_user 
\ No newline at end of file
+    return current_user
\ No newline at end of file
@@ -0,0 +1,178 @@
+import hashlib
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, MutableMapping, Optional
+
+from fastapi import HTTPException, status
+from jose import JWTError, jwt
+
+from app.core.cache.backends import MISSING, LocalTTLCache
+from app.core.cache.revocation import token_revocations
+from app.core.config import settings
+
+# 액세스 토큰 검증
+#
+# 한 요청에서 인증 미들웨어와 인증 의존성이 같은 토큰을 여러 번 검증하지 않도록
+# 검증한 클레임을 ASGI scope에 저장해 재사용하고, 같은 토큰이 다시 오면(대부분의 요청)
+# HMAC 서명 검증과 JSON 파싱 없이 프로세스 내 LRU에서 클레임을 꺼냅니다.
+# LRU 키는 토큰 원문 대신 SHA-256 다이제스트이며, 항목은 토큰의 exp가 지나면
+# (늦어도 TOKEN_CACHE_MAX_TTL_SECONDS 뒤에) 만료됩니다.
+# 폐기 여부(로그아웃/비활성화)는 LRU 적중 여부와 관계없이 매번 프로세스 내 폐기 목록으로 확인합니다.
+
+# 검증한 (토큰, 클레임)을 저장하는 ASGI scope 키
+SCOPE_KEY = "app.token_claims"
+
+
+class TokenClaimsCache:
+    """
+    검증을 통과한 토큰의 클레임 LRU
+
+    클레임은 여러 요청이 공유하므로 읽기 전용 매핑으로 저장합니다.
+    """
+    def __init__(self, *, maxsize: int, max_ttl: float):
+        """
+        캐시 초기화
+
+        Args:
+            maxsize: 최대 토큰 수 (0이면 캐시하지 않음)
+            max_ttl: 항목 최대 유효 시간 (초, exp가 더 이르면 exp까지)
+        """
+        self.max_ttl = max_ttl
+        self.local = (
+            LocalTTLCache(maxsize=maxsize, ttl=max_ttl) if maxsize > 0 and max_ttl > 0 else None
+        )
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, token: str) -> Optional[Mapping[str, Any]]:
+        """
+        캐시된 클레임 조회
+
+        Args:
+            token: JWT 토큰
+
+        Returns:
+            클레임 또는 None (캐시 미스)
+        """
+        if self.local is None:
+            return None
+        claims = self.local.get(self._key(token))
+        if claims is MISSING:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return claims
+
+    def set(self, token: str, claims: Mapping[str, Any]) -> None:
+        """
+        검증한 클레임 저장 (exp가 있으면 exp까지만 유효)
+
+        Args:
+            token: JWT 토큰
+            claims: 검증한 클레임
+        """
+        if self.local is None:
+            return
+        ttl = self.max_ttl
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            ttl = min(ttl, exp - time.time())
+        if ttl > 0:
+            self.local.set(self._key(token), claims, ttl=ttl)
+
+    def clear(self) -> None:
+        """모든 항목 삭제 (SECRET_KEY 교체 등)"""
+        if self.local is not None:
+            self.local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중 통계 조회
+
+        Returns:
+            적중/미스 수와 적중률
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "local_size": len(self.local) if self.local is not None else 0,
+        }
+
+
+token_claims_cache = TokenClaimsCache(
+    maxsize=settings.TOKEN_CACHE_MAXSIZE, max_ttl=settings.TOKEN_CACHE_MAX_TTL_SECONDS
+)
+
+
+def verify_token(token: str) -> Mapping[str, Any]:
+    """
+    토큰 서명/만료/폐기 여부 검증 후 클레임 반환 (LRU에 있으면 서명 검증 생략)
+
+    Args:
+        token: JWT 토큰
+
+    Returns:
+        읽기 전용 클레임
+
+    Raises:
+        HTTPException: 유효하지 않거나 폐기된 토큰인 경우 (401)
+    """
+    claims = token_claims_cache.get(token)
+    if claims is None:
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except JWTError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="유효하지 않은 토큰입니다",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        claims = MappingProxyType(payload)
+        token_claims_cache.set(token, claims)
+    if token_revocations.is_revoked(claims):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="폐기된 토큰입니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return claims
+
+
+def get_token_claims(
+    token: str, scope: Optional[MutableMapping[str, Any]] = None
+) -> Mapping[str, Any]:
+    """
+    요청 안에서 한 번만 검증된 토큰 클레임 조회
+
+    같은 요청에서 이미 같은 토큰을 검증했다면 ASGI scope에 저장된 클레임을 반환합니다.
+
+    Args:
+        token: JWT 토큰
+        scope: 현재 요청의 ASGI scope (request.scope)
+
+    Returns:
+        읽기 전용 클레임
+
+    Raises:
+        HTTPException: 유효하지 않거나 폐기된 토큰인 경우 (401)
+    """
+    if scope is not None:
+        cached = scope.get(SCOPE_KEY)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+    claims = verify_token(token)
+    if scope is not None:
+        scope[SCOPE_KEY] = (token, claims)
+    return claims
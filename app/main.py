@@ -1,6 +1,8 @@
 import logging
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
@@ -8,6 +10,8 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.api.v1 import api_router
 from app.core.config import settings
 from app.core.middlewares.logging_middleware import LoggingMiddleware
+from app.core.middlewares.metrics_middleware import MetricsMiddleware
+from app.core.middlewares.replica_middleware import ReadYourWritesMiddleware
 from app.core.exception_handlers import (
     http_exception_handler,
     validation_exception_handler,
@@ -19,13 +23,22 @@ from app.core.exception_handlers import (
     internal_server_error_exception_handler,
 )
 from app.core.exceptions import BaseAPIException
-from app.core.database.session import Base, engine
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO if not settings.DEBUG else logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+from app.core.database.pool import warm_up_pool
+from app.core.database.session import Base, REPLICA_URLS, engine
+from app.core.cache import token_revocations
+from app.core.observability import (
+    METRICS_CONTENT_TYPE,
+    TimedJSONResponse,
+    metrics_exporter,
+    metrics_access_allowed,
+    render_metrics,
+    setup_logging,
+    shutdown_logging,
 )
+from app.core.utils.passwords import password_hash_pool
+
+# 로깅 설정 (기록은 큐를 거쳐 백그라운드 스레드에서 출력)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +50,8 @@ def create_app() -> FastAPI:
         title=settings.PROJECT_NAME,
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         debug=settings.DEBUG,
+        # 응답 직렬화 시간을 Server-Timing의 render 구간으로 기록
+        default_response_class=TimedJSONResponse,
     )
     
     # CORS 미들웨어 설정
@@ -51,6 +66,13 @@ def create_app() -> FastAPI:
     # 로깅 미들웨어 추가
     app.add_middleware(LoggingMiddleware)
     
+    # 요청 메트릭 미들웨어 추가 (라우트별 요청 수/처리 시간, 처리 중인 요청 수)
+    app.add_middleware(MetricsMiddleware)
+    
+    # 읽기 복제본 사용 시 쓰기 이후 조회를 주 데이터베이스로 고정
+    if REPLICA_URLS:
+        app.add_middleware(ReadYourWritesMiddleware)
+    
     # 예외 핸들러 등록
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
@@ -62,19 +84,52 @@ def create_app() -> FastAPI:
     # 시작 및 종료 이벤트 등록
     @app.on_event("startup")
     async def startup_event():
+        # 이전 수명 주기의 종료 이벤트에서 멈춘 로그 출력 스레드 다시 시작
+        setup_logging()
         logger.info("애플리케이션 시작")
         # 데이터베이스 테이블 생성
         Base.metadata.create_all(bind=engine)
+        # 첫 요청들이 연결 수립 비용을 치르지 않도록 커넥션 풀 미리 채우기
+        if settings.DB_POOL_WARMUP:
+            try:
+                opened = await run_in_threadpool(warm_up_pool, engine)
+                logger.info(f"커넥션 풀 준비 완료: {opened}개")
+            except Exception as e:
+                logger.warning(f"커넥션 풀 준비 실패: {e}")
+        # 비밀번호 해싱 프로세스 풀 미리 시작
+        password_hash_pool.start()
+        # 다른 워커의 토큰 폐기(로그아웃/비활성화) 알림 구독
+        token_revocations.start()
+        # 멀티프로세스 모드면 워커별 메트릭 스냅샷 저장 시작
+        metrics_exporter.start()
     
     @app.on_event("shutdown")
     async def shutdown_event():
         logger.info("애플리케이션 종료")
+        password_hash_pool.shutdown()
+        token_revocations.stop()
+        metrics_exporter.stop()
+        shutdown_logging()
     
     # 루트 엔드포인트
     @app.get("/")
     async def root():
         return {"message": f"Welcome to {settings.PROJECT_NAME}"}
     
+    # Prometheus 메트릭 엔드포인트 (멀티프로세스 모드면 파일을 읽으므로 스레드풀에서 실행)
+    # 사용자 인증 대신 METRICS_TOKEN 또는 METRICS_ALLOWED_IPS로 접근을 제한
+    @app.get("/metrics", include_in_schema=False)
+    def metrics(request: Request):
+        if not settings.METRICS_ENABLED:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+        client_host = request.client.host if request.client else None
+        if not metrics_access_allowed(request.headers.get("authorization"), client_host):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="메트릭 접근 권한이 없습니다",
+            )
+        return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+    
     return app
 
 
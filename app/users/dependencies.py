@@ -1,19 +1,21 @@
-from typing import Generator, Optional
-
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt
-from pydantic import ValidationError
-from sqlalchemy.orm import Session
 
+from app.core.cache import Principal, supabase_principal_cache
 from app.core.config import settings
-from app.core.database.session import SessionLocal
+from app.core.database.session import get_db
 from app.core.database.supabase import get_supabase
-from app.core.utils.security import ALGORITHM
-from app.users.models.user import User
+from app.core.observability import timed
+from app.core.utils.security import (  # noqa: F401 (SQLAlchemy 사용자 인증 의존성은 security 모듈과 공유)
+    get_current_active_superuser,
+    get_current_active_user,
+    get_current_principal,
+    get_current_user,
+    get_token_subject,
+)
+from app.users.repositories import user_repository
 from app.users.repositories.user_repository import UserRepository
 from app.users.repositories.supabase_user_repository import SupabaseUserRepository
-from app.users.schemas.token import TokenPayload
 from app.users.services.user_service import UserService
 from app.users.services.supabase_user_service import SupabaseUserService
 
@@ -22,16 +24,8 @@ reusable_oauth2 = OAuth2PasswordBearer(
 )
 
 
-def get_db() -> Generator:
-    try:
-        db = SessionLocal()
-        yield db
-    finally:
-        db.close()
-
-
-def get_user_repository(db: Session = Depends(get_db)) -> UserRepository:
-    return UserRepository(db=db, model=User)
+def get_user_repository() -> UserRepository:
+    return user_repository
 
 
 def get_user_service(
@@ -40,50 +34,6 @@ def get_user_service(
     return UserService(repository=repository)
 
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> User:
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
-    except (jwt.JWTError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-        )
-    user_service = get_user_service(repository=get_user_repository(db))
-    user = user_service.get(id=token_data.sub)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    return user
-
-
-def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
-    user_service = get_user_service(
-        repository=get_user_repository(SessionLocal())
-    )
-    if not user_service.is_active(current_user):
-        raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
-
-
-def get_current_active_superuser(
-    current_user: User = Depends(get_current_user),
-) -> User:
-    user_service = get_user_service(
-        repository=get_user_repository(SessionLocal())
-    )
-    if not user_service.is_superuser(current_user):
-        raise HTTPException(
-            status_code=400, detail="The user doesn't have enough privileges"
-        )
-    return current_user
-
-
 # Supabase 의존성 주입 함수
 def get_supabase_user_repository() -> SupabaseUserRepository:
     """
@@ -110,48 +60,70 @@ def get_supabase_user_service(
     return SupabaseUserService(repository=repository)
 
 
+def _load_supabase_user(user_id: str) -> dict:
+    """Supabase에서 사용자를 조회하고 인증 주체 캐시에 저장"""
+    supabase = get_supabase()
+    if not supabase:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Supabase client not initialized",
+        )
+    
+    user_service = get_supabase_user_service()
+    user = user_service.get(supabase, id=int(user_id))
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    supabase_principal_cache.set(Principal.from_user(user))
+    return user
+
+
 def get_current_supabase_user(
+    request: Request,
     token: str = Depends(reusable_oauth2)
 ) -> dict:
     """
     현재 Supabase 사용자 조회
     
     Args:
+        request: 현재 요청 (같은 요청에서 검증한 토큰 클레임 재사용)
         token: 액세스 토큰
         
     Returns:
         dict: 사용자 정보
     """
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
-    except (jwt.JWTError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-        )
+    with timed("auth"):
+        return _load_supabase_user(get_token_subject(token, request))
+
+
+def get_current_supabase_principal(
+    request: Request,
+    token: str = Depends(reusable_oauth2)
+) -> Principal:
+    """
+    현재 Supabase 사용자의 권한 확인용 요약 정보 조회
     
-    supabase = get_supabase()
-    if not supabase:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Supabase client not initialized",
-        )
+    인증 주체 캐시에 있으면 PostgREST를 호출하지 않습니다.
     
-    user_service = get_supabase_user_service()
-    user = user_service.get(supabase, id=token_data.sub)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    return user
+    Args:
+        request: 현재 요청
+        token: 액세스 토큰
+        
+    Returns:
+        Principal: 사용자 ID와 활성/관리자 여부
+    """
+    with timed("auth"):
+        user_id = get_token_subject(token, request)
+        principal = supabase_principal_cache.get(user_id)
+        if principal is None:
+            principal = Principal.from_user(_load_supabase_user(user_id))
+    return principal
 
 
 def get_current_active_supabase_user(
     current_user: dict = Depends(get_current_supabase_user),
 ) -> dict:
     """
-    현재 활성화된 Supabase 사용자 조회
+    현재 활성화된 Supabase 사용자 조회 (사용자 정보 전체가 필요한 경우)
     
     Args:
         current_user: 현재 사용자 정보
@@ -165,21 +137,37 @@ def get_current_active_supabase_user(
     return current_user
 
 
+def get_current_active_supabase_principal(
+    current_user: Principal = Depends(get_current_supabase_principal),
+) -> Principal:
+    """
+    현재 활성화된 Supabase 사용자 요약 정보 조회
+    
+    Args:
+        current_user: 현재 사용자 요약 정보
+        
+    Returns:
+        Principal: 활성화된 사용자 요약 정보
+    """
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+
 def get_current_active_supabase_superuser(
-    current_user: dict = Depends(get_current_supabase_user),
-) -> dict:
+    current_user: Principal = Depends(get_current_supabase_principal),
+) -> Principal:
     """
     현재 활성화된 Supabase 관리자 조회
     
     Args:
-        current_user: 현재 사용자 정보
+        current_user: 현재 사용자 요약 정보
         
     Returns:
-        dict: 활성화된 관리자 정보
+        Principal: 활성화된 관리자 요약 정보
     """
-    user_service = get_supabase_user_service()
-    if not user_service.is_superuser(current_user):
+    if not current_user.is_superuser:
         raise HTTPException(
             status_code=400, detail="The user doesn't have enough privileges"
         )
-    return current_user 
\ No newline at end of file
+    return current_user
\ No newline at end of file
@@ -1,11 +1,14 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime
 from sqlalchemy.sql import func
 
+from app.core.database.search import register_search_index
 from app.core.database.session import Base
 
 class User(Base):
     """사용자 모델"""
     __tablename__ = "users"
+    # flush 시 서버 기본값(created_at, updated_at)을 RETURNING으로 함께 받아 추가 조회를 피함
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -15,4 +18,11 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()) 
+
+
+# 검색 대상 컬럼 (마이그레이션의 PostgreSQL 검색 문서 인덱스 식과 같은 순서)
+USER_SEARCH_FIELDS = ("username", "full_name", "email")
+
+# 개발/테스트용 SQLite에서는 create_all 시 FTS5 검색 테이블도 함께 생성
+register_search_index(User.__table__, USER_SEARCH_FIELDS)
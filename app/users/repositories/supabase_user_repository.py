@@ -1,8 +1,17 @@
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Sequence, Union
 import logging
+from fastapi.concurrency import run_in_threadpool
 from supabase import Client
 
-from app.core.utils.security import get_password_hash, verify_password
+from app.core.cache import build_entity_cache, supabase_principal_cache, token_revocations
+from app.core.utils.security import (
+    ahash_password,
+    ahash_update_data,
+    averify_and_update_password,
+    get_password_hash,
+    hash_passwords,
+    verify_and_update_password,
+)
 from app.users.schemas.user import UserCreate, UserUpdate
 from app.core.repositories.supabase_base import SupabaseBaseRepository
 
@@ -14,9 +23,20 @@ class SupabaseUserRepository(SupabaseBaseRepository[Dict[str, Any], UserCreate,
     
     사용자 관련 CRUD 작업을 Supabase를 통해 처리합니다.
     """
+    # 대량 가져오기 시 이메일 기준으로 upsert (기존 계정의 비밀번호/활성/관리자 여부는 덮어쓰지 않음)
+    upsert_conflict_fields = ("email",)
+    upsert_update_fields = ("username", "full_name")
+    # 로그인/중복 확인에 쓰이는 고유 필드는 캐시에서 바로 조회
+    cache_fields = ("email", "username")
+    # 비밀번호 해시는 캐시(Redis 포함)에 저장하지 않음 (인증 시에는 항상 Supabase에서 조회)
+    cache_exclude_fields = ("hashed_password",)
+    # 목록 조회에서 필터/정렬할 수 있는 필드 (인덱스가 있는 고유 컬럼)
+    filter_fields = ("email", "username")
+    sort_fields = ("email", "username")
+    
     def __init__(self):
         """저장소 초기화"""
-        super().__init__("users")
+        super().__init__("users", cache=build_entity_cache("supabase_users"))
     
     def get_by_email(self, supabase: Client, email: str) -> Optional[Dict[str, Any]]:
         """
@@ -44,69 +64,230 @@ class SupabaseUserRepository(SupabaseBaseRepository[Dict[str, Any], UserCreate,
         """
         return self.get_by_field(supabase, "username", username)
     
-    def create(self, supabase: Client, *, obj_in: UserCreate) -> Dict[str, Any]:
+    def _prepare_create_data(self, obj_in: Union[UserCreate, Dict[str, Any]]) -> Dict[str, Any]:
         """
-        사용자 생성
+        생성 스키마를 비밀번호가 해싱된 딕셔너리로 변환
         
         Args:
-            supabase: Supabase 클라이언트
             obj_in: 생성할 사용자 데이터
             
         Returns:
-            생성된 사용자 정보
+            저장할 사용자 정보
+        """
+        if isinstance(obj_in, dict):
+            obj_in = UserCreate(**obj_in)
+        return self._user_row(obj_in, get_password_hash(obj_in.password))
+    
+    def _prepare_create_rows(
+        self, objs_in: Sequence[Union[UserCreate, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
         """
-        db_obj = {
+        생성 스키마 목록을 저장할 딕셔너리 목록으로 변환
+        
+        비밀번호는 해싱 풀의 모든 작업 프로세스에 나눠 해싱합니다.
+        
+        Args:
+            objs_in: 생성할 사용자 데이터 목록
+            
+        Returns:
+            저장할 사용자 정보 목록 (입력 순서 유지)
+        """
+        users = [UserCreate(**obj_in) if isinstance(obj_in, dict) else obj_in for obj_in in objs_in]
+        hashed_passwords = hash_passwords([user.password for user in users])
+        return [self._user_row(user, hashed) for user, hashed in zip(users, hashed_passwords)]
+    
+    @staticmethod
+    def _user_row(obj_in: UserCreate, hashed_password: str) -> Dict[str, Any]:
+        """생성 스키마와 해시된 비밀번호로 저장할 딕셔너리 생성"""
+        return {
             "email": obj_in.email,
             "username": obj_in.username,
-            "hashed_password": get_password_hash(obj_in.password),
+            "hashed_password": hashed_password,
             "full_name": obj_in.full_name,
             "is_active": obj_in.is_active,
             "is_superuser": obj_in.is_superuser,
         }
+    
+    def create(self, supabase: Client, *, obj_in: UserCreate) -> Dict[str, Any]:
+        """
+        사용자 생성
         
+        Args:
+            supabase: Supabase 클라이언트
+            obj_in: 생성할 사용자 데이터
+            
+        Returns:
+            생성된 사용자 정보
+        """
+        return self._create_row(supabase, self._prepare_create_data(obj_in))
+    
+    def _create_row(self, supabase: Client, row: Dict[str, Any]) -> Dict[str, Any]:
+        """_prepare_create_data로 변환을 마친 딕셔너리로 사용자 생성"""
         try:
-            response = supabase.table(self.table_name).insert(db_obj).execute()
+            response = self._execute(supabase.table(self.table_name).insert(row))
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error(f"사용자 생성 중 오류 발생: {e}")
             raise
     
-    def update(
-        self, supabase: Client, *, id: Any, obj_in: Union[UserUpdate, Dict[str, Any]]
-    ) -> Dict[str, Any]:
+    async def acreate(self, supabase: Client, *, obj_in: UserCreate) -> Dict[str, Any]:
         """
-        사용자 업데이트
-        
+        사용자 생성 (비동기)
+                
+        비밀번호는 비밀번호 해싱 풀에서 해싱하고 저장은 스레드풀에서 실행합니다.
+                
         Args:
             supabase: Supabase 클라이언트
-            id: 업데이트할 사용자 ID
+            obj_in: 생성할 사용자 데이터
+                        
+        Returns:
+            생성된 사용자 정보
+        """
+        if isinstance(obj_in, dict):
+            obj_in = UserCreate(**obj_in)
+        row = self._user_row(obj_in, await ahash_password(obj_in.password))
+        return await run_in_threadpool(self._create_row, supabase, row)
+    
+    def _prepare_update_data(self, obj_in: Union[UserUpdate, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        업데이트 스키마를 비밀번호가 해싱된 딕셔너리로 변환
+        
+        Args:
             obj_in: 업데이트 데이터
             
         Returns:
-            업데이트된 사용자 정보
+            변경할 사용자 정보
         """
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = dict(super()._prepare_update_data(obj_in))
         
         # 비밀번호가 있으면 해시 처리
         if "password" in update_data:
             hashed_password = get_password_hash(update_data["password"])
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
+        return update_data
+    
+    def update(
+        self,
+        supabase: Client,
+        *,
+        id: Any,
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        where: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        사용자 업데이트 (비활성화하면 발급된 토큰 폐기)
         
+        Args:
+            supabase: Supabase 클라이언트
+            id: 업데이트할 사용자 ID
+            obj_in: 업데이트 데이터
+            where: 추가 조건 (일치하는 사용자만 갱신)
+            
+        Returns:
+            업데이트된 사용자 정보 또는 None
+        """
         try:
-            response = supabase.table(self.table_name).update(update_data).eq("id", id).execute()
-            return response.data[0] if response.data else None
+            user = super().update(supabase, id=id, obj_in=obj_in, where=where)
         except Exception as e:
             logger.error(f"사용자 업데이트 중 오류 발생: {e}")
             raise
+        is_active = obj_in.get("is_active") if isinstance(obj_in, dict) else obj_in.is_active
+        if user is not None and is_active is False:
+            token_revocations.revoke_user(id)
+        return user
+    
+    async def aupdate(
+        self,
+        supabase: Client,
+        *,
+        id: Any,
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        where: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        사용자 업데이트 (비동기)
+                
+        새 비밀번호는 비밀번호 해싱 풀에서 해싱하고 갱신은 스레드풀에서 실행합니다.
+                
+        Args:
+            supabase: Supabase 클라이언트
+            id: 업데이트할 사용자 ID
+            obj_in: 업데이트 데이터
+            where: 추가 조건 (일치하는 사용자만 갱신)
+                        
+        Returns:
+            업데이트된 사용자 정보 또는 None
+        """
+        update_data = await ahash_update_data(obj_in)
+        return await run_in_threadpool(self.update, supabase, id=id, obj_in=update_data, where=where)
+    
+    def remove(self, supabase: Client, *, id: Any) -> Optional[Dict[str, Any]]:
+        """
+        사용자 삭제 (발급된 토큰 폐기)
+        
+        Args:
+            supabase: Supabase 클라이언트
+            id: 삭제할 사용자 ID
+            
+        Returns:
+            삭제된 사용자 정보 또는 None
+        """
+        user = super().remove(supabase, id=id)
+        if user is not None:
+            token_revocations.revoke_user(id)
+        return user
+    
+    def remove_many(
+        self, supabase: Client, *, ids: Sequence[Any], batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 사용자 일괄 삭제 (발급된 토큰 폐기)
+        
+        Args:
+            supabase: Supabase 클라이언트
+            ids: 삭제할 사용자 ID 목록
+            batch_size: 한 번에 삭제할 최대 행 수
+            
+        Returns:
+            삭제된 사용자 목록
+        """
+        removed = super().remove_many(supabase, ids=ids, batch_size=batch_size)
+        for user in removed:
+            token_revocations.revoke_user(user["id"])
+        return removed
     
     def authenticate(self, supabase: Client, *, email: str, password: str) -> Optional[Dict[str, Any]]:
         """
         사용자 인증
         
+        비밀번호 해시는 캐시를 거치지 않고 Supabase에서 읽으며,
+        저장된 해시의 알고리즘/비용이 현재 설정과 다르면 새 설정으로 다시 해싱해 저장합니다.
+        
+        Args:
+            supabase: Supabase 클라이언트
+            email: 사용자 이메일
+            password: 비밀번호
+            
+        Returns:
+            인증된 사용자 정보 또는 None
+        """
+        user = self.get_by_field(supabase, "email", email, use_cache=False)
+        if not user:
+            return None
+        verified, new_hash = verify_and_update_password(password, user["hashed_password"])
+        if not verified:
+            return None
+        if new_hash:
+            user = self._store_rehashed_password(supabase, user, new_hash)
+        return user
+    
+    async def aauthenticate(self, supabase: Client, *, email: str, password: str) -> Optional[Dict[str, Any]]:
+        """
+        사용자 인증 (비동기)
+        
+        사용자 조회는 스레드풀에서, 비밀번호 검증은 비밀번호 해싱 풀에서 실행합니다.
+        
         Args:
             supabase: Supabase 클라이언트
             email: 사용자 이메일
@@ -115,13 +296,50 @@ class SupabaseUserRepository(SupabaseBaseRepository[Dict[str, Any], UserCreate,
         Returns:
             인증된 사용자 정보 또는 None
         """
-        user = self.get_by_email(supabase, email)
+        user = await run_in_threadpool(self.get_by_field, supabase, "email", email, use_cache=False)
         if not user:
             return None
-        if not verify_password(password, user["hashed_password"]):
+        verified, new_hash = await averify_and_update_password(password, user["hashed_password"])
+        if not verified:
             return None
+        if new_hash:
+            user = await run_in_threadpool(self._store_rehashed_password, supabase, user, new_hash)
         return user
     
+    def _store_rehashed_password(
+        self, supabase: Client, user: Dict[str, Any], hashed_password: str
+    ) -> Dict[str, Any]:
+        """
+        로그인 시 새 해싱 설정으로 만든 해시 저장
+        
+        저장에 실패해도 로그인은 진행하고 다음 로그인에서 다시 시도합니다.
+        
+        Args:
+            supabase: Supabase 클라이언트
+            user: 사용자 정보
+            hashed_password: 새 해시
+            
+        Returns:
+            사용자 정보
+        """
+        try:
+            updated = self.update(supabase, id=user["id"], obj_in={"hashed_password": hashed_password})
+        except Exception as e:
+            logger.warning(f"비밀번호 재해싱 저장 실패: {e}")
+            return user
+        return updated or user
+    
+    def _invalidate(self, *ids: Any) -> None:
+        """
+        변경된 사용자를 엔티티 캐시와 인증 주체 캐시에서 제거
+        
+        Args:
+            ids: 변경된 사용자 ID 목록
+        """
+        super()._invalidate(*ids)
+        if ids:
+            supabase_principal_cache.invalidate(*ids)
+    
     def is_active(self, user: Dict[str, Any]) -> bool:
         """
         사용자 활성화 여부 확인
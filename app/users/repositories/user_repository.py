@@ -1,46 +1,78 @@
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Sequence, Union
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.core.utils.security import get_password_hash, verify_password
-from app.users.models.user import User
+from app.core.cache import build_entity_cache, principal_cache, token_revocations
+from app.core.database.transaction import has_uncommitted_writes, run_after_commit
+from app.core.utils.security import (
+    ahash_password,
+    ahash_update_data,
+    averify_and_update_password,
+    get_password_hash,
+    hash_passwords,
+    verify_and_update_password,
+)
+from app.users.models.user import USER_SEARCH_FIELDS, User
 from app.users.schemas.user import UserCreate, UserUpdate
 from app.core.repositories.base import BaseRepository
 
 
 class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
+    # 대량 가져오기 시 이메일 기준으로 upsert (기존 계정의 비밀번호/활성/관리자 여부는 덮어쓰지 않음)
+    upsert_conflict_fields = ("email",)
+    upsert_update_fields = ("username", "full_name")
+    # 로그인/중복 확인에 쓰이는 고유 필드는 캐시에서 바로 조회
+    cache_fields = ("email", "username")
+    # 비밀번호 해시는 캐시(Redis 포함)에 저장하지 않음 (인증 시에는 항상 데이터베이스에서 조회)
+    cache_exclude_fields = ("hashed_password",)
+    # 목록 조회에서 필터/정렬할 수 있는 필드 (인덱스가 있는 고유 컬럼)
+    filter_fields = ("email", "username")
+    sort_fields = ("email", "username")
+    # 이메일/사용자명/이름 검색 (tsvector + pg_trgm 인덱스, SQLite는 FTS5)
+    search_fields = USER_SEARCH_FIELDS
+
     def __init__(self):
-        super().__init__(User)
+        super().__init__(User, cache=build_entity_cache("users"))
 
     def get_by_email(self, db: Session, email: str) -> Optional[User]:
         """이메일로 사용자 조회"""
-        return db.query(User).filter(User.email == email).first()
+        return self.get_by_field(db, "email", email)
     
     def get_by_username(self, db: Session, username: str) -> Optional[User]:
         """사용자명으로 사용자 조회"""
-        return db.query(User).filter(User.username == username).first()
+        return self.get_by_field(db, "username", username)
 
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
-        """사용자 생성"""
-        db_obj = User(
-            email=obj_in.email,
-            username=obj_in.username,
-            hashed_password=get_password_hash(obj_in.password),
-            full_name=obj_in.full_name,
-            is_superuser=obj_in.is_superuser,
-            is_active=obj_in.is_active,
-        )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+    def _prepare_create_data(self, obj_in: Union[UserCreate, Dict[str, Any]]) -> Dict[str, Any]:
+        """생성 스키마를 비밀번호가 해싱된 컬럼 딕셔너리로 변환"""
+        if isinstance(obj_in, dict):
+            obj_in = UserCreate(**obj_in)
+        return self._user_row(obj_in, get_password_hash(obj_in.password))
+    
+    def _prepare_create_rows(
+        self, objs_in: Sequence[Union[UserCreate, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """생성 스키마 목록을 컬럼 딕셔너리 목록으로 변환 (비밀번호는 해싱 풀의 모든 작업 프로세스에서 나눠 해싱)"""
+        users = [UserCreate(**obj_in) if isinstance(obj_in, dict) else obj_in for obj_in in objs_in]
+        hashed_passwords = hash_passwords([user.password for user in users])
+        return [self._user_row(user, hashed) for user, hashed in zip(users, hashed_passwords)]
+    
+    @staticmethod
+    def _user_row(obj_in: UserCreate, hashed_password: str) -> Dict[str, Any]:
+        """생성 스키마와 해시된 비밀번호로 INSERT할 컬럼 딕셔너리 생성"""
+        return {
+            "email": obj_in.email,
+            "username": obj_in.username,
+            "hashed_password": hashed_password,
+            "full_name": obj_in.full_name,
+            "is_superuser": obj_in.is_superuser,
+            "is_active": obj_in.is_active,
+        }
 
-    def update(
-        self, db: Session, *, db_obj: User, obj_in: Union[UserUpdate, Dict[str, Any]]
-    ) -> User:
-        """사용자 정보 업데이트"""
+    def _prepare_update_data(self, obj_in: Union[UserUpdate, Dict[str, Any]]) -> Dict[str, Any]:
+        """업데이트 스키마를 비밀번호가 해싱된 컬럼 딕셔너리로 변환"""
         if isinstance(obj_in, dict):
-            update_data = obj_in
+            update_data = dict(obj_in)
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
         
@@ -49,17 +81,180 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
         
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+        return super()._prepare_update_data(update_data)
+    
+    async def acreate(
+        self, db: Session, *, obj_in: Union[UserCreate, Dict[str, Any]], commit: bool = False
+    ) -> User:
+        """
+        사용자 생성 (비동기)
+                
+        비밀번호는 비밀번호 해싱 풀에서 해싱하고 저장은 스레드풀에서 실행해
+        요청 스레드나 이벤트 루프가 해싱으로 막히지 않도록 합니다.
+        """
+        if isinstance(obj_in, dict):
+            obj_in = UserCreate(**obj_in)
+        row = self._user_row(obj_in, await ahash_password(obj_in.password))
+        return await run_in_threadpool(self._create_row, db, row, commit)
+    
+    async def aupdate_by_id(
+        self,
+        db: Session,
+        *,
+        id: Any,
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        where: Optional[Dict[str, Any]] = None,
+        commit: bool = False,
+    ) -> Optional[User]:
+        """
+        ID로 사용자 업데이트 (비동기)
+                
+        새 비밀번호는 비밀번호 해싱 풀에서 해싱하고 갱신은 스레드풀에서 실행합니다.
+        """
+        update_data = await ahash_update_data(obj_in)
+        return await run_in_threadpool(
+            self.update_by_id, db, id=id, obj_in=update_data, where=where, commit=commit
+        )
 
     def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
-        """사용자 인증"""
-        user = self.get_by_email(db, email=email)
+        """
+        사용자 인증
+        
+        비밀번호 해시는 캐시를 거치지 않고 데이터베이스에서 읽으며,
+        저장된 해시의 알고리즘/비용이 현재 설정과 다르면 새 설정으로 다시 해싱해 저장합니다.
+        """
+        user = self.get_by_field(db, "email", email, use_cache=False)
+        if not user:
+            return None
+        verified, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not verified:
+            return None
+        if new_hash:
+            user = self._store_rehashed_password(db, user, new_hash)
+        return user
+    
+    async def aauthenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
+        """
+        사용자 인증 (비동기)
+        
+        사용자 조회는 스레드풀에서, 비밀번호 검증은 비밀번호 해싱 풀에서 실행해
+        이벤트 루프를 막지 않습니다.
+        """
+        user = await run_in_threadpool(self.get_by_field, db, "email", email, use_cache=False)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = await averify_and_update_password(password, user.hashed_password)
+        if not verified:
             return None
+        if new_hash:
+            user = await run_in_threadpool(self._store_rehashed_password, db, user, new_hash)
         return user
+    
+    def _store_rehashed_password(self, db: Session, user: User, hashed_password: str) -> User:
+        """로그인 시 새 설정으로 만든 해시 저장 (커밋은 요청 단위 작업에 맡김)"""
+        return self.update_by_id(db, id=user.id, obj_in={"hashed_password": hashed_password}) or user
 
+    def _invalidate(self, db: Session, *ids: Any) -> None:
+        """
+        변경된 사용자를 엔티티 캐시와 인증 주체 캐시에서 제거
+        
+        활성/관리자 여부가 바뀌거나 삭제된 사용자가 캐시된 권한으로 인증되지 않도록 합니다.
+        """
+        super()._invalidate(db, *ids)
+        if not ids:
+            return
+        principal_cache.invalidate(*ids)
+        if has_uncommitted_writes(db):
+            run_after_commit(db, lambda: principal_cache.invalidate(*ids))
+    
+    def invalidate_cached(self, *ids: Any) -> None:
+        """
+        저장소를 거치지 않고 변경된 사용자(어드민 폼 등)를 캐시에서 제거
+        
+        Args:
+            ids: 변경된 사용자 ID 목록
+        """
+        if self.cache is not None:
+            self.cache.invalidate(*ids)
+        principal_cache.invalidate(*ids)
+    
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: User,
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        commit: bool = False,
+    ) -> User:
+        """사용자 업데이트 (비활성화하면 발급된 토큰 폐기)"""
+        user = super().update(db, db_obj=db_obj, obj_in=obj_in, commit=commit)
+        if self._deactivates(obj_in):
+            self.revoke_tokens(db, user.id)
+        return user
+    
+    def update_by_id(
+        self,
+        db: Session,
+        *,
+        id: Any,
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        where: Optional[Dict[str, Any]] = None,
+        commit: bool = False,
+    ) -> Optional[User]:
+        """ID로 사용자 업데이트 (비활성화하면 발급된 토큰 폐기)"""
+        user = super().update_by_id(db, id=id, obj_in=obj_in, where=where, commit=commit)
+        if user is not None and self._deactivates(obj_in):
+            self.revoke_tokens(db, id)
+        return user
+    
+    def remove(self, db: Session, *, id: Any, commit: bool = False) -> Optional[User]:
+        """사용자 삭제 (발급된 토큰 폐기)"""
+        user = super().remove(db, id=id, commit=commit)
+        if user is not None:
+            self.revoke_tokens(db, id)
+        return user
+    
+    def remove_many(
+        self,
+        db: Session,
+        *,
+        ids: Sequence[Any],
+        batch_size: Optional[int] = None,
+        commit: bool = False,
+    ) -> List[User]:
+        """여러 사용자 일괄 삭제 (발급된 토큰 폐기)"""
+        removed = super().remove_many(db, ids=ids, batch_size=batch_size, commit=commit)
+        self.revoke_tokens(db, *(user.id for user in removed))
+        return removed
+    
+    @staticmethod
+    def _deactivates(obj_in: Union[UserUpdate, Dict[str, Any]]) -> bool:
+        """업데이트 데이터가 사용자를 비활성화하는지 여부"""
+        if isinstance(obj_in, dict):
+            return obj_in.get("is_active") is False
+        return obj_in.is_active is False
+    
+    def revoke_tokens(self, db: Optional[Session], *ids: Any) -> None:
+        """
+        사용자들에게 지금까지 발급된 액세스 토큰 폐기 (모든 워커에 전파)
+        
+        커밋되지 않은 변경이 있으면 커밋된 뒤에 폐기해, 롤백된 비활성화로 로그아웃되지 않게 합니다.
+        
+        Args:
+            db: 데이터베이스 세션 (None이면 즉시 폐기)
+            ids: 비활성화/삭제된 사용자 ID 목록
+        """
+        def revoke() -> None:
+            for id in ids:
+                token_revocations.revoke_user(id)
+        
+        if not ids:
+            return
+        if db is not None and has_uncommitted_writes(db):
+            run_after_commit(db, revoke)
+        else:
+            revoke()
+    
     def is_active(self, user: User) -> bool:
         """사용자 활성화 여부 확인"""
         return user.is_active
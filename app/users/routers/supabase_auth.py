@@ -1,11 +1,12 @@
 from typing import Any
 
-from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.core.database.supabase import get_supabase
-from app.users.dependencies import get_supabase_user_service
-from app.users.schemas.token import Token
+from app.core.utils.security import revoke_access_token
+from app.users.dependencies import get_supabase_user_service, reusable_oauth2
+from app.users.schemas.user import Token
 from app.users.schemas.user import UserCreate
 from app.users.services.supabase_user_service import SupabaseUserService
 
@@ -13,7 +14,7 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=Token)
-def login_access_token(
+async def login_access_token(
     service: SupabaseUserService = Depends(get_supabase_user_service),
     form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Any:
@@ -27,7 +28,7 @@ def login_access_token(
             detail="Supabase client not initialized",
         )
     
-    user = service.authenticate(
+    user = await service.aauthenticate(
         supabase, email=form_data.username, password=form_data.password
     )
     if not user:
@@ -45,8 +46,16 @@ def login_access_token(
     return service.create_access_token(user["id"])
 
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(request: Request, token: str = Depends(reusable_oauth2)) -> None:
+    """
+    로그아웃, 현재 액세스 토큰 폐기 (모든 워커에서 거부)
+    """
+    revoke_access_token(token, request)
+
+
 @router.post("/register", response_model=Token)
-def register_user(
+async def register_user(
     *,
     service: SupabaseUserService = Depends(get_supabase_user_service),
     user_in: UserCreate,
@@ -61,24 +70,9 @@ def register_user(
             detail="Supabase client not initialized",
         )
     
-    # 이메일 중복 확인
-    user = service.get_by_email(supabase, email=user_in.email)
-    if user:
-        raise HTTPException(
-            status_code=400,
-            detail="이미 등록된 이메일입니다.",
-        )
-    
-    # 사용자명 중복 확인
-    user = service.get_by_username(supabase, username=user_in.username)
-    if user:
-        raise HTTPException(
-            status_code=400,
-            detail="이미 사용 중인 사용자명입니다.",
-        )
-    
+    # 이메일/사용자명 중복은 서비스에서 확인 (ValueError -> 400)
     try:
-        user = service.create(supabase, obj_in=user_in)
+        user = await service.acreate(supabase, obj_in=user_in)
         return service.create_access_token(user["id"])
     except ValueError as e:
         raise HTTPException(
@@ -1,11 +1,16 @@
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.encoders import jsonable_encoder
 from pydantic import EmailStr
 
+from app.core.cache import Principal
 from app.core.database.supabase import get_supabase
+from app.core.observability import TimedJSONResponse
+from app.core.utils.projection import parse_fields
 from app.users.dependencies import (
+    get_current_active_supabase_principal,
     get_current_active_supabase_superuser,
     get_current_active_supabase_user,
     get_supabase_user_service,
@@ -22,7 +27,8 @@ def read_users(
     service: SupabaseUserService = Depends(get_supabase_user_service),
     skip: int = 0,
     limit: int = 100,
-    current_user: dict = Depends(get_current_active_supabase_superuser),
+    fields: Optional[str] = Query(None, description="조회할 필드 (쉼표로 구분, 예: id,username)"),
+    current_user: Principal = Depends(get_current_active_supabase_superuser),
 ) -> Any:
     """
     모든 사용자 조회 (관리자 전용)
@@ -34,12 +40,22 @@ def read_users(
             detail="Supabase client not initialized",
         )
     
-    users = service.get_multi(supabase, skip=skip, limit=limit)
+    try:
+        field_names = parse_fields(fields, User.model_fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e),
+        )
+    users = service.get_multi(supabase, skip=skip, limit=limit, fields=field_names)
+    if field_names:
+        # 일부 필드만 조회한 경우 응답 모델 검증 없이 그대로 반환
+        return TimedJSONResponse(content=jsonable_encoder(users))
     return users
 
 
 @router.post("/", response_model=User)
-def create_user(
+async def create_user(
     *,
     service: SupabaseUserService = Depends(get_supabase_user_service),
     user_in: UserCreate,
@@ -54,24 +70,9 @@ def create_user(
             detail="Supabase client not initialized",
         )
     
-    # 이메일 중복 확인
-    user = service.get_by_email(supabase, email=user_in.email)
-    if user:
-        raise HTTPException(
-            status_code=400,
-            detail="이미 등록된 이메일입니다.",
-        )
-    
-    # 사용자명 중복 확인
-    user = service.get_by_username(supabase, username=user_in.username)
-    if user:
-        raise HTTPException(
-            status_code=400,
-            detail="이미 사용 중인 사용자명입니다.",
-        )
-    
+    # 이메일/사용자명 중복은 서비스에서 확인 (ValueError -> 400)
     try:
-        user = service.create(supabase, obj_in=user_in)
+        user = await service.acreate(supabase, obj_in=user_in)
         return user
     except ValueError as e:
         raise HTTPException(
@@ -91,7 +92,7 @@ def read_user_me(
 
 
 @router.put("/me", response_model=User)
-def update_user_me(
+async def update_user_me(
     *,
     service: SupabaseUserService = Depends(get_supabase_user_service),
     password: Optional[str] = Body(None),
@@ -123,7 +124,7 @@ def update_user_me(
         user_in.username = username
     
     try:
-        user = service.update(supabase, id=current_user["id"], obj_in=user_in)
+        user = await service.aupdate(supabase, id=current_user["id"], obj_in=user_in)
         return user
     except ValueError as e:
         raise HTTPException(
@@ -136,7 +137,7 @@ def update_user_me(
 def read_user_by_id(
     user_id: int,
     service: SupabaseUserService = Depends(get_supabase_user_service),
-    current_user: dict = Depends(get_current_active_supabase_user),
+    current_user: Principal = Depends(get_current_active_supabase_principal),
 ) -> Any:
     """
     특정 사용자 정보 조회
@@ -156,7 +157,7 @@ def read_user_by_id(
         )
     
     # 관리자가 아니면서 다른 사용자 정보를 조회하려는 경우
-    if not service.is_superuser(current_user) and user_id != current_user["id"]:
+    if not current_user.is_superuser and user_id != current_user.id:
         raise HTTPException(
             status_code=400,
             detail="The user doesn't have enough privileges",
@@ -166,12 +167,12 @@ def read_user_by_id(
 
 
 @router.put("/{user_id}", response_model=User)
-def update_user(
+async def update_user(
     *,
     user_id: int,
     service: SupabaseUserService = Depends(get_supabase_user_service),
     user_in: UserUpdate,
-    current_user: dict = Depends(get_current_active_supabase_superuser),
+    current_user: Principal = Depends(get_current_active_supabase_superuser),
 ) -> Any:
     """
     특정 사용자 정보 업데이트 (관리자 전용)
@@ -183,7 +184,7 @@ def update_user(
             detail="Supabase client not initialized",
         )
     
-    user = service.get(supabase, id=user_id)
+    user = await run_in_threadpool(service.get, supabase, id=user_id)
     if not user:
         raise HTTPException(
             status_code=404,
@@ -191,7 +192,7 @@ def update_user(
         )
     
     try:
-        user = service.update(supabase, id=user_id, obj_in=user_in)
+        user = await service.aupdate(supabase, id=user_id, obj_in=user_in)
         return user
     except ValueError as e:
         raise HTTPException(
@@ -205,7 +206,7 @@ def delete_user(
     *,
     user_id: int,
     service: SupabaseUserService = Depends(get_supabase_user_service),
-    current_user: dict = Depends(get_current_active_supabase_superuser),
+    current_user: Principal = Depends(get_current_active_supabase_superuser),
 ) -> Any:
     """
     특정 사용자 삭제 (관리자 전용)
@@ -217,19 +218,18 @@ def delete_user(
             detail="Supabase client not initialized",
         )
     
-    user = service.get(supabase, id=user_id)
-    if not user:
-        raise HTTPException(
-            status_code=404,
-            detail="User not found",
-        )
-    
     # 자기 자신을 삭제하려는 경우
-    if user_id == current_user["id"]:
+    if user_id == current_user.id:
         raise HTTPException(
             status_code=400,
             detail="Users cannot delete themselves",
         )
     
-    user = service.remove(supabase, id=user_id)
+    try:
+        user = service.remove(supabase, id=user_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=404,
+            detail="User not found",
+        )
     return user 
\ No newline at end of file
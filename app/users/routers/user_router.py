@@ -1,11 +1,17 @@
-from typing import Any, List
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 
+from app.core.cache import Principal
 from app.core.database.deps import get_db
+from app.core.observability import TimedJSONResponse
+from app.core.schemas.base import PaginatedResponseSchema
+from app.core.repositories.loader import RepositoryLoader, loader_dependency
+from app.core.utils.projection import parse_fields
 from app.core.utils.security import get_current_active_user, get_current_active_superuser
-from app.users.models.user import User
+from app.users.repositories import user_repository
 from app.users.schemas.user import User as UserSchema, UserCreate, UserUpdate
 from app.users.services import user_service
 
@@ -17,27 +23,38 @@ def read_users(
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_active_superuser),
+    fields: Optional[str] = Query(None, description="조회할 필드 (쉼표로 구분, 예: id,username)"),
+    current_user: Principal = Depends(get_current_active_superuser),
 ) -> Any:
     """
     모든 사용자 목록 조회 (관리자 전용)
     """
-    users = user_service.get_multi(db, skip=skip, limit=limit)
+    try:
+        field_names = parse_fields(fields, UserSchema.model_fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    users = user_service.get_multi(db, skip=skip, limit=limit, fields=field_names)
+    if field_names:
+        # 일부 필드만 조회한 경우 응답 모델 검증 없이 그대로 반환
+        return TimedJSONResponse(content=jsonable_encoder(users))
     return users
 
 
 @router.post("/", response_model=UserSchema)
-def create_user(
+async def create_user(
     *,
     db: Session = Depends(get_db),
     user_in: UserCreate,
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ) -> Any:
     """
     새 사용자 생성 (관리자 전용)
     """
     try:
-        user = user_service.create(db, obj_in=user_in)
+        user = await user_service.acreate(db, obj_in=user_in)
         return user
     except HTTPException as e:
         raise e
@@ -50,26 +67,33 @@ def create_user(
 
 @router.get("/me", response_model=UserSchema)
 def read_user_me(
-    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> Any:
     """
     현재 로그인한 사용자 정보 조회
     """
-    return current_user
+    user = user_service.get(db, id=current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다.",
+        )
+    return user
 
 
 @router.put("/me", response_model=UserSchema)
-def update_user_me(
+async def update_user_me(
     *,
     db: Session = Depends(get_db),
     user_in: UserUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> Any:
     """
     현재 로그인한 사용자 정보 수정
     """
     try:
-        user = user_service.update(db, id=current_user.id, obj_in=user_in)
+        user = await user_service.aupdate(db, id=current_user.id, obj_in=user_in)
         return user
     except HTTPException as e:
         raise e
@@ -80,16 +104,53 @@ def update_user_me(
         )
 
 
+@router.get("/search", response_model=PaginatedResponseSchema[UserSchema])
+def search_users(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (이메일, 사용자명, 이름)"),
+    skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
+    limit: int = Query(20, ge=1, le=100, description="최대 항목 수"),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_superuser),
+) -> Any:
+    """
+    사용자 검색 (관리자 전용)
+    
+    이메일, 사용자명, 이름에서 검색어를 찾아 관련도 순으로 반환합니다.
+    전체 개수는 계산하지 않고 has_more로 다음 페이지 여부만 알려줍니다.
+    """
+    # 공백만 있는 검색어는 모든 사용자와 일치하므로 거절
+    term = q.strip()
+    if not term:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="검색어를 입력해 주세요.",
+        )
+    
+    # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+    users = user_service.search(db, term, skip=skip, limit=limit + 1)
+    return {
+        "success": True,
+        "message": "사용자를 검색했습니다",
+        "total": None,
+        "page": skip // limit + 1,
+        "size": limit,
+        "items": users[:limit],
+        "has_more": len(users) > limit,
+    }
+
+
 @router.get("/{user_id}", response_model=UserSchema)
-def read_user_by_id(
+async def read_user_by_id(
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    users: RepositoryLoader = Depends(loader_dependency(user_repository)),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> Any:
     """
     사용자 ID로 사용자 정보 조회
+    
+    요청 범위 조회기를 사용하므로 같은 요청에서 같은 사용자를 다시 조회해도 추가 쿼리가 없습니다.
     """
-    user = user_service.get(db, id=user_id)
+    user = await users.load(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -104,18 +165,18 @@ def read_user_by_id(
 
 
 @router.put("/{user_id}", response_model=UserSchema)
-def update_user(
+async def update_user(
     *,
     db: Session = Depends(get_db),
     user_id: int,
     user_in: UserUpdate,
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ) -> Any:
     """
     사용자 정보 수정 (관리자 전용)
     """
     try:
-        user = user_service.update(db, id=user_id, obj_in=user_in)
+        user = await user_service.aupdate(db, id=user_id, obj_in=user_in)
         return user
     except HTTPException as e:
         raise e
@@ -131,21 +192,20 @@ def delete_user(
     *,
     db: Session = Depends(get_db),
     user_id: int,
-    current_user: User = Depends(get_current_active_superuser),
+    current_user: Principal = Depends(get_current_active_superuser),
 ) -> Any:
     """
     사용자 삭제 (관리자 전용)
     """
-    user = user_service.get(db, id=user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다.",
-        )
-    if user.id == current_user.id:
+    if user_id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="자신의 계정은 삭제할 수 없습니다.",
         )
     user = user_service.remove(db, id=user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다.",
+        )
     return user 
\ No newline at end of file
@@ -1,11 +1,13 @@
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
 from datetime import datetime, timedelta
 import logging
 
+from fastapi.concurrency import run_in_threadpool
 from supabase import Client
 from pydantic import EmailStr
 
 from app.core.config import settings
+from app.core.utils.filtering import QuerySpec
 from app.core.utils.security import create_access_token
 from app.users.schemas.user import UserCreate, UserUpdate, User as UserSchema
 from app.users.repositories.supabase_user_repository import SupabaseUserRepository
@@ -66,7 +68,15 @@ class SupabaseUserService:
         """
         return self.repository.get_by_username(supabase, username)
     
-    def get_multi(self, supabase: Client, *, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    def get_multi(
+        self,
+        supabase: Client,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        spec: Optional[QuerySpec] = None,
+    ) -> List[Dict[str, Any]]:
         """
         여러 사용자 조회
         
@@ -74,11 +84,43 @@ class SupabaseUserService:
             supabase: Supabase 클라이언트
             skip: 건너뛸 항목 수
             limit: 최대 항목 수
+            fields: 조회할 필드 목록 (지정 시 해당 컬럼만 조회)
+            spec: 필터 조건과 정렬 순서 (기본값: 조건 없이 ID 순)
             
         Returns:
             사용자 목록
         """
-        return self.repository.get_multi(supabase, skip=skip, limit=limit)
+        return self.repository.get_multi(
+            supabase, skip=skip, limit=limit, fields=fields, spec=spec
+        )
+    
+    def get_multi_keyset(
+        self,
+        supabase: Client,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: str = "id",
+        fields: Optional[Sequence[str]] = None,
+        spec: Optional[QuerySpec] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        커서 기반(키셋) 페이지네이션으로 여러 사용자 조회
+        
+        Args:
+            supabase: Supabase 클라이언트
+            cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+            limit: 최대 항목 수
+            order_by: 정렬 기준 필드 (내림차순은 "-" 접두사)
+            fields: 조회할 필드 목록 (지정 시 해당 컬럼만 조회)
+            spec: 필터 조건 (정렬은 order_by 사용)
+            
+        Returns:
+            (사용자 목록, 다음 페이지 커서) 튜플
+        """
+        return self.repository.get_multi_keyset(
+            supabase, cursor=cursor, limit=limit, order_by=order_by, fields=fields, spec=spec
+        )
     
     def create(self, supabase: Client, *, obj_in: UserCreate) -> Dict[str, Any]:
         """
@@ -91,6 +133,25 @@ class SupabaseUserService:
         Returns:
             생성된 사용자 정보
         """
+        self._check_create_conflicts(supabase, obj_in)
+        return self.repository.create(supabase, obj_in=obj_in)
+    
+    async def acreate(self, supabase: Client, *, obj_in: UserCreate) -> Dict[str, Any]:
+        """
+        사용자 생성 (비동기, 비밀번호는 비밀번호 해싱 풀에서 해싱)
+                
+        Args:
+            supabase: Supabase 클라이언트
+            obj_in: 생성할 사용자 데이터
+                        
+        Returns:
+            생성된 사용자 정보
+        """
+        await run_in_threadpool(self._check_create_conflicts, supabase, obj_in)
+        return await self.repository.acreate(supabase, obj_in=obj_in)
+    
+    def _check_create_conflicts(self, supabase: Client, obj_in: UserCreate) -> None:
+        """생성할 사용자의 이메일/사용자명 중복 확인"""
         # 이메일 중복 확인
         user = self.repository.get_by_email(supabase, email=obj_in.email)
         if user:
@@ -100,9 +161,6 @@ class SupabaseUserService:
         user = self.repository.get_by_username(supabase, username=obj_in.username)
         if user:
             raise ValueError(f"이미 사용 중인 사용자명입니다: {obj_in.username}")
-        
-        # 사용자 생성
-        return self.repository.create(supabase, obj_in=obj_in)
     
     def update(self, supabase: Client, *, id: Any, obj_in: Union[UserUpdate, Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -116,35 +174,58 @@ class SupabaseUserService:
         Returns:
             업데이트된 사용자 정보
         """
-        # 사용자 존재 확인
-        user = self.repository.get(supabase, id)
-        if not user:
-            raise ValueError(f"사용자를 찾을 수 없습니다: {id}")
-        
-        # 이메일 중복 확인
+        self._check_update_conflicts(supabase, id, obj_in)
+        # 사용자 업데이트 (존재 여부는 갱신 결과로 판단)
+        return self._updated_or_error(id, self.repository.update(supabase, id=id, obj_in=obj_in))
+    
+    async def aupdate(
+        self, supabase: Client, *, id: Any, obj_in: Union[UserUpdate, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        사용자 업데이트 (비동기, 새 비밀번호는 비밀번호 해싱 풀에서 해싱)
+                
+        Args:
+            supabase: Supabase 클라이언트
+            id: 업데이트할 사용자 ID
+            obj_in: 업데이트 데이터
+                        
+        Returns:
+            업데이트된 사용자 정보
+        """
+        await run_in_threadpool(self._check_update_conflicts, supabase, id, obj_in)
+        user = await self.repository.aupdate(supabase, id=id, obj_in=obj_in)
+        return self._updated_or_error(id, user)
+    
+    def _check_update_conflicts(
+        self, supabase: Client, id: Any, obj_in: Union[UserUpdate, Dict[str, Any]]
+    ) -> None:
+        """바뀌는 이메일/사용자명 중복 확인"""
         if isinstance(obj_in, dict):
             email = obj_in.get("email")
-        else:
-            email = obj_in.email if obj_in.email else None
-        
-        if email and email != user["email"]:
-            existing_user = self.repository.get_by_email(supabase, email=email)
-            if existing_user:
-                raise ValueError(f"이미 등록된 이메일입니다: {email}")
-        
-        # 사용자명 중복 확인
-        if isinstance(obj_in, dict):
             username = obj_in.get("username")
         else:
+            email = obj_in.email if obj_in.email else None
             username = obj_in.username if obj_in.username else None
         
-        if username and username != user["username"]:
-            existing_user = self.repository.get_by_username(supabase, username=username)
-            if existing_user:
-                raise ValueError(f"이미 사용 중인 사용자명입니다: {username}")
-        
-        # 사용자 업데이트
-        return self.repository.update(supabase, id=id, obj_in=obj_in)
+        # 이메일/사용자명이 포함된 경우에만 현재 값을 (엔티티 캐시에서) 읽어 바뀌는 값만 중복 확인
+        current = self.repository.get(supabase, id) if email or username else None
+        if current is not None:
+            if email and email != current["email"]:
+                existing_user = self.repository.get_by_email(supabase, email=email)
+                if existing_user and existing_user["id"] != id:
+                    raise ValueError(f"이미 등록된 이메일입니다: {email}")
+            
+            if username and username != current["username"]:
+                existing_user = self.repository.get_by_username(supabase, username=username)
+                if existing_user and existing_user["id"] != id:
+                    raise ValueError(f"이미 사용 중인 사용자명입니다: {username}")
+    
+    @staticmethod
+    def _updated_or_error(id: Any, user: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """갱신 결과 반환 (대상이 없으면 오류)"""
+        if not user:
+            raise ValueError(f"사용자를 찾을 수 없습니다: {id}")
+        return user
     
     def remove(self, supabase: Client, *, id: Any) -> Dict[str, Any]:
         """
@@ -157,13 +238,77 @@ class SupabaseUserService:
         Returns:
             삭제된 사용자 정보
         """
-        # 사용자 존재 확인
-        user = self.repository.get(supabase, id)
+        # 사용자 삭제 (존재 여부는 삭제 결과로 판단)
+        user = self.repository.remove(supabase, id=id)
         if not user:
             raise ValueError(f"사용자를 찾을 수 없습니다: {id}")
+        return user
+    
+    def create_many(
+        self,
+        supabase: Client,
+        *,
+        objs_in: Sequence[Union[UserCreate, Dict[str, Any]]],
+        batch_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 사용자 일괄 생성
+        
+        Args:
+            supabase: Supabase 클라이언트
+            objs_in: 생성할 사용자 데이터 목록
+            batch_size: 한 번에 처리할 최대 행 수
+            
+        Returns:
+            생성된 사용자 목록
+        """
+        return self.repository.create_many(supabase, objs_in=objs_in, batch_size=batch_size)
+    
+    def upsert_many(
+        self,
+        supabase: Client,
+        *,
+        objs_in: Sequence[Union[UserCreate, Dict[str, Any]]],
+        conflict_fields: Optional[Sequence[str]] = None,
+        update_fields: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 사용자 일괄 생성 또는 갱신
+        
+        Args:
+            supabase: Supabase 클라이언트
+            objs_in: 생성 또는 갱신할 사용자 데이터 목록
+            conflict_fields: 충돌 판단에 사용할 고유 키
+            update_fields: 기존 사용자에 덮어쓸 필드 (기본값: 비밀번호/권한을 제외한 프로필 필드)
+            batch_size: 한 번에 처리할 최대 행 수
+            
+        Returns:
+            생성 또는 갱신된 사용자 목록
+        """
+        return self.repository.upsert_many(
+            supabase,
+            objs_in=objs_in,
+            conflict_fields=conflict_fields,
+            update_fields=update_fields,
+            batch_size=batch_size,
+        )
+    
+    def remove_many(
+        self, supabase: Client, *, ids: Sequence[Any], batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 사용자 일괄 삭제
         
-        # 사용자 삭제
-        return self.repository.remove(supabase, id=id)
+        Args:
+            supabase: Supabase 클라이언트
+            ids: 삭제할 사용자 ID 목록
+            batch_size: 한 번에 처리할 최대 행 수
+            
+        Returns:
+            삭제된 사용자 목록
+        """
+        return self.repository.remove_many(supabase, ids=ids, batch_size=batch_size)
     
     def authenticate(self, supabase: Client, *, email: str, password: str) -> Optional[Dict[str, Any]]:
         """
@@ -179,6 +324,20 @@ class SupabaseUserService:
         """
         return self.repository.authenticate(supabase, email=email, password=password)
     
+    async def aauthenticate(self, supabase: Client, *, email: str, password: str) -> Optional[Dict[str, Any]]:
+        """
+        사용자 인증 (비동기, 비밀번호 검증은 비밀번호 해싱 풀에서 실행)
+        
+        Args:
+            supabase: Supabase 클라이언트
+            email: 사용자 이메일
+            password: 비밀번호
+            
+        Returns:
+            인증된 사용자 정보 또는 None
+        """
+        return await self.repository.aauthenticate(supabase, email=email, password=password)
+    
     def create_access_token(self, user_id: int) -> Dict[str, str]:
         """
         액세스 토큰 생성
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.config import settings
 from app.core.utils.security import create_access_token, verify_password, get_password_hash
@@ -25,8 +26,18 @@ class UserService(BaseService[User, UserCreate, UserUpdate, UserSchema]):
         """사용자명으로 사용자 조회"""
         return self.repository.get_by_username(db=db, username=username)
 
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
+    def create(self, db: Session, *, obj_in: UserCreate, commit: bool = False) -> User:
         """사용자 생성"""
+        self._check_create_conflicts(db, obj_in)
+        return self.repository.create(db=db, obj_in=obj_in, commit=commit)
+    
+    async def acreate(self, db: Session, *, obj_in: UserCreate, commit: bool = False) -> User:
+        """사용자 생성 (비동기, 비밀번호는 비밀번호 해싱 풀에서 해싱)"""
+        await run_in_threadpool(self._check_create_conflicts, db, obj_in)
+        return await self.repository.acreate(db, obj_in=obj_in, commit=commit)
+    
+    def _check_create_conflicts(self, db: Session, obj_in: UserCreate) -> None:
+        """생성할 사용자의 이메일/사용자명 중복 확인"""
         # 이메일 중복 확인
         user = self.repository.get_by_email(db, email=obj_in.email)
         if user:
@@ -42,52 +53,94 @@ class UserService(BaseService[User, UserCreate, UserUpdate, UserSchema]):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="이미 사용 중인 사용자 이름입니다."
             )
-        
-        return self.repository.create(db=db, obj_in=obj_in)
 
-    def update(self, db: Session, *, id: int, obj_in: Union[UserUpdate, Dict[str, Any]]) -> User:
-        """사용자 정보 업데이트"""
-        user = self.repository.get(db=db, id=id)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="사용자를 찾을 수 없습니다."
-            )
+    def update(
+        self,
+        db: Session,
+        *,
+        id: int,
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        where: Optional[Dict[str, Any]] = None,
+        commit: bool = False,
+    ) -> Optional[User]:
+        """
+        사용자 정보 업데이트
         
-        # 이메일 중복 확인
+        UPDATE ... RETURNING 한 번으로 갱신합니다. 이메일/사용자명이 포함된 경우에만 현재 값을
+        (엔티티 캐시에서) 읽어 실제로 바뀌는 값만 중복을 확인합니다.
+        where 조건을 지정하면 조건에 맞지 않는 경우 예외 대신 None을 반환합니다.
+        """
+        self._check_update_conflicts(db, id, obj_in)
+        user = self.repository.update_by_id(
+            db=db, id=id, obj_in=obj_in, where=where, commit=commit
+        )
+        return self._updated_or_404(user, where)
+    
+    async def aupdate(
+        self,
+        db: Session,
+        *,
+        id: int,
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        where: Optional[Dict[str, Any]] = None,
+        commit: bool = False,
+    ) -> Optional[User]:
+        """사용자 정보 업데이트 (비동기, 새 비밀번호는 비밀번호 해싱 풀에서 해싱)"""
+        await run_in_threadpool(self._check_update_conflicts, db, id, obj_in)
+        user = await self.repository.aupdate_by_id(
+            db, id=id, obj_in=obj_in, where=where, commit=commit
+        )
+        return self._updated_or_404(user, where)
+    
+    def _check_update_conflicts(
+        self, db: Session, id: int, obj_in: Union[UserUpdate, Dict[str, Any]]
+    ) -> None:
+        """바뀌는 이메일/사용자명 중복 확인"""
         if isinstance(obj_in, dict):
             email = obj_in.get("email")
-        else:
-            email = obj_in.email
-        
-        if email and email != user.email:
-            existing_user = self.repository.get_by_email(db, email=email)
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="이미 등록된 이메일입니다."
-                )
-        
-        # 사용자명 중복 확인
-        if isinstance(obj_in, dict):
             username = obj_in.get("username")
         else:
+            email = obj_in.email
             username = obj_in.username
         
-        if username and username != user.username:
-            existing_username = self.repository.get_by_username(db, username=username)
-            if existing_username:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="이미 사용 중인 사용자 이름입니다."
-                )
-        
-        return self.repository.update(db=db, db_obj=user, obj_in=obj_in)
+        current = self.repository.get(db, id) if email or username else None
+        if current is not None:
+            # 이메일 중복 확인 (현재 값과 다를 때만 조회)
+            if email and email != current.email:
+                existing_user = self.repository.get_by_email(db, email=email)
+                if existing_user and existing_user.id != id:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="이미 등록된 이메일입니다."
+                    )
+            
+            # 사용자명 중복 확인 (현재 값과 다를 때만 조회)
+            if username and username != current.username:
+                existing_username = self.repository.get_by_username(db, username=username)
+                if existing_username and existing_username.id != id:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="이미 사용 중인 사용자 이름입니다."
+                    )
+    
+    @staticmethod
+    def _updated_or_404(user: Optional[User], where: Optional[Dict[str, Any]]) -> Optional[User]:
+        """갱신 결과 반환 (where 조건 없이 대상이 없으면 404)"""
+        if not user and where is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사용자를 찾을 수 없습니다."
+            )
+        return user
 
     def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
         """사용자 인증"""
         user = self.repository.authenticate(db=db, email=email, password=password)
         return user
+    
+    async def aauthenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
+        """사용자 인증 (비동기, 비밀번호 검증은 비밀번호 해싱 풀에서 실행)"""
+        return await self.repository.aauthenticate(db=db, email=email, password=password)
 
     def create_access_token(self, user_id: int) -> Dict[str, str]:
         """액세스 토큰 생성"""
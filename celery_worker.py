@@ -6,11 +6,10 @@ from dotenv import load_dotenv
 env_file = os.getenv("ENV_FILE", ".env")
 load_dotenv(env_file)
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# 로깅 설정 (기록은 큐를 거쳐 백그라운드 스레드에서 출력)
+from app.core.observability import setup_logging
+
+setup_logging(level="INFO")
 logger = logging.getLogger(__name__)
 
 # Redis 연결 정보 로깅
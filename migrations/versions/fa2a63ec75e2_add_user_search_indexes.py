@@ -0,0 +1,92 @@
+"""add user search indexes
+
+사용자 검색(/users/search, 어드민 목록 검색)용 인덱스
+
+- PostgreSQL: 검색 문서 tsvector GIN 인덱스와 email/username/full_name pg_trgm GIN 인덱스
+  (운영 중인 테이블을 잠그지 않도록 CREATE INDEX CONCURRENTLY 사용)
+- SQLite: trigram 토크나이저 FTS5 테이블과 동기화 트리거
+  (trigram 토크나이저가 없는 SQLite 3.34 미만에서는 만들지 않고 LIKE 검색으로 대체)
+
+검색 문서 식은 app.core.database.search.search_document(USER_SEARCH_FIELDS)와 같아야
+조회 조건이 인덱스를 사용합니다.
+
+Revision ID: fa2a63ec75e2
+Revises: 1b6f0c3d2a47
+Create Date: 2026-10-17 07:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'fa2a63ec75e2'
+down_revision = '1b6f0c3d2a47'
+branch_labels = None
+depends_on = None
+
+SEARCH_DOCUMENT = (
+    "coalesce(username, '') || ' ' || coalesce(full_name, '') || ' ' || coalesce(email, '')"
+)
+TRIGRAM_COLUMNS = ("email", "username", "full_name")
+# FTS5 trigram 토크나이저가 추가된 SQLite 버전
+SQLITE_TRIGRAM_MIN_VERSION = (3, 34, 0)
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5("
+    "username, full_name, email, content='users', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN "
+    "INSERT INTO users_fts(rowid, username, full_name, email) "
+    "VALUES (new.id, new.username, new.full_name, new.email); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN "
+    "INSERT INTO users_fts(users_fts, rowid, username, full_name, email) "
+    "VALUES ('delete', old.id, old.username, old.full_name, old.email); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_au AFTER UPDATE ON users BEGIN "
+    "INSERT INTO users_fts(users_fts, rowid, username, full_name, email) "
+    "VALUES ('delete', old.id, old.username, old.full_name, old.email); "
+    "INSERT INTO users_fts(rowid, username, full_name, email) "
+    "VALUES (new.id, new.username, new.full_name, new.email); END",
+    "INSERT INTO users_fts(users_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS users_fts_ai",
+    "DROP TRIGGER IF EXISTS users_fts_ad",
+    "DROP TRIGGER IF EXISTS users_fts_au",
+    "DROP TABLE IF EXISTS users_fts",
+]
+
+
+def _sqlite_supports_trigram():
+    version = op.get_bind().exec_driver_sql("SELECT sqlite_version()").scalar()
+    return tuple(int(part) for part in version.split(".")[:3]) >= SQLITE_TRIGRAM_MIN_VERSION
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_search_document ON users "
+                f"USING gin (to_tsvector('simple', {SEARCH_DOCUMENT}))"
+            )
+            for column in TRIGRAM_COLUMNS:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_{column}_trgm ON users "
+                    f"USING gin ({column} gin_trgm_ops)"
+                )
+    elif dialect == "sqlite" and _sqlite_supports_trigram():
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_search_document")
+            for column in TRIGRAM_COLUMNS:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_users_{column}_trgm")
+    elif dialect == "sqlite":
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
@@ -0,0 +1,140 @@
+"""
+미들웨어 처리량 측정
+
+간단한 인증 엔드포인트에 로깅/인증 미들웨어를 붙이고 ASGI 앱을 직접 호출해
+(네트워크/서버 비용 제외) 초당 요청 수를 비교합니다.
+
+- 미들웨어 없음
+- 이전 구현 (BaseHTTPMiddleware 기반 로깅 + 인증, 공개 경로를 요청마다 any(startswith)로 확인)
+- 순수 ASGI 구현 (app.core.middlewares)
+- 순수 ASGI 구현 + 요청 메트릭 (MetricsMiddleware)
+
+실행:
+    python scripts/bench_middleware.py [--requests 5000] [--concurrency 10]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ENV", "test")
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+
+from app.core.database.instrumentation import track_queries
+from app.core.middlewares import AuthMiddleware, LoggingMiddleware, MetricsMiddleware
+from app.core.middlewares.auth_middleware import PUBLIC_PATHS
+from app.core.utils.security import create_access_token
+from app.core.utils.tokens import get_token_claims
+
+logger = logging.getLogger("app.core.middlewares.logging_middleware")
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """비교용 이전 로깅 미들웨어"""
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        logger.info(f"Request: {request.method} {request.url.path}")
+        with track_queries() as query_stats:
+            response = await call_next(request)
+        process_time = time.time() - start_time
+        summary = query_stats.summary()
+        logger.info(
+            f"Response: {request.method} {request.url.path} - Status: {response.status_code}"
+            f" - Time: {process_time:.4f}s - Queries: {summary['db_queries']}",
+            extra=summary,
+        )
+        return response
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    """비교용 이전 인증 미들웨어"""
+
+    async def dispatch(self, request: Request, call_next):
+        # 이전 구현은 "/"도 접두사로 확인해 모든 경로를 통과시켰으므로 같은 일을 하도록 "/"는 제외
+        public_paths = [path for path in PUBLIC_PATHS if path != "/"]
+        if any(request.url.path.startswith(path) for path in public_paths):
+            return await call_next(request)
+        _, _, token = request.headers.get("Authorization", "").partition(" ")
+        request.state.user_id = get_token_claims(token, request.scope).get("sub")
+        return await call_next(request)
+
+
+def build_app(*middlewares: Callable[[ASGIApp], ASGIApp]) -> FastAPI:
+    """간단한 엔드포인트 하나와 지정한 미들웨어로 구성한 앱"""
+    app = FastAPI()
+
+    @app.get("/api/v1/ping")
+    async def ping(request: Request) -> Dict[str, Any]:
+        return {"user_id": getattr(request.state, "user_id", None)}
+
+    for middleware in middlewares:
+        app.add_middleware(middleware)
+    return app
+
+
+async def run(app: ASGIApp, headers: List, total: int, concurrency: int) -> float:
+    """ASGI 앱을 직접 호출해 초당 요청 수 측정"""
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": "/api/v1/ping",
+                "raw_path": b"/api/v1/ping",
+                "query_string": b"",
+                "root_path": "",
+                "headers": headers,
+                "client": ("127.0.0.1", 50000),
+                "server": ("testserver", 80),
+            }
+            await app(scope, receive, send)
+
+    # 라우터/미들웨어 스택 생성 비용을 측정에서 제외
+    await worker(10)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(total // concurrency) for _ in range(concurrency)))
+    return (total // concurrency * concurrency) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="미들웨어 처리량 측정")
+    parser.add_argument("--requests", type=int, default=5000, help="측정할 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시에 보내는 요청 수")
+    args = parser.parse_args()
+
+    token = create_access_token({"sub": "1"})
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+
+    # add_middleware는 마지막에 추가한 미들웨어가 가장 바깥이므로 인증, 로깅 순으로 추가
+    cases = {
+        "미들웨어 없음": build_app(),
+        "이전 구현 (BaseHTTPMiddleware)": build_app(LegacyAuthMiddleware, LegacyLoggingMiddleware),
+        "순수 ASGI": build_app(AuthMiddleware, LoggingMiddleware),
+        "순수 ASGI + 메트릭": build_app(AuthMiddleware, LoggingMiddleware, MetricsMiddleware),
+    }
+
+    for name, app in cases.items():
+        rps = asyncio.run(run(app, headers, args.requests, args.concurrency))
+        print(f"{name:<32} {rps:10.0f} req/s {1_000_000 / rps:8.1f} us/요청")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+저장소 조회 문 재사용 효과 측정
+
+매 호출마다 ORM 쿼리를 만드는 방식과 미리 만들어 둔 문(app.core.repositories.statements)을
+재사용하는 방식의 호출당 시간을 비교합니다. 메모리 SQLite를 사용하므로 측정값은
+데이터베이스 왕복이 아닌 Python 쪽 쿼리 생성/컴파일 비용을 주로 반영합니다.
+
+실행:
+    python scripts/bench_statement_cache.py [--number 20000]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("CACHE_ENABLED", "False")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.database.session import Base
+from app.core.repositories.base import BaseRepository
+from app.users.models.user import User
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="저장소 조회 문 재사용 효과 측정")
+    parser.add_argument("--number", type=int, default=20000, help="측정할 호출 횟수")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    db = Session(engine)
+    db.add_all(
+        User(email=f"user{i}@example.com", username=f"user{i}", hashed_password="x")
+        for i in range(1000)
+    )
+    db.commit()
+
+    repository = BaseRepository(User)
+    email = "user500@example.com"
+
+    cases = {
+        "ORM 쿼리 생성 (get_by_field 이전 방식)": lambda: db.query(User).filter(User.email == email).first(),
+        "미리 만든 문 재사용 (get_by_field)": lambda: repository.get_by_field(db, "email", email),
+        "ORM 쿼리 생성 (get 이전 방식)": lambda: db.query(User).filter(User.id == 500).first(),
+        "미리 만든 문 재사용 (get)": lambda: repository.get(db, 500),
+    }
+
+    for name, case in cases.items():
+        case()  # 컴파일 캐시 준비
+        elapsed = timeit.timeit(case, number=args.number)
+        print(f"{name:<40} {elapsed / args.number * 1_000_000:8.1f} us/호출")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+요청당 토큰 검증 비용 측정
+
+한 요청에서 인증 미들웨어와 인증 의존성이 같은 토큰을 확인하는 상황(요청당 3회)을
+기준으로 다음 방식의 요청당 시간을 비교합니다.
+
+- 매번 jwt.decode (HMAC 검증 + JSON 파싱 3회)
+- 첫 확인은 검증 결과 LRU, 이후는 ASGI scope 재사용 (app.core.utils.tokens)
+- LRU 없이 요청당 한 번만 검증하고 scope 재사용 (새 토큰의 첫 요청)
+
+실행:
+    python scripts/bench_token_verification.py [--number 20000]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ENV", "test")
+
+from jose import jwt
+
+from app.core.config import settings
+from app.core.utils.security import create_access_token
+from app.core.utils.tokens import get_token_claims, token_claims_cache
+
+# 요청 하나에서 토큰을 확인하는 횟수 (미들웨어 + 인증 의존성 + 중복 의존성)
+CHECKS_PER_REQUEST = 3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="요청당 토큰 검증 비용 측정")
+    parser.add_argument("--number", type=int, default=20000, help="측정할 요청 수")
+    args = parser.parse_args()
+
+    token = create_access_token({"sub": "1"})
+
+    def decode_every_time() -> None:
+        for _ in range(CHECKS_PER_REQUEST):
+            jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+    def cached() -> None:
+        scope = {}
+        for _ in range(CHECKS_PER_REQUEST):
+            get_token_claims(token, scope)
+
+    def scope_only() -> None:
+        token_claims_cache.clear()
+        scope = {}
+        for _ in range(CHECKS_PER_REQUEST):
+            get_token_claims(token, scope)
+
+    cases = {
+        "매번 jwt.decode": decode_every_time,
+        "LRU + scope 재사용": cached,
+        "scope 재사용만 (LRU 미스)": scope_only,
+    }
+
+    for name, case in cases.items():
+        case()
+        elapsed = timeit.timeit(case, number=args.number)
+        print(f"{name:<28} {elapsed / args.number * 1_000_000:8.1f} us/요청")
+    print(f"\nLRU 통계: {token_claims_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+비밀번호 해싱 비용 보정
+
+현재 서버에서 해싱 시간을 측정해 목표 시간(PASSWORD_HASH_BUDGET_MS) 안에서 가장 높은
+비용을 고르고 설정 값(환경 변수)으로 출력합니다. 운영 서버와 같은 사양에서 실행하세요.
+비용을 바꿔 배포하면 기존 해시는 그대로 검증되고, 사용자가 로그인할 때 새 비용으로
+다시 해싱되어 저장됩니다.
+
+- bcrypt: 비용(rounds)을 1씩 올리며 측정 (1 올릴 때마다 시간이 약 2배)
+- argon2: 메모리/병렬도를 고정하고 time_cost를 1씩 올리며 측정 (argon2-cffi 필요)
+
+실행:
+    python scripts/calibrate_password_hash.py [--scheme bcrypt] [--budget-ms 250] [--env-file .env]
+"""
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+from typing import Callable, Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ENV", "development")
+
+from passlib.hash import argon2, bcrypt
+
+from app.core.config import settings
+
+# 보안상 허용하는 최소 비용 (목표 시간을 넘더라도 이보다 낮추지 않음)
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 20
+MIN_ARGON2_TIME_COST = 2
+MAX_ARGON2_TIME_COST = 20
+
+
+def measure_ms(hash_func: Callable[[str], str], samples: int) -> float:
+    """해싱 1회 시간 중앙값 (밀리초)"""
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hash_func("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt(budget_ms: float, samples: int) -> Dict[str, int]:
+    """목표 시간 안에서 가장 높은 bcrypt 비용"""
+    chosen = MIN_BCRYPT_ROUNDS
+    for rounds in range(MIN_BCRYPT_ROUNDS, MAX_BCRYPT_ROUNDS + 1):
+        elapsed = measure_ms(bcrypt.using(rounds=rounds).hash, samples)
+        print(f"bcrypt rounds={rounds:<3} {elapsed:8.1f} ms")
+        if elapsed > budget_ms:
+            break
+        chosen = rounds
+    return {"PASSWORD_BCRYPT_ROUNDS": chosen}
+
+
+def calibrate_argon2(
+    budget_ms: float, samples: int, memory_cost: int, parallelism: int
+) -> Dict[str, int]:
+    """메모리/병렬도를 고정하고 목표 시간 안에서 가장 높은 argon2 time_cost"""
+    chosen = MIN_ARGON2_TIME_COST
+    for time_cost in range(MIN_ARGON2_TIME_COST, MAX_ARGON2_TIME_COST + 1):
+        handler = argon2.using(
+            time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+        )
+        elapsed = measure_ms(handler.hash, samples)
+        print(f"argon2 time_cost={time_cost:<3} memory={memory_cost}KiB {elapsed:8.1f} ms")
+        if elapsed > budget_ms:
+            break
+        chosen = time_cost
+    return {
+        "PASSWORD_ARGON2_TIME_COST": chosen,
+        "PASSWORD_ARGON2_MEMORY_COST": memory_cost,
+        "PASSWORD_ARGON2_PARALLELISM": parallelism,
+    }
+
+
+def write_env_file(path: str, values: Dict[str, object]) -> None:
+    """환경 변수 파일의 기존 값을 바꾸고 없는 값은 추가"""
+    lines = []
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    for key, value in values.items():
+        pattern = re.compile(rf"^\s*{key}\s*=")
+        line = f"{key}={value}"
+        for index, existing in enumerate(lines):
+            if pattern.match(existing):
+                lines[index] = line
+                break
+        else:
+            lines.append(line)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="비밀번호 해싱 비용 보정")
+    parser.add_argument("--scheme", choices=("bcrypt", "argon2"), default=settings.PASSWORD_HASH_SCHEME)
+    parser.add_argument("--budget-ms", type=float, default=settings.PASSWORD_HASH_BUDGET_MS, help="해싱 1회 목표 시간")
+    parser.add_argument("--samples", type=int, default=5, help="비용마다 측정할 횟수")
+    parser.add_argument("--argon2-memory-kib", type=int, default=settings.PASSWORD_ARGON2_MEMORY_COST)
+    parser.add_argument("--argon2-parallelism", type=int, default=settings.PASSWORD_ARGON2_PARALLELISM)
+    parser.add_argument("--env-file", default=None, help="결과를 기록할 환경 변수 파일 (미지정 시 출력만)")
+    args = parser.parse_args()
+
+    values: Dict[str, object]
+    if args.scheme == "argon2":
+        if not argon2.has_backend():
+            sys.exit("argon2를 사용하려면 argon2-cffi 패키지를 설치하세요")
+        values = calibrate_argon2(
+            args.budget_ms, args.samples, args.argon2_memory_kib, args.argon2_parallelism
+        )
+    else:
+        values = calibrate_bcrypt(args.budget_ms, args.samples)
+    values = {"PASSWORD_HASH_SCHEME": args.scheme, **values}
+
+    print()
+    for key, value in values.items():
+        print(f"{key}={value}")
+
+    env_file: Optional[str] = args.env_file
+    if env_file:
+        write_env_file(env_file, values)
+        print(f"\n{env_file}에 기록했습니다. 재시작 후 사용자가 로그인하면 새 설정으로 다시 해싱됩니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+
+# 앱을 가져오기 전에 테스트 설정과 임시 SQLite 데이터베이스를 지정
+_DB_DIR = tempfile.mkdtemp(prefix="fastapi-template-tests-")
+os.environ["ENV"] = "test"
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/test.db"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cache import token_revocations
+from app.core.database.session import Base, SessionLocal, engine
+from app.main import app
+from app.users.repositories import user_repository
+
+PASSWORD = "password"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema():
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def clean_tables(monkeypatch):
+    # SQLite는 비운 테이블의 ID를 다시 쓰므로 이전 테스트의 토큰 폐기 기록도 테스트마다 비움
+    monkeypatch.setattr(token_revocations, "_jtis", {})
+    monkeypatch.setattr(token_revocations, "_users", {})
+    yield
+    with SessionLocal() as db:
+        for table in reversed(Base.metadata.sorted_tables):
+            db.execute(table.delete())
+        db.commit()
+
+
+@pytest.fixture
+def db():
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def users(db):
+    """관리자 한 명과 일반 사용자 두 명 (일반 사용자 한 명은 이름 없음)"""
+    return user_repository.create_many(
+        db,
+        objs_in=[
+            {"email": "admin@example.com", "username": "admin", "password": PASSWORD,
+             "full_name": "Admin", "is_superuser": True},
+            {"email": "alice@example.com", "username": "alice", "password": PASSWORD,
+             "full_name": "Alice"},
+            {"email": "bob@example.com", "username": "bob", "password": PASSWORD},
+        ],
+        commit=True,
+    )
+
+
+def login(client: TestClient, email: str) -> dict:
+    """로그인해 받은 토큰으로 Authorization 헤더 생성"""
+    response = client.post("/api/v1/auth/login", data={"username": email, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
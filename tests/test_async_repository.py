@@ -0,0 +1,137 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.cache import EntityCache, LocalTTLCache
+from app.core.database.session import Base
+from app.core.repositories.async_base import AsyncBaseRepository
+from app.users.models.user import User
+
+
+def _row(name, full_name=None):
+    return {
+        "email": f"{name}@example.com",
+        "username": name,
+        "hashed_password": "hashed",
+        "full_name": full_name,
+    }
+
+
+def _run(tmp_path, scenario, cache=None):
+    """aiosqlite 데이터베이스에서 비동기 저장소로 시나리오 실행"""
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            sessions = async_sessionmaker(engine, expire_on_commit=False)
+            async with sessions() as db:
+                return await scenario(db, AsyncBaseRepository(User, cache=cache))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_create_many_and_get(tmp_path):
+    """create_many는 입력 순서대로 반환하고 get은 객체 또는 일부 필드를 조회"""
+    async def scenario(db, repository):
+        created = await repository.create_many(db, objs_in=[_row("carol"), _row("alice"), _row("bob")])
+        assert [user.username for user in created] == ["carol", "alice", "bob"]
+
+        user = await repository.get(db, created[1].id)
+        assert user.email == "alice@example.com"
+        assert await repository.get(db, created[2].id, fields=["username"]) == {
+            "id": created[2].id,
+            "username": "bob",
+        }
+        assert await repository.get(db, 999) is None
+
+    _run(tmp_path, scenario)
+
+
+def test_get_multi_keyset_walks_all_pages(tmp_path):
+    """get_multi_keyset 커서를 따라가면 모든 항목을 정렬 순서대로 한 번씩 조회"""
+    names = ["erin", "bob", "dave", "alice", "carol"]
+
+    async def scenario(db, repository):
+        await repository.create_many(db, objs_in=[_row(name) for name in names])
+        seen, cursor = [], None
+        while True:
+            page, cursor = await repository.get_multi_keyset(
+                db, cursor=cursor, limit=2, order_by="-username"
+            )
+            seen.extend(user.username for user in page)
+            if cursor is None:
+                return seen
+
+    assert _run(tmp_path, scenario) == sorted(names, reverse=True)
+
+
+def test_upsert_many_updates_only_selected_fields(tmp_path):
+    """upsert_many는 충돌한 행의 update_fields만 갱신하고 새 행은 생성"""
+    async def scenario(db, repository):
+        (existing,) = await repository.create_many(db, objs_in=[_row("alice")])
+        renamed = dict(_row("alice", "Alice"), username="alice2")
+        upserted = await repository.upsert_many(
+            db,
+            objs_in=[renamed, _row("bob", "Bob")],
+            conflict_fields=("email",),
+            update_fields=("full_name",),
+        )
+        by_email = {user.email: user for user in upserted}
+        assert by_email["alice@example.com"].id == existing.id
+        assert by_email["alice@example.com"].username == "alice"
+        assert by_email["alice@example.com"].full_name == "Alice"
+        assert by_email["bob@example.com"].full_name == "Bob"
+        assert await repository.get_count(db) == 2
+
+    _run(tmp_path, scenario)
+
+
+def test_update_by_id_and_remove(tmp_path):
+    """update_by_id는 where 조건이 맞을 때만 갱신하고 remove는 삭제한 항목을 반환"""
+    async def scenario(db, repository):
+        (user,) = await repository.create_many(db, objs_in=[_row("alice")])
+
+        assert await repository.update_by_id(
+            db, id=user.id, obj_in={"full_name": "Nope"}, where={"is_active": False}
+        ) is None
+        updated = await repository.update_by_id(db, id=user.id, obj_in={"full_name": "Alice"})
+        assert updated.full_name == "Alice"
+
+        removed = await repository.remove(db, id=user.id)
+        assert removed.id == user.id
+        assert await repository.get(db, user.id) is None
+        assert await repository.remove(db, id=user.id) is None
+
+    _run(tmp_path, scenario)
+
+
+def test_cache_is_invalidated_on_write(tmp_path):
+    """조회는 캐시에서 제공하고, 쓰기 후에는 커밋 전에 다시 채워진 값까지 무효화"""
+    cache = EntityCache("async_users", local=LocalTTLCache(maxsize=100, ttl=60))
+
+    async def scenario(db, repository):
+        (user,) = await repository.create_many(db, objs_in=[_row("alice", "Alice")], commit=True)
+        user_id = user.id
+
+        await repository.get(db, user_id)
+        db.expunge_all()
+        cached = await repository.get(db, user_id)
+        assert cache.local_hits == 1
+        assert cached.full_name == "Alice"
+
+        # 갱신은 flush만 하고, 커밋 전에 다른 요청이 이전 값을 다시 캐시에 넣은 경우
+        await repository.update_by_id(db, id=user_id, obj_in={"full_name": "Alicia"})
+        assert cache.get(user_id) is None
+        cache.set(user_id, {"id": user_id, "full_name": "Alice"})
+        await db.commit()
+        assert cache.get(user_id) is None
+        assert (await repository.get(db, user_id)).full_name == "Alicia"
+
+        await repository.remove(db, id=user_id, commit=True)
+        assert cache.get(user_id) is None
+        assert await repository.get(db, user_id) is None
+
+    _run(tmp_path, scenario, cache=cache)
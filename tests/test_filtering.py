@@ -0,0 +1,74 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.routers.base import BaseRouter
+from app.core.utils.filtering import FilterOp, parse_query_spec
+from app.users.schemas.user import User as UserSchema, UserCreate, UserUpdate
+from app.users.services import user_service
+
+
+@pytest.fixture
+def generic_client():
+    """BaseRouter로 만든 사용자 목록 API (filter_fields/sort_fields는 UserRepository 설정)"""
+    app = FastAPI()
+    app.include_router(
+        BaseRouter(user_service, UserSchema, UserCreate, UserUpdate, "/users", ["users"]).router
+    )
+    with TestClient(app) as client:
+        yield client
+
+
+def test_parse_query_spec_accepts_whitelisted_fields():
+    spec = parse_query_spec(
+        ["email:in:a@example.com,b@example.com", "username:prefix:al"],
+        "-username",
+        filter_fields=["email", "username"],
+        sort_fields=["username"],
+    )
+    assert [(c.field, c.op) for c in spec.filters] == [
+        ("email", FilterOp.IN),
+        ("username", FilterOp.PREFIX),
+    ]
+    assert spec.filters[0].value == ["a@example.com", "b@example.com"]
+    assert spec.order == [("username", True)]
+
+
+@pytest.mark.parametrize(
+    "filters, sort",
+    [
+        (["hashed_password:prefix:$2b"], None),
+        (["is_superuser:eq:true"], None),
+        (["email:like:a"], None),
+        (["email"], None),
+        (None, "hashed_password"),
+        (None, "username,-username"),
+    ],
+)
+def test_parse_query_spec_rejects_fields_outside_whitelist(filters, sort):
+    with pytest.raises(ValueError):
+        parse_query_spec(filters, sort, filter_fields=["email", "username"], sort_fields=["username"])
+
+
+def test_list_endpoint_filters_and_sorts_in_database(generic_client, users):
+    response = generic_client.get(
+        "/users/",
+        params=[("filter", "username:in:alice,bob"), ("sort", "-username")],
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [item["username"] for item in body["items"]] == ["bob", "alice"]
+    assert body["total"] == 2
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"filter": "hashed_password:prefix:$2b"},
+        {"filter": "is_superuser:eq:true"},
+        {"sort": "full_name"},
+    ],
+)
+def test_list_endpoint_rejects_fields_outside_whitelist(generic_client, users, params):
+    response = generic_client.get("/users/", params=params)
+    assert response.status_code == 400
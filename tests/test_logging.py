@@ -0,0 +1,29 @@
+import logging
+
+from fastapi.testclient import TestClient
+
+from app.core.observability import logs
+from app.main import app
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def test_logging_restarts_on_second_lifespan(monkeypatch):
+    with TestClient(app):
+        pass
+    assert logs._listener is None
+
+    capture = _Capture()
+    monkeypatch.setattr(logs, "_output_handlers", (capture,))
+    with TestClient(app):
+        logging.getLogger("tests.logging").warning("second lifespan")
+    # 종료 이벤트에서 큐에 남은 기록까지 출력한 뒤 출력 스레드를 멈춤
+    assert "second lifespan" in capture.messages
+    assert logs._listener is None
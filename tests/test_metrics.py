@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+
+from app.core.config import settings
+from app.core.observability.metrics import MetricsExporter, MetricsRegistry
+
+
+def test_metrics_requires_token_or_allowed_ip(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-token")
+    # TestClient의 클라이언트 주소("testclient")는 허용 목록에 속하지 않음
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 403
+
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+    assert response.status_code == 200
+    assert "http_requests_total" in response.text
+
+
+def test_metrics_allowed_ips(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+    monkeypatch.setattr(settings, "METRICS_ALLOWED_IPS", "10.0.0.0/8")
+    assert client.get("/metrics").status_code == 403
+
+    from app.core.observability import metrics_access_allowed
+    assert metrics_access_allowed(None, "10.1.2.3")
+    assert not metrics_access_allowed(None, "192.168.0.1")
+
+
+def test_metrics_disabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-token")
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+    assert response.status_code == 404
+
+
+def test_exporter_removes_stale_snapshots(tmp_path):
+    # 이미 종료된 프로세스가 이전 실행에서 남긴 파일
+    dead = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True)
+    stale = tmp_path / f"metrics_{int(dead.stdout)}.json"
+    stale.write_text(json.dumps([]))
+    os.utime(stale, (0, 0))
+    leftover = tmp_path / f"metrics_{int(dead.stdout)}.json.tmp"
+    leftover.write_text("")
+    os.utime(leftover, (0, 0))
+    own = tmp_path / f"metrics_{os.getpid()}.json"
+    own.write_text(json.dumps([]))
+    # 현재 실행 중에 종료된 워커의 파일 (카운터 합계가 줄지 않도록 유지)
+    recent = tmp_path / "metrics_999999999.json"
+    recent.write_text(json.dumps([]))
+
+    exporter = MetricsExporter(MetricsRegistry(), str(tmp_path), interval=60)
+    assert exporter.remove_stale() == 2
+    assert not stale.exists() and not leftover.exists()
+    assert own.exists() and recent.exists()
@@ -0,0 +1,89 @@
+import pytest
+
+from app.core.utils.filtering import QuerySpec
+from app.core.utils.pagination import build_next_cursor, decode_cursor, encode_cursor, parse_order_by
+from app.users.repositories import user_repository
+
+
+@pytest.fixture
+def many_users(db):
+    """이름이 있는 사용자 5명과 이름이 없는(NULL) 사용자 3명"""
+    names = ["Eve", "Bob", None, "Dan", None, "Amy", "Cid", None]
+    return user_repository.create_many(
+        db,
+        objs_in=[
+            {"email": f"user{index}@example.com", "username": f"user{index}",
+             "password": "password", "full_name": name}
+            for index, name in enumerate(names)
+        ],
+        commit=True,
+    )
+
+
+def _walk(db, order_by, limit):
+    """첫 페이지부터 next_cursor를 따라가며 모든 페이지 조회"""
+    pages, cursor = [], None
+    while True:
+        items, cursor = user_repository.get_multi_keyset(
+            db, cursor=cursor, limit=limit, order_by=order_by
+        )
+        pages.append([user.id for user in items])
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 8])
+def test_keyset_pages_cover_every_row_once(db, many_users, limit):
+    pages = _walk(db, "id", limit)
+    ids = [id for page in pages for id in page]
+    assert ids == sorted(user.id for user in many_users)
+    assert all(len(page) <= limit for page in pages)
+
+
+@pytest.mark.parametrize("order_by", ["full_name", "-full_name"])
+@pytest.mark.parametrize("limit", [1, 2, 3])
+def test_keyset_keeps_null_sort_keys_last(db, many_users, order_by, limit):
+    """정렬 키가 NULL인 행도 빠짐없이 마지막에 ID 순으로 조회 (NULLS LAST)"""
+    ids = [id for page in _walk(db, order_by, limit) for id in page]
+
+    named = sorted(
+        (user for user in many_users if user.full_name is not None),
+        key=lambda user: (user.full_name, user.id),
+        reverse=order_by.startswith("-"),
+    )
+    nulls = sorted(
+        (user.id for user in many_users if user.full_name is None),
+        reverse=order_by.startswith("-"),
+    )
+    assert ids == [user.id for user in named] + nulls
+
+
+@pytest.mark.parametrize("order_by", ["full_name", "-full_name"])
+@pytest.mark.parametrize("limit", [1, 2, 3, 5])
+def test_offset_first_page_continues_with_cursor(db, many_users, order_by, limit):
+    """BaseRouter처럼 첫 페이지는 OFFSET으로, 이후는 커서로 조회해도 중복/누락 없음"""
+    spec = QuerySpec(order=[parse_order_by(order_by)])
+    first = user_repository.get_multi(db, skip=0, limit=limit + 1, spec=spec)
+    has_more = len(first) > limit
+    first = first[:limit]
+    ids = [user.id for user in first]
+    cursor = build_next_cursor(first, order_by, limit) if has_more else None
+    while cursor is not None:
+        items, cursor = user_repository.get_multi_keyset(
+            db, cursor=cursor, limit=limit, order_by=order_by
+        )
+        ids.extend(user.id for user in items)
+
+    assert ids == [id for page in _walk(db, order_by, len(many_users)) for id in page]
+    assert sorted(ids) == sorted(user.id for user in many_users)
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("-full_name", None, 7)
+    assert decode_cursor(cursor, "-full_name") == (None, 7)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("id", 1, 1)])
+def test_cursor_rejects_invalid_or_mismatched_order(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, "email")
@@ -0,0 +1,82 @@
+import asyncio
+import importlib
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.utils import passwords
+from app.core.utils.passwords import PasswordHashPool
+from app.users.repositories import user_repository
+from tests.conftest import login
+
+# 패키지의 user_repository 속성은 저장소 인스턴스이므로 모듈은 직접 가져옴
+user_repository_module = importlib.import_module("app.users.repositories.user_repository")
+
+
+def _exit_once(marker: str) -> str:
+    """처음 호출되면 작업 프로세스를 비정상 종료시켜 프로세스 풀을 깨뜨림"""
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return "ok"
+
+
+def test_pool_recreates_broken_process_pool(tmp_path):
+    pool = PasswordHashPool(workers=1, max_pending=4)
+    marker = str(tmp_path / "crashed")
+    try:
+        assert asyncio.run(pool.run(_exit_once, marker)) == "ok"
+        assert asyncio.run(pool.run(os.getpid)) != os.getpid()
+    finally:
+        pool.shutdown()
+
+
+def test_map_recreates_broken_process_pool(tmp_path):
+    pool = PasswordHashPool(workers=2, max_pending=4)
+    marker = str(tmp_path / "crashed")
+    try:
+        assert pool.map(_exit_once, [marker, marker]) == ["ok", "ok"]
+    finally:
+        pool.shutdown()
+
+
+def test_create_and_update_hash_in_pool(client, db, users, monkeypatch):
+    # 요청 경로에서는 동기 해싱(get_password_hash)을 호출하지 않고 해싱 풀만 사용
+    def fail(password):
+        raise AssertionError("요청 경로에서 동기 해싱이 호출됨")
+
+    hashed = []
+    original_run = passwords.password_hash_pool.run
+
+    async def run(func, *args):
+        hashed.append(func.__name__)
+        return await original_run(func, *args)
+
+    headers = login(client, "admin@example.com")
+    monkeypatch.setattr(user_repository_module, "get_password_hash", fail)
+    monkeypatch.setattr(passwords.password_hash_pool, "run", run)
+
+    response = client.post(
+        "/api/v1/users/",
+        json={"email": "carol@example.com", "username": "carol", "password": "secret123"},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    user_id = response.json()["id"]
+    response = client.put(f"/api/v1/users/{user_id}", json={"password": "changed123"}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert hashed == ["get_password_hash", "get_password_hash"]
+
+    db.expire_all()
+    assert user_repository.authenticate(db, email="carol@example.com", password="changed123")
+
+
+def test_create_validates_dicts_with_hashed_password(db):
+    # 해싱된 비밀번호를 넣은 딕셔너리도 생성 스키마 검증을 거침 (검증 없이 컬럼을 쓰지 못함)
+    with pytest.raises(ValidationError):
+        user_repository.create(
+            db,
+            obj_in={"email": "eve@example.com", "username": "eve", "hashed_password": "x",
+                    "is_superuser": True},
+        )
@@ -0,0 +1,50 @@
+from app.core.database.instrumentation import assert_max_queries, track_queries
+
+from tests.conftest import login
+
+
+def test_user_list_query_budget(client, users):
+    """사용자 목록은 사용자 수와 관계없이 인증 조회 + 목록 조회 두 번"""
+    headers = login(client, "admin@example.com")
+    with assert_max_queries(2):
+        response = client.get("/api/v1/users/", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == len(users)
+
+
+def test_read_user_me_query_budget(client, users):
+    """/users/me는 인증 조회 + 사용자 조회 두 번 (테스트 설정은 인증 주체 캐시를 끔)"""
+    headers = login(client, "alice@example.com")
+    with assert_max_queries(2):
+        response = client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == "alice@example.com"
+
+
+def test_assert_max_queries_reports_statements(db, users):
+    """허용 수를 넘으면 실행한 SQL 목록과 함께 실패"""
+    from app.users.repositories import user_repository
+
+    try:
+        with assert_max_queries(1):
+            user_repository.get_by_email(db, "alice@example.com")
+            user_repository.get_by_email(db, "bob@example.com")
+    except AssertionError as e:
+        assert "SQL 2개 실행 (허용: 1개)" in str(e)
+    else:
+        raise AssertionError("assert_max_queries가 실패하지 않았습니다")
+
+
+def test_repeated_statement_flagged_as_n_plus_one(db, users, monkeypatch):
+    """같은 문장을 DB_N_PLUS_ONE_THRESHOLD번 실행하면 N+1 의심으로 기록"""
+    from app.core.config import settings
+    from app.users.repositories import user_repository
+
+    monkeypatch.setattr(settings, "DB_N_PLUS_ONE_THRESHOLD", 3)
+    with track_queries() as stats:
+        for user in users:
+            user_repository.get(db, user.id)
+    suspects = stats.n_plus_one_suspects
+    assert len(suspects) == 1
+    assert suspects[0]["count"] == 3
+    assert "FROM users" in suspects[0]["sql"]
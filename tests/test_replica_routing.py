@@ -0,0 +1,113 @@
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database.routing import RoutingSession, use_primary
+from app.core.middlewares.replica_middleware import PRIMARY_PIN_COOKIE, ReadYourWritesMiddleware
+
+metadata = MetaData()
+notes = Table(
+    "notes",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("source", String(20), nullable=False),
+)
+
+
+@pytest.fixture
+def engines(tmp_path):
+    """주 데이터베이스와 읽기 복제본 역할의 SQLite 파일 두 개 (어느 쪽에서 읽었는지 source로 구분)"""
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for engine, source in ((primary, "primary"), (replica, "replica")):
+        metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(insert(notes), {"source": source})
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+@pytest.fixture
+def replica_client(engines):
+    primary, replica = engines
+    session_factory = sessionmaker(
+        class_=RoutingSession, bind=primary, primary=primary, replicas=[replica]
+    )
+
+    def get_session():
+        db = session_factory()
+        try:
+            yield db
+            db.commit()
+        finally:
+            db.close()
+
+    def read_source(db) -> str:
+        return db.execute(select(notes.c.source).order_by(notes.c.id)).scalars().first()
+
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    @app.get("/notes/source")
+    def get_source(db=Depends(get_session)):
+        return {"source": read_source(db)}
+
+    @app.post("/notes")
+    def create_note(db=Depends(get_session)):
+        db.execute(insert(notes), {"source": "written"})
+        return {"source": read_source(db)}
+
+    @app.get("/notes/primary-source")
+    def get_primary_source(db=Depends(get_session)):
+        with use_primary():
+            return {"source": read_source(db)}
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_reads_go_to_replica_without_writes(replica_client):
+    response = replica_client.get("/notes/source")
+    assert response.json() == {"source": "replica"}
+    assert PRIMARY_PIN_COOKIE not in response.cookies
+
+
+def test_reads_after_write_in_same_request_use_primary(replica_client):
+    response = replica_client.post("/notes")
+    assert response.json() == {"source": "primary"}
+
+
+def test_write_pins_next_requests_to_primary(replica_client, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "DB_REPLICA_STICKY_SECONDS", 5)
+    response = replica_client.post("/notes")
+    set_cookie = response.headers["set-cookie"]
+    assert set_cookie.startswith(f"{PRIMARY_PIN_COOKIE}=")
+    assert "HttpOnly" in set_cookie and "Max-Age=5" in set_cookie
+
+    # TestClient가 쿠키를 보관하므로 다음 요청도 주 데이터베이스에서 읽음
+    assert replica_client.get("/notes/source").json() == {"source": "primary"}
+
+    replica_client.cookies.clear()
+    assert replica_client.get("/notes/source").json() == {"source": "replica"}
+
+
+def test_no_pin_cookie_when_sticky_window_disabled(replica_client, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "DB_REPLICA_STICKY_SECONDS", 0)
+    response = replica_client.post("/notes")
+    assert "set-cookie" not in response.headers
+
+
+def test_expired_pin_cookie_reads_replica(replica_client):
+    replica_client.cookies.set(PRIMARY_PIN_COOKIE, "0")
+    assert replica_client.get("/notes/source").json() == {"source": "replica"}
+
+
+def test_use_primary_forces_primary_read(replica_client):
+    assert replica_client.get("/notes/primary-source").json() == {"source": "primary"}
@@ -0,0 +1,47 @@
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.core.database import search
+from app.core.database.session import engine
+from app.users.models.user import User
+from app.users.repositories import user_repository
+from tests.conftest import login
+
+
+def test_search_uses_fts_table(db, users):
+    assert search.has_fts_table(db, "users")
+    assert [user.username for user in user_repository.search(db, "lic")] == ["alice"]
+
+
+def test_search_condition_accepts_engine(db, users):
+    condition = user_repository.search_condition(engine, "alice")
+    assert "users_fts" in str(condition)
+    assert [user.username for user in db.scalars(select(User).where(condition))] == ["alice"]
+
+
+def test_old_sqlite_falls_back_to_like(tmp_path, monkeypatch):
+    # trigram 토크나이저가 없는 SQLite(3.34 미만)에서는 FTS 테이블 없이 LIKE로 검색
+    monkeypatch.setattr(search, "SQLITE_TRIGRAM_MIN_VERSION", (99, 0, 0))
+    old_engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    User.__table__.create(old_engine)
+    try:
+        with Session(old_engine) as db:
+            assert not search.has_fts_table(db, "users")
+            user_repository.create(
+                db, obj_in={"email": "alice@example.com", "username": "alice", "password": "password"}
+            )
+            db.commit()
+            assert "users_fts" not in str(user_repository.search_condition(db, "alice"))
+            assert [user.username for user in user_repository.search(db, "lic")] == ["alice"]
+    finally:
+        old_engine.dispose()
+
+
+def test_search_endpoint_rejects_blank_term(client, users):
+    headers = login(client, "admin@example.com")
+    response = client.get("/api/v1/users/search", params={"q": "   "}, headers=headers)
+    assert response.status_code == 400
+
+    response = client.get("/api/v1/users/search", params={"q": " alice "}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert [item["username"] for item in response.json()["items"]] == ["alice"]
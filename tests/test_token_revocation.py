@@ -0,0 +1,59 @@
+import time
+
+from app.core.cache import TokenRevocationStore
+
+from tests.conftest import login
+
+
+def test_logout_revokes_only_that_token(client, users):
+    headers = login(client, "alice@example.com")
+    other_session = login(client, "alice@example.com")
+
+    assert client.post("/api/v1/auth/logout", headers=headers).status_code == 204
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 401
+    assert client.get("/api/v1/users/me", headers=other_session).status_code == 200
+
+
+def test_deactivation_revokes_every_issued_token(client, users):
+    admin = login(client, "admin@example.com")
+    headers = login(client, "alice@example.com")
+    alice = next(user for user in users if user.email == "alice@example.com")
+
+    response = client.post(f"/api/v1/admin/users/{alice.id}/deactivate", headers=admin)
+    assert response.status_code == 200
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 401
+
+    # 다시 활성화해도 비활성화 전에 발급된 토큰은 되살아나지 않음
+    response = client.post(f"/api/v1/admin/users/{alice.id}/activate", headers=admin)
+    assert response.status_code == 200
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 401
+
+
+def test_rolled_back_deactivation_does_not_revoke(client, users, db):
+    from app.users.repositories import user_repository
+
+    headers = login(client, "alice@example.com")
+    alice = next(user for user in users if user.email == "alice@example.com")
+    user_repository.update_by_id(db, id=alice.id, obj_in={"is_active": False})
+    db.rollback()
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+
+
+def test_store_checks_jti_and_issue_time_locally():
+    store = TokenRevocationStore(None, token_lifetime=60)
+    now = time.time()
+
+    store.revoke_token("jti-1", now + 60)
+    assert store.is_revoked({"jti": "jti-1", "sub": "1", "iat": now})
+    assert not store.is_revoked({"jti": "jti-2", "sub": "1", "iat": now})
+
+    store.revoke_user(1)
+    assert store.is_revoked({"jti": "jti-2", "sub": "1", "iat": int(now) - 1})
+    assert not store.is_revoked({"jti": "jti-3", "sub": "1", "iat": int(now) + 2})
+    assert not store.is_revoked({"jti": "jti-2", "sub": "2", "iat": now})
+
+
+def test_store_ignores_already_expired_tokens():
+    store = TokenRevocationStore(None, token_lifetime=60)
+    store.revoke_token("expired", time.time() - 10)
+    assert store.stats()["revoked_tokens"] == 0
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.database.session import SessionLocal, get_db
+from app.users.repositories import user_repository
+
+
+@pytest.fixture
+def commits():
+    """세션 커밋 횟수"""
+    count = {"value": 0}
+
+    def on_commit(session):
+        count["value"] += 1
+
+    event.listen(Session, "after_commit", on_commit)
+    yield count
+    event.remove(Session, "after_commit", on_commit)
+
+
+def _user(name):
+    return {"email": f"{name}@example.com", "username": name, "password": "password"}
+
+
+def _emails():
+    with SessionLocal() as db:
+        return sorted(user.email for user in user_repository.get_multi(db))
+
+
+def test_request_writes_commit_once(commits):
+    """요청 안의 여러 쓰기는 get_db가 끝날 때 한 번만 커밋"""
+    dependency = get_db()
+    db = next(dependency)
+    user = user_repository.create(db, obj_in=_user("first"))
+    user_repository.create(db, obj_in=_user("second"))
+    user_repository.update_by_id(db, id=user.id, obj_in={"full_name": "First"})
+    assert commits["value"] == 0
+
+    with pytest.raises(StopIteration):
+        next(dependency)
+    assert commits["value"] == 1
+    assert _emails() == ["first@example.com", "second@example.com"]
+
+
+def test_request_error_rolls_back_every_write(commits):
+    """요청 중 예외가 나면 앞선 쓰기도 모두 롤백"""
+    dependency = get_db()
+    db = next(dependency)
+    user_repository.create(db, obj_in=_user("first"))
+    with pytest.raises(RuntimeError):
+        dependency.throw(RuntimeError("handler failed"))
+    assert commits["value"] == 0
+    assert _emails() == []
+
+
+def test_read_only_request_skips_commit(users, commits):
+    dependency = get_db()
+    db = next(dependency)
+    user_repository.get_by_email(db, "alice@example.com")
+    with pytest.raises(StopIteration):
+        next(dependency)
+    assert commits["value"] == 0
+
+
+def test_explicit_commit_is_immediate(commits):
+    with SessionLocal() as db:
+        user_repository.create(db, obj_in=_user("now"), commit=True)
+    assert commits["value"] == 1
+    assert _emails() == ["now@example.com"]
+
+
+def test_update_user_endpoint_commits_once(client, users, commits):
+    """사용자 수정(중복 확인 + 갱신)도 요청당 한 번 커밋"""
+    from tests.conftest import login
+
+    headers = login(client, "alice@example.com")
+    commits["value"] = 0
+    response = client.put("/api/v1/users/me", headers=headers, json={"full_name": "Alice Kim"})
+    assert response.status_code == 200, response.text
+    assert response.json()["full_name"] == "Alice Kim"
+    assert commits["value"] == 1